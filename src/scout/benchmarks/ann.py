@@ -0,0 +1,72 @@
+# scout/benchmarks/ann.py
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from time import perf_counter
+
+from scout.benchmarks.champions import TradeoffPoint
+from scout.benchmarks.metrics import latency_percentiles
+from scout.index.vectors import ann_index, nearest
+from scout.search.dense import DenseRetriever
+from scout.search.engine import SearchEngine
+
+
+def ann_tradeoff(
+    engine: SearchEngine,
+    queries: Iterable[str],
+    retriever: DenseRetriever,
+    *,
+    k: int = 10,
+    n_probes: Sequence[int] = (1, 4, 16),
+    repeats: int = 3,
+) -> list[TradeoffPoint]:
+    """
+    Compare IVF search with brute-force search over `retriever`'s field.
+
+    Exact nearest neighbours are the ground truth. For each `n_probes`
+    value, recall is the mean overlap of the IVF top k with the exact
+    top k, and exact_rate the share of queries where they are identical.
+    """
+    column = engine.index.columns.vector(retriever.field)
+    if column is None:
+        raise ValueError(f"No vector field named {retriever.field!r}")
+    vectors = [retriever.embed_query(q) for q in queries]
+
+    truth: list[set[int]] = []
+    latencies: list[float] = []
+    for vector in vectors:
+        for _ in range(repeats):
+            start = perf_counter()
+            ordinals, _ = nearest(column, vector, k, exact=True)
+            latencies.append((perf_counter() - start) * 1000.0)
+        truth.append(set(ordinals.tolist()))
+    points = [TradeoffPoint("exact", 1.0, 1.0, latency_percentiles(latencies or [0.0]))]
+
+    # Training is index state, not query cost.
+    if ann_index(column) is None:
+        return points
+
+    for n_probe in n_probes:
+        latencies = []
+        recalls: list[float] = []
+        identical = 0
+        for vector, expected in zip(vectors, truth, strict=True):
+            for _ in range(repeats):
+                start = perf_counter()
+                ordinals, _ = nearest(column, vector, k, n_probe=n_probe)
+                latencies.append((perf_counter() - start) * 1000.0)
+            found = set(ordinals.tolist())
+            recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+            identical += found == expected
+
+        points.append(
+            TradeoffPoint(
+                f"ivf@{n_probe}",
+                sum(recalls) / len(recalls) if recalls else 1.0,
+                identical / len(vectors) if vectors else 1.0,
+                latency_percentiles(latencies or [0.0]),
+            )
+        )
+
+    return points
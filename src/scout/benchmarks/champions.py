@@ -0,0 +1,98 @@
+# scout/benchmarks/champions.py
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from time import perf_counter
+
+from scout.benchmarks.metrics import latency_percentiles
+from scout.index.impact import impact_index
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.query import parse_query
+
+
+@dataclass(frozen=True)
+class TradeoffPoint:
+    """Recall against an exhaustive baseline and latency for one retrieval mode."""
+
+    mode: str
+    recall: float
+    exact_rate: float
+    latency_ms: dict[int, float]
+
+
+def champion_tradeoff(
+    engine: SearchEngine,
+    queries: Iterable[str],
+    *,
+    k: int = 10,
+    depths: Sequence[int] = (16, 64, 256),
+    repeats: int = 3,
+) -> list[TradeoffPoint]:
+    """
+    Compare champion-list retrieval with exhaustive BM25 scoring.
+
+    The engine must rank with BM25Ranking; its results are the ground
+    truth. For each champion depth two modes are measured: approximate
+    (stop after the first pass) and exact (deepen until the bound
+    proves the top k). Recall is the mean overlap with the exhaustive
+    top k.
+    """
+    ranking = engine._ranking
+    if not isinstance(ranking, BM25Ranking):
+        raise ValueError("champion_tradeoff needs an engine ranked with BM25Ranking")
+
+    queries = list(queries)
+    impacts = impact_index(engine.index, k1=ranking.k1, b=ranking.b)
+    parsed = [parse_query(q) for q in queries]
+    tokens = [
+        [t for t in p.required | p.optional if t not in engine.stopwords] for p in parsed
+    ]
+
+    truth: list[set[int]] = []
+    latencies: list[float] = []
+    for query in queries:
+        for _ in range(repeats):
+            start = perf_counter()
+            hits = engine.search(query, limit=k)
+            latencies.append((perf_counter() - start) * 1000.0)
+        truth.append({doc_id for doc_id, _ in hits})
+    points = [TradeoffPoint("exhaustive", 1.0, 1.0, latency_percentiles(latencies))]
+
+    # Impact lists are precomputed state; build them outside the timings.
+    for query_tokens in tokens:
+        for token in query_tokens:
+            impacts.postings(token)
+
+    for depth in depths:
+        for exact in (False, True):
+            latencies = []
+            recalls: list[float] = []
+            proven = 0
+            for query_tokens, p, expected in zip(tokens, parsed, truth, strict=True):
+                for _ in range(repeats):
+                    start = perf_counter()
+                    result = impacts.top_k(
+                        query_tokens,
+                        k,
+                        require_all=not p.has_or,
+                        champions=depth,
+                        exact=exact,
+                    )
+                    latencies.append((perf_counter() - start) * 1000.0)
+                found = {doc_id for doc_id, _ in result.hits}
+                recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+                proven += result.exact
+
+            points.append(
+                TradeoffPoint(
+                    f"champions@{depth}" + ("+exact" if exact else ""),
+                    sum(recalls) / len(recalls) if recalls else 1.0,
+                    proven / len(queries) if queries else 1.0,
+                    latency_percentiles(latencies or [0.0]),
+                )
+            )
+
+    return points
@@ -0,0 +1,114 @@
+# scout/benchmarks/loadgen.py
+from __future__ import annotations
+
+import http.client
+import itertools
+import socket
+import threading
+from dataclasses import dataclass
+from time import perf_counter
+from urllib.parse import quote, urlsplit
+
+from scout.benchmarks.metrics import latency_percentiles
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    requests: int
+    ok: int
+    overloaded: int
+    errors: int
+    duration_s: float
+    latency_ms: dict[int, float]
+
+    @property
+    def throughput_rps(self) -> float:
+        return self.requests / self.duration_s if self.duration_s > 0 else 0.0
+
+
+def run_load(
+    *,
+    target: str,
+    queries: list[str],
+    requests: int = 1000,
+    concurrency: int = 8,
+    limit: int = 10,
+    timeout: float = 10.0,
+) -> LoadReport:
+    """
+    Closed-loop load generator for `scout serve`.
+
+    `target` is an http://host:port URL or a unix:/path/to/socket address.
+    Each of `concurrency` clients keeps one keep-alive connection and sends
+    queries round-robin until `requests` have been issued in total.
+    """
+    if not queries:
+        raise ValueError("At least one query is required")
+
+    def connect() -> http.client.HTTPConnection:
+        if target.startswith("unix:"):
+            return _UnixHTTPConnection(target[len("unix:") :], timeout)
+        url = urlsplit(target)
+        return http.client.HTTPConnection(url.hostname or "127.0.0.1", url.port, timeout=timeout)
+
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies: list[float] = []
+    counts = {"ok": 0, "overloaded": 0, "errors": 0}
+
+    def client() -> None:
+        conn = connect()
+        while True:
+            n = next(counter)
+            if n >= requests:
+                break
+            path = f"/search?q={quote(queries[n % len(queries)])}&limit={limit}"
+            start = perf_counter()
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = connect()
+                status = -1
+            elapsed = (perf_counter() - start) * 1000.0
+
+            with lock:
+                latencies.append(elapsed)
+                if status == 200:
+                    counts["ok"] += 1
+                elif status == 503:
+                    counts["overloaded"] += 1
+                else:
+                    counts["errors"] += 1
+        conn.close()
+
+    started = perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duration = perf_counter() - started
+
+    return LoadReport(
+        requests=len(latencies),
+        ok=counts["ok"],
+        overloaded=counts["overloaded"],
+        errors=counts["errors"],
+        duration_s=duration,
+        latency_ms=latency_percentiles(latencies) if latencies else {},
+    )
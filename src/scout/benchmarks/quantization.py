@@ -0,0 +1,99 @@
+# scout/benchmarks/quantization.py
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from time import perf_counter
+
+from scout.benchmarks.regression import RegressionReport, compare_benchmarks
+from scout.benchmarks.run import BenchmarkQuery, BenchmarkResult
+from scout.benchmarks.thresholds import RegressionThresholds
+from scout.index.frozen import FrozenIndex, ImpactDtype
+from scout.ranking.base import RankingStrategy
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.quantized import QuantizedBM25Ranking
+from scout.search.engine import SearchEngine
+
+
+@dataclass(frozen=True)
+class QuantizationReport:
+    dtype: str
+    # Quantized vs exact BM25 on the queries' relevance judgments.
+    regression: RegressionReport
+    # Mean overlap of the quantized top k with the exact top k.
+    agreement: float
+    exact_latency_ms: float
+    quantized_latency_ms: float
+
+
+def _run(engine: SearchEngine, queries: Sequence[BenchmarkQuery], k: int) -> list[BenchmarkResult]:
+    results = []
+    for q in queries:
+        start = perf_counter()
+        hits = engine.search(q.query, limit=k)
+        results.append(
+            BenchmarkResult(
+                query=q.query,
+                retrieved=[str(doc_id) for doc_id, _ in hits],
+                latency_ms=(perf_counter() - start) * 1000.0,
+            )
+        )
+    return results
+
+
+def quantization_regression(
+    engine: SearchEngine,
+    queries: Sequence[BenchmarkQuery],
+    *,
+    k: int = 10,
+    dtype: ImpactDtype = "uint8",
+    thresholds: RegressionThresholds | None = None,
+) -> QuantizationReport:
+    """
+    Measure what quantizing BM25 impacts costs in ranking quality.
+
+    Both sides search a frozen copy of `engine.index`: one with exact
+    BM25Ranking, one with QuantizedBM25Ranking over `dtype` impacts.
+    The relevance metrics go through compare_benchmarks with exact
+    scoring as the baseline.
+    """
+    ranking = engine._ranking
+    k1, b = (ranking.k1, ranking.b) if isinstance(ranking, BM25Ranking) else (1.5, 0.75)
+
+    def frozen_engine(index: FrozenIndex, ranking: RankingStrategy) -> SearchEngine:
+        return SearchEngine(
+            index=index,  # type: ignore[arg-type]
+            ranking=ranking,
+            tokenizer=engine._tokenizer,
+            stopwords=engine.stopwords,
+            max_df_ratio=engine.max_df_ratio,
+        )
+
+    exact = frozen_engine(FrozenIndex.from_index(engine.index), BM25Ranking(k1=k1, b=b))
+    quantized = frozen_engine(
+        FrozenIndex.from_index(engine.index, impacts=dtype, k1=k1, b=b),
+        QuantizedBM25Ranking(),
+    )
+
+    baseline = _run(exact, queries, k)
+    candidate = _run(quantized, queries, k)
+
+    overlaps = [
+        len(set(e.retrieved) & set(c.retrieved)) / len(e.retrieved)
+        for e, c in zip(baseline, candidate, strict=True)
+        if e.retrieved
+    ]
+    return QuantizationReport(
+        dtype=dtype,
+        regression=compare_benchmarks(
+            baseline_results=baseline,
+            candidate_results=candidate,
+            queries=queries,
+            k=k,
+            thresholds=thresholds or RegressionThresholds(),
+        ),
+        agreement=sum(overlaps) / len(overlaps) if overlaps else 1.0,
+        exact_latency_ms=sum(r.latency_ms for r in baseline) / max(len(baseline), 1),
+        quantized_latency_ms=sum(r.latency_ms for r in candidate) / max(len(candidate), 1),
+    )
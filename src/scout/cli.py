@@ -13,6 +13,7 @@ from scout.benchmarks.aggregate import aggregate_metrics
 from scout.benchmarks.artifacts import load_benchmark_artifact, write_benchmark_artifact
 from scout.benchmarks.config_loader import load_benchmark_config
 from scout.benchmarks.index import build_benchmark_index
+from scout.benchmarks.loadgen import run_load
 from scout.benchmarks.regression import RegressionReport, compare_benchmarks
 from scout.benchmarks.run import BenchmarkQuery, run_benchmark
 from scout.benchmarks.thresholds import RegressionThresholds
@@ -23,6 +24,9 @@ from scout.ranking.composite import CompositeRanking
 from scout.ranking.recency import RecencyRanking
 from scout.ranking.robust import RobustRanking
 from scout.search.engine import SearchEngine
+from scout.search.hot import mine_query_log
+from scout.search.rerank import Reranker
+from scout.server.http import make_server
 
 console = Console()
 
@@ -57,6 +61,8 @@ def build_parser() -> argparse.ArgumentParser:
     search.add_argument("--limit", type=int, default=10)
     search.add_argument("--explain", action="store_true")
     search.add_argument("--json", action="store_true")
+    search.add_argument("--max-df-ratio", type=float,
+                        help="Terms in more than this share of documents never generate candidates")
 
     # BENCHMARK
     bench = sub.add_parser("benchmark", help="Run benchmark from config")
@@ -67,12 +73,44 @@ def build_parser() -> argparse.ArgumentParser:
     regress.add_argument("--baseline", type=Path, required=True)
     regress.add_argument("--candidate", type=Path, required=True)
 
+    # SERVE
+    serve = sub.add_parser("serve", help="Serve search/explain over local HTTP")
+    source = serve.add_mutually_exclusive_group(required=True)
+    source.add_argument("--index", type=Path, help="Index saved with SearchEngine.save")
+    source.add_argument("--records-file", type=Path)
+    serve.add_argument("--ranking", choices=["robust", "bm25", "fusion"], default="robust")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix-socket", help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("--max-batch", type=int, default=32)
+    serve.add_argument("--max-wait-ms", type=float, default=2.0)
+    serve.add_argument("--max-queue", type=int, default=1024)
+    serve.add_argument("--max-queue-delay-ms", type=float, default=1000.0)
+    serve.add_argument("--hot-queries", type=Path,
+                       help="JSONL query log; its most frequent queries are precomputed")
+    serve.add_argument("--hot-size", type=int, default=2000)
+    serve.add_argument("--rerank-depth", type=int,
+                       help="Retrieve this many hits with BM25, then rerank them with --ranking")
+    serve.add_argument("--max-df-ratio", type=float,
+                       help="Terms in more than this share of documents never generate candidates")
+
+    # LOADGEN
+    loadgen = sub.add_parser("loadgen", help="Measure `scout serve` throughput")
+    loadgen.add_argument("--target", default="http://127.0.0.1:8765",
+                         help="http://host:port or unix:/path/to/socket")
+    loadgen.add_argument("--queries-file", type=Path, required=True)
+    loadgen.add_argument("--requests", type=int, default=1000)
+    loadgen.add_argument("--concurrency", type=int, default=8)
+    loadgen.add_argument("--limit", type=int, default=10)
+
     return parser
 
 # ---------------- Commands ---------------- #
 def cmd_search(args) -> int:
     ranking = RobustRanking() if args.ranking == "robust" else BM25Ranking()
     engine = build_engine(args.records_file, ranking)
+    if args.max_df_ratio is not None:
+        engine.max_df_ratio = args.max_df_ratio
     query = input("Query: ").strip()
     if not query:
         console.print("[red]Empty query[/red]")
@@ -160,6 +198,57 @@ def cmd_benchmark_regress(args) -> int:
         exit_code = 3
     return exit_code
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    ranking = build_ranking({"type": args.ranking})
+    reranker = None
+    if args.rerank_depth is not None:
+        reranker = Reranker(ranking, depth=args.rerank_depth)
+        ranking = BM25Ranking()
+    if args.index is not None:
+        engine = SearchEngine.load(str(args.index), ranking=ranking)
+    else:
+        engine = build_engine(args.records_file, ranking)
+    engine.reranker = reranker
+    if args.max_df_ratio is not None:
+        engine.max_df_ratio = args.max_df_ratio
+    if args.hot_queries is not None:
+        cache = engine.enable_hot_cache(mine_query_log(args.hot_queries, args.hot_size))
+        console.print(f"Precomputed {len(cache)} hot queries")
+    server = make_server(
+        engine,
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        max_batch=args.max_batch,
+        max_wait_ms=args.max_wait_ms,
+        max_queue=args.max_queue,
+        max_queue_delay_ms=args.max_queue_delay_ms,
+    )
+    where = args.unix_socket or f"http://{args.host}:{server.server_port}"
+    console.print(f"[bold green]Serving[/bold green] {engine.index.stats.total_docs} documents on [cyan]{where}[/cyan]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+def cmd_loadgen(args: argparse.Namespace) -> int:
+    queries = [q.strip() for q in args.queries_file.read_text(encoding="utf-8").splitlines() if q.strip()]
+    report = run_load(
+        target=args.target,
+        queries=queries,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        limit=args.limit,
+    )
+    console.print(f"requests: {report.requests} (ok {report.ok}, overloaded {report.overloaded}, errors {report.errors})")
+    console.print(f"throughput: {report.throughput_rps:.1f} req/s")
+    for p, v in report.latency_ms.items():
+        console.print(f"p{p}: {v:.2f} ms")
+    return 0 if report.errors == 0 else 1
+
 # ---------------- Main ---------------- #
 def main() -> None:
     parser = build_parser()
@@ -170,6 +259,10 @@ def main() -> None:
         sys.exit(cmd_benchmark(args))
     if args.command == "benchmark-regress":
         sys.exit(cmd_benchmark_regress(args))
+    if args.command == "serve":
+        sys.exit(cmd_serve(args))
+    if args.command == "loadgen":
+        sys.exit(cmd_loadgen(args))
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,11 @@ def explain_query(
     Explain query results by returning top documents along with
     token-level scoring components.
 
+    When the engine has a `max_df_ratio`, each token's breakdown also
+    carries its document frequency ("df"), the cutoff it is held to
+    ("df_cutoff") and whether it generated candidates ("driving", 1.0
+    or 0.0).
+
     PURE FUNCTION:
     - It does not mutate engine state
     - It does not mutate RankingResult objects returned by search()
@@ -21,17 +26,33 @@ def explain_query(
     results = engine.search(query, limit=limit)
     query_tokens = query.lower().split()
 
+    df_terms: dict[str, dict[str, float]] = {}
+    if engine.max_df_ratio is not None:
+        index = engine.index
+        cutoff = index.stats.df_cutoff(engine.max_df_ratio)
+        driving, _ = engine.driving_terms(
+            [t for t in query_tokens if t not in engine.stopwords], index
+        )
+        df_terms = {
+            token: {
+                "df": float(index.doc_freqs.get(token, 0)),
+                "df_cutoff": float(cutoff),
+                "driving": float(token in driving),
+            }
+            for token in query_tokens
+        }
+
     explanations: list[tuple[int, RankingResult]] = []
 
     for doc_id, result in results:
         # Defensive copies
         components = dict(result.components)
-        per_term = dict(result.per_term)
+        per_term = {token: dict(terms) for token, terms in result.per_term.items()}
 
         # Ensure every query token appears in explanations
         for token in query_tokens:
             components.setdefault(token, 0.0)
-            per_term.setdefault(token, {})
+            per_term.setdefault(token, {}).update(df_terms.get(token, {}))
 
         explained = RankingResult(
             score=result.score,
@@ -0,0 +1,158 @@
+# scout/index/bitmap.py
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+# Containers with more members than this switch from a sorted uint16 array
+# to a fixed 8 KiB bitmap, as in Roaring bitmaps.
+ARRAY_MAX = 4096
+_BITMAP_WORDS = 1 << 10  # 65536 bits
+
+
+def _array_to_bits(values: np.ndarray) -> np.ndarray:
+    bits = np.zeros(_BITMAP_WORDS * 64, dtype=np.uint8)
+    bits[values] = 1
+    return np.packbits(bits, bitorder="little").view(np.uint64)
+
+
+def _bits_to_array(bits: np.ndarray) -> np.ndarray:
+    unpacked = np.unpackbits(bits.view(np.uint8), bitorder="little")
+    return np.flatnonzero(unpacked).astype(np.uint16)
+
+
+def _is_bitmap(container: np.ndarray) -> bool:
+    return container.dtype == np.uint64
+
+
+def _normalize(container: np.ndarray) -> np.ndarray | None:
+    """Pick the smaller representation; None if empty."""
+    if _is_bitmap(container):
+        count = int(np.unpackbits(container.view(np.uint8)).sum())
+        if count == 0:
+            return None
+        return container if count > ARRAY_MAX else _bits_to_array(container)
+    if len(container) == 0:
+        return None
+    return _array_to_bits(container) if len(container) > ARRAY_MAX else container
+
+
+def _contains_low(container: np.ndarray, low: np.ndarray) -> np.ndarray:
+    if _is_bitmap(container):
+        words = container[low >> 6]
+        bits: np.ndarray = (words >> (low & 63).astype(np.uint64)) & np.uint64(1)
+        return bits.astype(bool)
+    pos = np.searchsorted(container, low)
+    pos[pos == len(container)] = 0
+    return container[pos] == low if len(container) else np.zeros(len(low), dtype=bool)
+
+
+class DocBitmap:
+    """
+    Compressed set of document ordinals (Roaring-style).
+
+    Ordinals are split into a 16-bit high key and a 16-bit low part. Each
+    key holds a sorted uint16 array while sparse, or a 65536-bit bitmap
+    once it has more than ARRAY_MAX members, so dense and sparse sets are
+    both compact and intersect quickly.
+    """
+
+    def __init__(self, containers: dict[int, np.ndarray] | None = None) -> None:
+        self._containers = dict(sorted((containers or {}).items()))
+        self._len: int | None = None
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Iterable[int] | np.ndarray) -> DocBitmap:
+        values = np.unique(np.asarray(ordinals, dtype=np.int64))
+        if len(values) and values[0] < 0:
+            raise ValueError("ordinals must be >= 0")
+
+        highs = values >> 16
+        keys, starts = np.unique(highs, return_index=True)
+        bounds = [*starts.tolist(), len(values)]
+
+        containers = {}
+        for i, key in enumerate(keys.tolist()):
+            low = (values[bounds[i] : bounds[i + 1]] & 0xFFFF).astype(np.uint16)
+            containers[key] = _array_to_bits(low) if len(low) > ARRAY_MAX else low
+        return cls(containers)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = sum(
+                int(np.unpackbits(c.view(np.uint8)).sum()) if _is_bitmap(c) else len(c)
+                for c in self._containers.values()
+            )
+        return self._len
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __contains__(self, ordinal: int) -> bool:
+        container = self._containers.get(ordinal >> 16)
+        if container is None:
+            return False
+        low = ordinal & 0xFFFF
+        if _is_bitmap(container):
+            return bool((int(container[low >> 6]) >> (low & 63)) & 1)
+        pos = int(np.searchsorted(container, low))
+        return pos < len(container) and int(container[pos]) == low
+
+    def contains_many(self, ordinals: np.ndarray) -> np.ndarray:
+        """Boolean mask of which `ordinals` are in the set."""
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        out = np.zeros(len(ordinals), dtype=bool)
+        highs = ordinals >> 16
+        for key, container in self._containers.items():
+            mask = highs == key
+            if mask.any():
+                out[mask] = _contains_low(container, ordinals[mask] & 0xFFFF)
+        return out
+
+    def to_ordinals(self) -> np.ndarray:
+        parts = [
+            (key << 16) + (_bits_to_array(c) if _is_bitmap(c) else c).astype(np.int64)
+            for key, c in self._containers.items()
+        ]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def __and__(self, other: DocBitmap) -> DocBitmap:
+        containers = {}
+        for key in self._containers.keys() & other._containers.keys():
+            a, b = self._containers[key], other._containers[key]
+            if _is_bitmap(a) and _is_bitmap(b):
+                merged = _normalize(a & b)
+            elif _is_bitmap(a) or _is_bitmap(b):
+                bits, array = (a, b) if _is_bitmap(a) else (b, a)
+                merged = _normalize(array[_contains_low(bits, array.astype(np.int64))])
+            else:
+                merged = _normalize(np.intersect1d(a, b, assume_unique=True))
+            if merged is not None:
+                containers[key] = merged
+        return DocBitmap(containers)
+
+    def __or__(self, other: DocBitmap) -> DocBitmap:
+        containers = dict(self._containers)
+        for key, b in other._containers.items():
+            a = containers.get(key)
+            if a is None:
+                containers[key] = b
+                continue
+            if not _is_bitmap(a) and not _is_bitmap(b):
+                merged = np.union1d(a, b).astype(np.uint16)
+            else:
+                a_bits = a if _is_bitmap(a) else _array_to_bits(a)
+                b_bits = b if _is_bitmap(b) else _array_to_bits(b)
+                merged = a_bits | b_bits
+            containers[key] = _normalize(merged)  # type: ignore[assignment]
+        return DocBitmap(containers)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DocBitmap):
+            return NotImplemented
+        return np.array_equal(self.to_ordinals(), other.to_ordinals())
+
+    def __repr__(self) -> str:
+        return f"DocBitmap({len(self)} docs, {len(self._containers)} containers)"
@@ -0,0 +1,405 @@
+# scout/index/columns.py
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from .layered import LayeredDict, SharedList
+from .vectors import IVFIndex
+
+ColumnKind = Literal["datetime", "float", "category", "vector"]
+
+# String fields with more distinct values than this are treated as free
+# text rather than categories and get no column.
+MAX_CATEGORIES = 4096
+
+_MISSING_CODE = -1
+_NAT = np.datetime64("NaT", "us")
+_INITIAL_CAPACITY = 64
+
+
+def parse_datetime(value: Any) -> datetime | None:
+    """Naive UTC datetime for a datetime, date or ISO string, else None."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if not isinstance(value, datetime):
+        return None
+    parsed: datetime = value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+def _is_vector(value: Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and np.issubdtype(value.dtype, np.floating)
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 1
+        and all(type(v) is float for v in value)
+    )
+
+
+def plain_metadata(metadata: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    `metadata`, with NumPy vectors turned into lists so the stored
+    document stays JSON-serializable (the vector column keeps float32).
+    """
+    if not metadata:
+        return {}
+    if not any(isinstance(v, np.ndarray) for v in metadata.values()):
+        return metadata
+    return {
+        k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in metadata.items()
+    }
+
+
+def _infer_kind(value: Any) -> ColumnKind | None:
+    if _is_vector(value):
+        return "vector"
+    if isinstance(value, bool):
+        return "category"
+    if isinstance(value, (int, float)):
+        return "float"
+    if isinstance(value, (datetime, date)):
+        return "datetime"
+    if isinstance(value, str):
+        return "datetime" if parse_datetime(value) is not None else "category"
+    return None
+
+
+class Column:
+    """
+    One typed metadata field, indexed by document ordinal.
+
+    - "datetime": datetime64[us], NaT when missing
+    - "float": float64, NaN when missing
+    - "category": int32 codes into `categories`, -1 when missing
+    - "vector": float32 rows of width `dim`, L2-normalized (so inner
+      products are cosine similarities), all-NaN when missing; `ann` is
+      the row's IVF index once built (see vectors.ann_index)
+
+    Values are appended into a growable buffer; `values` is a view of the
+    filled prefix. Forks share the buffer and copy it before overwriting
+    anything below their starting length, so published views never change.
+    """
+
+    def __init__(self, kind: ColumnKind, dim: int | None = None) -> None:
+        self.kind = kind
+        self.dim = dim
+        self.ann: IVFIndex | None = None
+        self._size = 0
+        self._shared = False
+        self.categories: list[Any] = []
+        self._codes: dict[Any, int] = {}
+        self._data = np.full(self._shape(_INITIAL_CAPACITY), self._missing, dtype=self._dtype)
+        self._tail = [0]  # filled length of `_data`, shared between forks
+        self.version = 0
+        self._order: tuple[int, np.ndarray] | None = None
+
+    @property
+    def _dtype(self) -> Any:
+        return {
+            "datetime": "datetime64[us]",
+            "float": np.float64,
+            "category": np.int32,
+            "vector": np.float32,
+        }[self.kind]
+
+    @property
+    def _missing(self) -> Any:
+        return {"datetime": _NAT, "float": np.nan, "category": _MISSING_CODE, "vector": np.nan}[self.kind]
+
+    def _shape(self, capacity: int) -> tuple[int, ...]:
+        if self.kind == "vector":
+            assert self.dim is not None
+            return (capacity, self.dim)
+        return (capacity,)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[: self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def encode(self, value: Any) -> Any:
+        """Storage representation of `value`, or the missing marker."""
+        if value is None:
+            return self._missing
+        if self.kind == "datetime":
+            parsed = parse_datetime(value)
+            return _NAT if parsed is None else np.datetime64(parsed, "us")
+        if self.kind == "float":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return np.nan
+        if self.kind == "vector":
+            try:
+                row = np.asarray(value, dtype=np.float32)
+            except (TypeError, ValueError):
+                return np.nan
+            if row.shape != (self.dim,):
+                return np.nan
+            norm = np.linalg.norm(row)
+            return row / norm if norm > 0 else row
+        try:
+            code = self._codes.get(value)
+        except TypeError:  # unhashable
+            return _MISSING_CODE
+        if code is None:
+            code = len(self.categories)
+            self._codes[value] = code
+            self.categories.append(value)
+        return code
+
+    def code(self, value: Any) -> int | None:
+        """Category code for `value` without adding it."""
+        try:
+            return self._codes.get(value)
+        except TypeError:
+            return None
+
+    def set(self, ordinal: int, value: Any) -> None:
+        encoded = self.encode(value)
+        self.version += 1
+        if ordinal < self._size:
+            if self._shared:
+                self._reallocate(len(self._data))
+            self._data[ordinal] = encoded
+            if self.ann is not None:
+                self.ann = self.ann.with_stale(ordinal)
+            return
+
+        # Append in place only while no other fork has appended past our
+        # end of the shared buffer (the same rule as Go slice append).
+        if ordinal >= len(self._data) or self._tail[0] != self._size:
+            self._reallocate(max(ordinal + 1, len(self._data) * 2))
+        self._data[self._size : ordinal] = self._missing
+        self._data[ordinal] = encoded
+        self._size = ordinal + 1
+        self._tail[0] = self._size
+
+    def _reallocate(self, capacity: int) -> None:
+        data = np.full(self._shape(capacity), self._missing, dtype=self._dtype)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+        self._tail = [self._size]
+        self._shared = False
+
+    def fork(self) -> Column:
+        forked = Column.__new__(Column)
+        forked.kind = self.kind
+        forked.dim = self.dim
+        forked.ann = self.ann.fork() if self.ann is not None else None
+        forked._size = self._size
+        forked._data = self._data
+        forked._tail = self._tail
+        forked._shared = True
+        forked.categories = list(self.categories)
+        forked._codes = dict(self._codes)
+        forked.version = self.version
+        forked._order = self._order
+        self._shared = True
+        return forked
+
+    def sorted_order(self) -> np.ndarray:
+        """
+        Ordinals sorted by value (missing values last), cached until the
+        column changes. Range lookups binary-search `values[order]`.
+        """
+        if self._order is None or self._order[0] != self.version:
+            self._order = (self.version, np.argsort(self.values, kind="stable"))
+        return self._order[1]
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "values": self.values.copy(),
+            "categories": self.categories,
+            "ann": self.ann,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.kind = state["kind"]
+        self._data = state["values"]
+        self.dim = self._data.shape[1] if self.kind == "vector" else None
+        self.ann = state.get("ann")
+        self._size = len(self._data)
+        self._tail = [self._size]
+        self._shared = False
+        self.version = 0
+        self._order = None
+        self.categories = list(state["categories"])
+        self._codes = {value: code for code, value in enumerate(self.categories)}
+
+
+class ColumnStore:
+    """
+    Typed metadata columns keyed by document ordinal.
+
+    Ordinals are assigned in insertion order. Column kinds come from
+    `schema` or are inferred from the first non-null value of a field;
+    string fields that exceed MAX_CATEGORIES distinct values are dropped.
+    Fields in `schema` mapped to None are never stored.
+
+    Vector fields (float arrays, or lists of floats) live apart in
+    `vectors`, so filters, facets and sorting never see them.
+    """
+
+    def __init__(self, schema: Mapping[str, ColumnKind | None] | None = None) -> None:
+        self.schema: dict[str, ColumnKind | None] = dict(schema or {})
+        self.ordinals: LayeredDict[Any, int] = LayeredDict()
+        self.doc_ids: SharedList[Any] = SharedList()
+        self.columns: dict[str, Column] = {}
+        self.vectors: dict[str, Column] = {}
+        self.version = 0
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles from before layered maps hold a plain dict and list.
+        if not isinstance(state["ordinals"], LayeredDict):
+            state["ordinals"] = LayeredDict(state["ordinals"])
+            state["doc_ids"] = SharedList(list(state["doc_ids"]))
+        self.__dict__.update(state)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def add(self, doc_id: Any, metadata: Mapping[str, Any] | None) -> int:
+        self.version += 1
+        ordinal: int | None = self.ordinals.get(doc_id)
+        if ordinal is None:
+            ordinal = len(self.doc_ids)
+            self.ordinals[doc_id] = ordinal
+            self.doc_ids = self.doc_ids.extended((doc_id,))
+
+        for name, value in (metadata or {}).items():
+            if value is None:
+                continue
+            column = self.columns.get(name) or self.vectors.get(name)
+            if column is None:
+                kind = self.schema[name] if name in self.schema else _infer_kind(value)
+                if kind is None:
+                    self.schema[name] = None
+                    continue
+                if kind == "vector":
+                    self.schema[name] = kind
+                    column = self.vectors[name] = Column(kind, dim=len(value))
+                else:
+                    column = self.columns[name] = Column(kind)
+            column.set(ordinal, value)
+            if column.kind == "category" and len(column.categories) > MAX_CATEGORIES:
+                del self.columns[name]
+                self.schema[name] = None
+        return ordinal
+
+    def add_many(self, documents: Iterable[tuple[Any, Mapping[str, Any] | None]]) -> None:
+        for doc_id, metadata in documents:
+            self.add(doc_id, metadata)
+
+    def column(self, name: str) -> Column | None:
+        return self.columns.get(name)
+
+    def vector(self, name: str) -> Column | None:
+        return self.vectors.get(name)
+
+    def ordinal(self, doc_id: Any) -> int | None:
+        ordinal: int | None = self.ordinals.get(doc_id)
+        return ordinal
+
+    def ordinals_for(self, doc_ids: Sequence[Any]) -> np.ndarray:
+        """Ordinals of `doc_ids` (-1 for unknown ids)."""
+        return np.fromiter(
+            self.ordinals.get_many(doc_ids, -1), dtype=np.int64, count=len(doc_ids)
+        )
+
+    def values(self, name: str, ordinals: np.ndarray) -> np.ndarray | None:
+        """
+        Values of column `name` at `ordinals`, missing markers for
+        documents the column does not reach. None if there is no column.
+        """
+        column = self.columns.get(name)
+        if column is None:
+            return None
+        values = column.values
+        inside = (ordinals >= 0) & (ordinals < len(values))
+        out = np.full(len(ordinals), column._missing, dtype=values.dtype)
+        out[inside] = values[ordinals[inside]]
+        return out
+
+    def fork(self) -> ColumnStore:
+        forked = ColumnStore(self.schema)
+        forked.ordinals = self.ordinals.fork()
+        forked.doc_ids = self.doc_ids
+        forked.columns = {name: column.fork() for name, column in self.columns.items()}
+        forked.vectors = {name: column.fork() for name, column in self.vectors.items()}
+        forked.version = self.version
+        return forked
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+
+    def save(self, path: str | Path) -> None:
+        arrays: dict[str, Any] = {}
+        meta: dict[str, Any] = {"schema": self.schema, "columns": {}}
+        for name, column in self.columns.items():
+            key = f"c{len(meta['columns'])}"
+            arrays[key] = column.values
+            meta["columns"][name] = {"key": key, "kind": column.kind, "categories": column.categories}
+        meta["vectors"] = {}
+        for name, column in self.vectors.items():
+            key = f"v{len(meta['vectors'])}"
+            arrays[key] = column.values
+            if column.ann is not None:
+                arrays.update(column.ann.arrays(prefix=f"{key}_"))
+            meta["vectors"][name] = {"key": key, "ann": column.ann is not None}
+
+        np.savez(
+            path,
+            **arrays,
+            doc_ids=np.array(self.doc_ids.tolist(), dtype=object),
+            meta=np.array(meta, dtype=object),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> ColumnStore:
+        with np.load(path, allow_pickle=True) as data:
+            meta = data["meta"].item()
+            store = cls(meta["schema"])
+            store.doc_ids = SharedList(data["doc_ids"].tolist())
+            store.ordinals = LayeredDict({doc_id: i for i, doc_id in enumerate(store.doc_ids)})
+            for name, info in meta["columns"].items():
+                store.columns[name] = Column.__new__(Column)
+                store.columns[name].__setstate__(
+                    {"kind": info["kind"], "values": data[info["key"]], "categories": info["categories"]}
+                )
+            for name, info in meta.get("vectors", {}).items():
+                key = info["key"]
+                ann = IVFIndex.from_arrays(data, prefix=f"{key}_") if info["ann"] else None
+                store.vectors[name] = Column.__new__(Column)
+                store.vectors[name].__setstate__(
+                    {"kind": "vector", "values": data[key], "categories": [], "ann": ann}
+                )
+        return store
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Mapping[Any, Mapping[str, Any]],
+        schema: Mapping[str, ColumnKind | None] | None = None,
+    ) -> ColumnStore:
+        store = cls(schema)
+        store.add_many(documents.items())
+        return store
@@ -0,0 +1,688 @@
+# scout/index/frozen.py
+
+from __future__ import annotations
+
+import bisect
+import json
+import mmap
+import struct
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+
+from .columns import Column, ColumnStore
+from .fuzzy import DeletionIndex
+from .inverted import InvertedIndex, Posting
+from .layered import LayeredDict, SharedList
+from .stats import IndexStats
+from .terms import TermDictionary
+from .vectors import IVFIndex
+
+_MAGIC = b"SCOUTFRZ"
+_FORMAT_VERSION = 1
+_ALIGN = 8
+_POSTINGS_CACHE_SIZE = 256
+
+ImpactDtype = Literal["uint8", "uint16"]
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _encode_strings(values: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum([len(v) for v in values], out=offsets[1:])
+    blob = np.frombuffer(b"".join(values), dtype=np.uint8)
+    return blob, offsets
+
+
+def _add_impacts(
+    arrays: dict[str, np.ndarray],
+    meta: dict[str, Any],
+    dtype: ImpactDtype,
+    *,
+    k1: float,
+    b: float,
+) -> dict[str, Any]:
+    """Sort postings by ordinal per term and add quantized BM25 impacts."""
+    offsets = arrays["postings_offsets"]
+    terms_of = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    order = np.lexsort((arrays["postings_docs"], terms_of))
+    docs = arrays["postings_docs"] = arrays["postings_docs"][order]
+    tfs = arrays["postings_tf"] = arrays["postings_tf"][order]
+
+    # BM25Ranking's formula, vectorized over every posting at once.
+    n = meta["total_docs"]
+    avg_dl = meta["total_length"] / n if n else 1.0
+    df = arrays["doc_freqs"][terms_of].astype(np.float64)
+    idf = np.log((n - df + 0.5) / (df + 0.5) + 1.0)
+    tf = tfs.astype(np.float64)
+    lengths = arrays["doc_lengths"][docs].astype(np.float64)
+    impacts = idf * (tf * (k1 + 1) / (tf + k1 * (1 - b + b * (lengths / avg_dl))))
+
+    levels = np.iinfo(dtype).max
+    peak = float(impacts.max()) if len(impacts) else 0.0
+    scale = peak / levels if peak > 0 else 1.0
+    # Terms in nearly every document have impacts far below one step;
+    # keep them at one step rather than rounding their matches away.
+    quantized = np.maximum(np.rint(impacts / scale), impacts > 0)
+    arrays["postings_impact"] = quantized.astype(dtype)
+    return {"dtype": dtype, "scale": scale, "k1": k1, "b": b}
+
+
+def _add_deletions(
+    arrays: dict[str, np.ndarray],
+    deletions: DeletionIndex,
+    terms: list[str],
+) -> dict[str, Any]:
+    """Add `deletions`' arrays, renumbered to frozen term ids."""
+    term_ids = {term: i for i, term in enumerate(terms)}
+    hashes, owners = deletions.arrays()
+    # Forks share one deletion index, which may know terms this one lacks.
+    renumber = np.array([term_ids.get(t, -1) for t in deletions.terms], dtype=np.int32)
+    owners = renumber[owners] if len(owners) else owners
+    known = owners >= 0
+    arrays["deletion_hashes"] = hashes[known]
+    arrays["deletion_owners"] = owners[known]
+    return {"max_distance": deletions.max_distance, "prefix_length": deletions.prefix_length}
+
+
+def _add_columns(
+    arrays: dict[str, np.ndarray],
+    columns: ColumnStore,
+    doc_ids: list[Any],
+) -> dict[str, Any]:
+    """Add `columns`' values in frozen ordinal order; returns their layout."""
+    rows = columns.ordinals_for(doc_ids)
+    # Columns filled in document order need no reordering, and only then
+    # do trained ANN assignments still line up with the rows.
+    aligned = np.array_equal(rows, np.arange(len(doc_ids)))
+
+    def gather(column: Column) -> np.ndarray:
+        values = column.values
+        if aligned and len(values) == len(rows):
+            return values.copy()
+        inside = (rows >= 0) & (rows < len(values))
+        out = np.full((len(rows), *values.shape[1:]), column._missing, dtype=values.dtype)
+        out[inside] = values[rows[inside]]
+        return out
+
+    layout: dict[str, Any] = {"schema": columns.schema, "columns": {}, "vectors": {}}
+    for name, column in columns.columns.items():
+        key = f"column{len(layout['columns'])}"
+        arrays[key] = gather(column)
+        layout["columns"][name] = {
+            "key": key,
+            "kind": column.kind,
+            "categories": column.categories,
+        }
+    for name, column in columns.vectors.items():
+        key = f"vector{len(layout['vectors'])}"
+        arrays[key] = gather(column).reshape(-1)
+        info: dict[str, Any] = {"key": key, "dim": column.dim, "ann": None}
+        if column.ann is not None and aligned:
+            arrays[f"{key}_centroids"] = column.ann.centroids.reshape(-1).copy()
+            arrays[f"{key}_assign"] = column.ann._assign.copy()
+            info["ann"] = {"trained_rows": column.ann.trained_rows}
+        layout["vectors"][name] = info
+    return layout
+
+
+class _StringTable:
+    """Variable-length UTF-8 strings stored as one blob plus offsets."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, i: int) -> bytes:
+        return self._blob[self._offsets[i] : self._offsets[i + 1]].tobytes()
+
+    def __getitem__(self, i: int) -> str:
+        return self.raw(i).decode("utf-8")
+
+
+class _FrozenDocFreqs(Mapping[str, int]):
+    def __init__(self, frozen: FrozenIndex) -> None:
+        self._frozen = frozen
+
+    def __getitem__(self, token: str) -> int:
+        term_id = self._frozen.term_id(token)
+        if term_id is None:
+            raise KeyError(token)
+        return int(self._frozen.arrays["doc_freqs"][term_id])
+
+    def __iter__(self) -> Iterator[str]:
+        terms = self._frozen.terms
+        return (terms[i] for i in range(len(terms)))
+
+    def __len__(self) -> int:
+        return len(self._frozen.terms)
+
+
+class _FrozenDocLengths(Mapping[Any, int]):
+    def __init__(self, frozen: FrozenIndex) -> None:
+        self._frozen = frozen
+
+    def __getitem__(self, doc_id: Any) -> int:
+        ordinal = self._frozen.ordinal(doc_id)
+        if ordinal is None:
+            raise KeyError(doc_id)
+        return int(self._frozen.arrays["doc_lengths"][ordinal])
+
+    def get_many(self, doc_ids: Sequence[Any], default: Any = None) -> list[Any]:
+        ordinals = self._frozen.ordinals(doc_ids)
+        lengths = self._frozen.arrays["doc_lengths"][np.maximum(ordinals, 0)].tolist()
+        return [default if o < 0 else n for o, n in zip(ordinals.tolist(), lengths, strict=True)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._frozen.doc_ids())
+
+    def __len__(self) -> int:
+        return self._frozen.num_docs
+
+
+class _FrozenDocuments(Mapping[Any, dict[str, Any]]):
+    def __init__(self, frozen: FrozenIndex) -> None:
+        self._frozen = frozen
+
+    def __getitem__(self, doc_id: Any) -> dict[str, Any]:
+        ordinal = self._frozen.ordinal(doc_id)
+        if ordinal is None:
+            raise KeyError(doc_id)
+        return self._frozen.document_at(ordinal)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._frozen.doc_ids())
+
+    def __len__(self) -> int:
+        return self._frozen.num_docs
+
+
+class _FrozenOrdinals(Mapping[Any, int]):
+    def __init__(self, frozen: FrozenIndex) -> None:
+        self._frozen = frozen
+
+    def __getitem__(self, doc_id: Any) -> int:
+        ordinal = self._frozen.ordinal(doc_id)
+        if ordinal is None:
+            raise KeyError(doc_id)
+        return ordinal
+
+    def get_many(self, doc_ids: Sequence[Any], default: Any = None) -> list[Any]:
+        ordinals = self._frozen.ordinals(doc_ids).tolist()
+        return [default if o < 0 else o for o in ordinals]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._frozen.doc_ids())
+
+    def __len__(self) -> int:
+        return self._frozen.num_docs
+
+
+class FrozenStats:
+    """Read-only IndexStats view over a FrozenIndex."""
+
+    def __init__(self, frozen: FrozenIndex) -> None:
+        self.doc_lengths = _FrozenDocLengths(frozen)
+        self.total_docs: int = frozen.meta["total_docs"]
+        self.total_length: int = frozen.meta["total_length"]
+
+    def get_doc_length(self, doc_id: Any) -> int:
+        return self.doc_lengths.get(doc_id, 0)
+
+    def df_cutoff(self, max_df_ratio: float) -> int:
+        return max(1, int(max_df_ratio * self.total_docs))
+
+    @property
+    def avg_doc_length(self) -> float:
+        if not len(self.doc_lengths):
+            return 1.0
+        return self.total_length / self.total_docs
+
+
+class FrozenIndex:
+    """
+    Immutable, array-backed form of an InvertedIndex.
+
+    Everything lives in flat NumPy arrays (CSR postings, a sorted UTF-8
+    term dictionary, JSON-encoded documents), so the whole index can be
+    laid out in a single buffer and attached zero-copy from shared memory
+    or a memory-mapped file. Exposes the read API ranking strategies and
+    SearchEngine use; it cannot be modified.
+    """
+
+    def __init__(
+        self,
+        arrays: dict[str, np.ndarray],
+        meta: dict[str, Any],
+        *,
+        buffer: Any = None,
+    ) -> None:
+        self.arrays = arrays
+        self.meta = meta
+        self._buffer = buffer  # keeps a backing mmap/shm alive
+        self.terms = _StringTable(arrays["term_bytes"], arrays["term_offsets"])
+        self._str_ids = (
+            _StringTable(arrays["doc_id_bytes"], arrays["doc_id_offsets"])
+            if meta["id_kind"] == "str"
+            else None
+        )
+        self.doc_freqs = _FrozenDocFreqs(self)
+        self.documents = _FrozenDocuments(self)
+        self.stats = FrozenStats(self)
+        self._postings_cache: dict[str, list[Posting]] = {}
+        self._postings_lock = threading.Lock()
+
+    # ----------------------------
+    # Construction
+    # ----------------------------
+
+    @classmethod
+    def from_index(
+        cls,
+        index: InvertedIndex,
+        *,
+        config: dict[str, Any] | None = None,
+        impacts: ImpactDtype | None = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        fuzzy: bool = False,
+    ) -> FrozenIndex:
+        """
+        Freeze `index`.
+
+        With `impacts`, every posting also stores its BM25 contribution
+        (for `k1`, `b`), linearly quantized to that integer type with one
+        scale for the whole index, and each term's postings are kept in
+        doc-ordinal order; see QuantizedBM25Ranking.
+
+        The deletion index for fuzzy lookups is stored when `index`
+        already has one (see SearchEngine.prepare_fuzzy) or, with `fuzzy`,
+        built for it. Otherwise a fuzzy search on the frozen index builds
+        its own on first use.
+        """
+        doc_ids: list[Any] = list(index.documents)
+        if all(isinstance(d, int) and not isinstance(d, bool) for d in doc_ids):
+            id_kind = "int"
+        elif all(isinstance(d, str) for d in doc_ids):
+            id_kind = "str"
+        else:
+            raise TypeError("FrozenIndex requires all-int or all-str document ids")
+
+        ordinals = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+        terms = sorted(index.index, key=lambda t: t.encode("utf-8"))
+
+        term_bytes, term_offsets = _encode_strings([t.encode("utf-8") for t in terms])
+
+        postings_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(index.index[t]) for t in terms], out=postings_offsets[1:])
+        postings_docs = np.fromiter(
+            (ordinals[d] for t in terms for d, _ in index.index[t]),
+            dtype=np.int32,
+            count=int(postings_offsets[-1]),
+        )
+        postings_tf = np.fromiter(
+            (tf for t in terms for _, tf in index.index[t]),
+            dtype=np.int32,
+            count=int(postings_offsets[-1]),
+        )
+
+        doc_blob, doc_offsets = _encode_strings(
+            [json.dumps(index.documents[d]).encode("utf-8") for d in doc_ids]
+        )
+
+        arrays: dict[str, np.ndarray] = {
+            "term_bytes": term_bytes,
+            "term_offsets": term_offsets,
+            "doc_freqs": np.array(
+                [index.doc_freqs.get(t, 0) for t in terms], dtype=np.int32
+            ),
+            "postings_offsets": postings_offsets,
+            "postings_docs": postings_docs,
+            "postings_tf": postings_tf,
+            "doc_lengths": np.array(
+                [index.stats.get_doc_length(d) for d in doc_ids], dtype=np.int32
+            ),
+            "doc_bytes": doc_blob,
+            "doc_offsets": doc_offsets,
+        }
+
+        if id_kind == "int":
+            ids = np.array(doc_ids, dtype=np.int64)
+            arrays["doc_ids"] = ids
+            arrays["doc_id_order"] = np.argsort(ids, kind="stable").astype(np.int32)
+        else:
+            encoded = [d.encode("utf-8") for d in doc_ids]
+            arrays["doc_id_bytes"], arrays["doc_id_offsets"] = _encode_strings(encoded)
+            arrays["doc_id_order"] = np.array(
+                sorted(range(len(encoded)), key=encoded.__getitem__), dtype=np.int32
+            )
+
+        meta = {
+            "id_kind": id_kind,
+            "num_docs": len(doc_ids),
+            "total_docs": index.stats.total_docs,
+            "total_length": index.stats.total_length,
+            "config": config or {},
+        }
+        if impacts is not None:
+            meta["impacts"] = _add_impacts(arrays, meta, impacts, k1=k1, b=b)
+        meta["columns"] = _add_columns(arrays, index.columns, doc_ids)
+        deletions = index.deletion_index() if fuzzy else index._deletions
+        if deletions is not None:
+            meta["deletions"] = _add_deletions(arrays, deletions, terms)
+        return cls(arrays, meta)
+
+    def thaw(self) -> InvertedIndex:
+        """Mutable InvertedIndex copy (e.g. to add documents or save as JSON)."""
+        index = InvertedIndex()
+        ids = self.doc_ids()
+        offsets = self.arrays["postings_offsets"]
+        docs = self.arrays["postings_docs"]
+        tfs = self.arrays["postings_tf"]
+
+        postings: dict[str, SharedList[Posting]] = {}
+        for term_id in range(len(self.terms)):
+            start, end = int(offsets[term_id]), int(offsets[term_id + 1])
+            postings[self.terms[term_id]] = SharedList(
+                [
+                    (ids[o], int(tf))
+                    for o, tf in zip(docs[start:end].tolist(), tfs[start:end].tolist(), strict=True)
+                ]
+            )
+        index.index = LayeredDict(postings)
+        index.doc_freqs = LayeredDict(dict(self.doc_freqs.items()), default=int)
+        index.documents = LayeredDict({ids[o]: self.document_at(o) for o in range(self.num_docs)})
+
+        stats = IndexStats()
+        lengths = self.arrays["doc_lengths"].tolist()
+        stats.doc_lengths = LayeredDict({ids[o]: lengths[o] for o in range(self.num_docs)})
+        stats.total_docs = self.stats.total_docs
+        stats.total_length = self.stats.total_length
+        index.stats = stats
+        return index
+
+    # ----------------------------
+    # Lookups
+    # ----------------------------
+
+    @property
+    def num_docs(self) -> int:
+        return int(self.meta["num_docs"])
+
+    def term_id(self, token: str) -> int | None:
+        key = token.encode("utf-8")
+        i = bisect.bisect_left(range(len(self.terms)), key, key=self.terms.raw)
+        if i < len(self.terms) and self.terms.raw(i) == key:
+            return i
+        return None
+
+    def doc_ids(self) -> list[Any]:
+        if self._str_ids is None:
+            ids: list[Any] = self.arrays["doc_ids"].tolist()
+            return ids
+        return [self._str_ids[i] for i in range(self.num_docs)]
+
+    def doc_id_at(self, ordinal: int) -> Any:
+        if self._str_ids is None:
+            return int(self.arrays["doc_ids"][ordinal])
+        return self._str_ids[ordinal]
+
+    def ordinal(self, doc_id: Any) -> int | None:
+        order = self.arrays["doc_id_order"]
+
+        if self._str_ids is None:
+            if not isinstance(doc_id, int | np.integer):
+                return None
+            ids = self.arrays["doc_ids"]
+            i = int(np.searchsorted(ids, doc_id, sorter=order))
+            if i < len(order) and ids[order[i]] == doc_id:
+                return int(order[i])
+            return None
+
+        if not isinstance(doc_id, str):
+            return None
+        table = self._str_ids
+        key = doc_id.encode("utf-8")
+        i = bisect.bisect_left(range(len(order)), key, key=lambda j: table.raw(int(order[j])))
+        if i < len(order) and table.raw(order[i]) == key:
+            return int(order[i])
+        return None
+
+    def document_at(self, ordinal: int) -> dict[str, Any]:
+        offsets = self.arrays["doc_offsets"]
+        raw = self.arrays["doc_bytes"][offsets[ordinal] : offsets[ordinal + 1]]
+        document: dict[str, Any] = json.loads(raw.tobytes())
+        return document
+
+    # ----------------------------
+    # InvertedIndex read API
+    # ----------------------------
+
+    def postings_slice(self, token: str) -> tuple[np.ndarray, np.ndarray]:
+        """(doc ordinals, term frequencies) for `token`, as zero-copy views."""
+        term_id = self.term_id(token)
+        if term_id is None:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty
+        offsets = self.arrays["postings_offsets"]
+        start, end = offsets[term_id], offsets[term_id + 1]
+        return (
+            self.arrays["postings_docs"][start:end],
+            self.arrays["postings_tf"][start:end],
+        )
+
+    def impact_slice(self, token: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (doc ordinals in ascending order, quantized BM25 impacts) for
+        `token`; multiply impacts by `impact_scale` for BM25 scores.
+        """
+        if "postings_impact" not in self.arrays:
+            raise ValueError("Index was frozen without impacts (use impacts='uint8')")
+        term_id = self.term_id(token)
+        if term_id is None:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty
+        offsets = self.arrays["postings_offsets"]
+        start, end = offsets[term_id], offsets[term_id + 1]
+        return (
+            self.arrays["postings_docs"][start:end],
+            self.arrays["postings_impact"][start:end],
+        )
+
+    @property
+    def impact_scale(self) -> float:
+        return float(self.meta["impacts"]["scale"])
+
+    def ordinals(self, doc_ids: Sequence[Any]) -> np.ndarray:
+        """Ordinal per doc id, -1 for unknown ids."""
+        if self._str_ids is not None:
+            return np.array(
+                [-1 if (o := self.ordinal(d)) is None else o for d in doc_ids],
+                dtype=np.int64,
+            )
+        ids = self.arrays["doc_ids"]
+        order = self.arrays["doc_id_order"]
+        wanted = np.array(doc_ids, dtype=np.int64)
+        if not len(order):
+            return np.full(len(wanted), -1, dtype=np.int64)
+        i = np.minimum(np.searchsorted(ids, wanted, sorter=order), len(order) - 1)
+        found = order[i].astype(np.int64)
+        return np.where(ids[found] == wanted, found, -1)
+
+    def get_postings(self, token: str) -> list[Posting]:
+        cached = self._postings_cache.get(token)
+        if cached is not None:
+            return cached
+
+        docs, tfs = self.postings_slice(token)
+        if self._str_ids is None:
+            ids = self.arrays["doc_ids"][docs].tolist()
+        else:
+            ids = [self._str_ids[o] for o in docs.tolist()]
+        postings = list(zip(ids, tfs.tolist(), strict=True))
+
+        with self._postings_lock:
+            cache = self._postings_cache
+            if len(cache) >= _POSTINGS_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[token] = postings
+        return postings
+
+    @cached_property
+    def _terms(self) -> TermDictionary:
+        return TermDictionary(self.doc_freqs)
+
+    def term_dictionary(self) -> TermDictionary:
+        return self._terms
+
+    @cached_property
+    def _deletions(self) -> DeletionIndex:
+        settings = self.meta.get("deletions")
+        if settings is None:
+            # Frozen before the deletion index was stored with it.
+            return DeletionIndex(self._terms.terms)
+        return DeletionIndex.from_arrays(
+            self.terms,  # type: ignore[arg-type]
+            self.arrays["deletion_hashes"],
+            self.arrays["deletion_owners"],
+            **settings,
+        )
+
+    def deletion_index(self) -> DeletionIndex:
+        return self._deletions
+
+    @cached_property
+    def columns(self) -> ColumnStore:
+        """
+        Metadata columns over the frozen arrays. Indexes frozen before
+        columns were stored build them from the documents instead.
+        """
+        layout = self.meta.get("columns")
+        if layout is None:
+            return ColumnStore.from_documents(self.documents)
+
+        store = ColumnStore(layout["schema"])
+        store.ordinals = _FrozenOrdinals(self)  # type: ignore[assignment]
+        store.doc_ids = SharedList(self.doc_ids())
+        for name, info in layout["columns"].items():
+            column = store.columns[name] = Column.__new__(Column)
+            column.__setstate__(
+                {
+                    "kind": info["kind"],
+                    "values": self.arrays[info["key"]],
+                    "categories": info["categories"],
+                }
+            )
+        for name, info in layout["vectors"].items():
+            key = info["key"]
+            ann = None
+            if info["ann"] is not None:
+                ann = IVFIndex(
+                    self.arrays[f"{key}_centroids"].reshape(-1, info["dim"]),
+                    info["ann"]["trained_rows"],
+                )
+                ann._assign = self.arrays[f"{key}_assign"]
+            column = store.vectors[name] = Column.__new__(Column)
+            column.__setstate__(
+                {
+                    "kind": "vector",
+                    "values": self.arrays[key].reshape(-1, info["dim"]),
+                    "categories": [],
+                    "ann": ann,
+                }
+            )
+        return store
+
+    def get_document(self, doc_id: Any) -> dict[str, Any]:
+        ordinal = self.ordinal(doc_id)
+        return self.document_at(ordinal) if ordinal is not None else {}
+
+    def document_contains(self, doc_id: Any, token: str) -> bool:
+        ordinal = self.ordinal(doc_id)
+        if ordinal is None:
+            return False
+        docs, _ = self.postings_slice(token)
+        return bool(np.any(docs == ordinal))
+
+    def fork(self) -> InvertedIndex:
+        raise TypeError("FrozenIndex is read-only; use thaw() to modify it")
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.thaw().to_dict()
+
+    # ----------------------------
+    # Flat buffer layout
+    # ----------------------------
+
+    def _layout(self) -> tuple[bytes, dict[str, tuple[str, int, int]], int]:
+        entries: dict[str, tuple[str, int, int]] = {}
+        offset = 0
+        for name, array in self.arrays.items():
+            entries[name] = (array.dtype.str, offset, int(array.size))
+            offset = _align(offset + array.nbytes)
+
+        header = json.dumps(
+            {"format": _FORMAT_VERSION, "meta": self.meta, "arrays": entries}
+        ).encode("utf-8")
+        return header, entries, offset
+
+    @property
+    def nbytes(self) -> int:
+        header, _, data_size = self._layout()
+        return _align(len(_MAGIC) + 8 + len(header)) + data_size
+
+    def write_into(self, buffer: memoryview) -> None:
+        header, entries, _ = self._layout()
+        data_start = _align(len(_MAGIC) + 8 + len(header))
+
+        buffer[: len(_MAGIC)] = _MAGIC
+        buffer[len(_MAGIC) : len(_MAGIC) + 8] = struct.pack("<Q", len(header))
+        buffer[len(_MAGIC) + 8 : len(_MAGIC) + 8 + len(header)] = header
+
+        for name, array in self.arrays.items():
+            _, offset, _ = entries[name]
+            start = data_start + offset
+            buffer[start : start + array.nbytes] = np.ascontiguousarray(array).tobytes()
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> FrozenIndex:
+        """Attach to a buffer written by write_into() without copying arrays."""
+        view = memoryview(buffer)
+        if bytes(view[: len(_MAGIC)]) != _MAGIC:
+            raise ValueError("Not a frozen ScoutSearch index")
+
+        (header_len,) = struct.unpack("<Q", view[len(_MAGIC) : len(_MAGIC) + 8])
+        header = json.loads(bytes(view[len(_MAGIC) + 8 : len(_MAGIC) + 8 + header_len]))
+        if header["format"] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported frozen index format: {header['format']}")
+
+        data_start = _align(len(_MAGIC) + 8 + header_len)
+        arrays = {
+            name: np.frombuffer(
+                buffer, dtype=np.dtype(dtype), count=count, offset=data_start + offset
+            )
+            for name, (dtype, offset, count) in header["arrays"].items()
+        }
+        return cls(arrays, header["meta"], buffer=buffer)
+
+    def save(self, path: str | Path) -> None:
+        data = bytearray(self.nbytes)
+        self.write_into(memoryview(data))
+        Path(path).write_bytes(data)
+
+    @classmethod
+    def open(cls, path: str | Path) -> FrozenIndex:
+        """Memory-map a saved frozen index; pages are shared between processes."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(mapped)
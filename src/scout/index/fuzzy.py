@@ -0,0 +1,241 @@
+# scout/index/fuzzy.py
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+
+# Terms added after the last merge stay in a dict until they number more
+# than RECENT_MIN or 1/RECENT_FRACTION of the index.
+RECENT_MIN = 1024
+RECENT_FRACTION = 8
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int | None:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions), or None once it must exceed `max_distance`.
+
+    Bit-parallel (Hyyrö 2003): one DP column of `a` lives in the bits of
+    two integers, so each character of `b` costs a handful of integer
+    operations instead of a row of the DP table.
+    """
+    m, n = len(a), len(b)
+    if abs(m - n) > max_distance:
+        return None
+    if a == b:
+        return 0
+    if m == 0:
+        return n
+
+    peq: dict[str, int] = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, d0, previous_eq = mask, 0, 0, 0
+    score = m
+    for j, c in enumerate(b):
+        eq = peq.get(c, 0)
+        transposed = (((~d0) & eq) << 1) & previous_eq
+        d0 = ((((eq & pv) + pv) ^ pv) | eq | mv | transposed) & mask
+        hp = (mv | ~(d0 | pv)) & mask
+        hm = d0 & pv
+        if hp & last:
+            score += 1
+        elif hm & last:
+            score -= 1
+        # The score falls by at most one per remaining character.
+        if score - (n - j - 1) > max_distance:
+            return None
+        hp = ((hp << 1) | 1) & mask
+        hm = (hm << 1) & mask
+        pv = (hm | ~(d0 | hp)) & mask
+        mv = hp & d0
+        previous_eq = eq
+
+    return score if score <= max_distance else None
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """`word` and every string made by deleting up to `max_distance` chars."""
+    out = {word}
+    edge = {word}
+    for _ in range(max_distance):
+        edge = {w[:i] + w[i + 1 :] for w in edge for i in range(len(w))}
+        out |= edge
+    return out
+
+
+def _hash(delete: str) -> int:
+    # Unlike hash(), stable across processes, so a saved or shared index
+    # stays valid wherever it is loaded. Two 32-bit checksums collide far
+    # less than one, and still fit an int64.
+    data = delete.encode("utf-8", "surrogatepass")
+    return (zlib.crc32(data) << 31) ^ zlib.adler32(data)
+
+
+class DeletionIndex:
+    """
+    SymSpell-style index for typo-tolerant term lookup.
+
+    Every term contributes the deletes (up to `max_distance` characters)
+    of its first `prefix_length` characters. Two words within edit
+    distance d share a delete, so a lookup generates the deletes of the
+    query and only verifies the terms they point at, instead of comparing
+    against the whole vocabulary.
+
+    Deletes are stored as (checksum, term number) pairs in sorted NumPy
+    arrays; hash collisions only add candidates, which verification
+    removes. Terms added later go to a small dict that is merged into the
+    arrays once it grows past a fraction of them, so the index can follow
+    a growing vocabulary without being rebuilt. Readers never see a
+    half-merged state: both parts are swapped in as one tuple.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str] = (),
+        *,
+        max_distance: int = 2,
+        prefix_length: int = 6,
+    ) -> None:
+        if max_distance < 1:
+            raise ValueError("max_distance must be >= 1")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be greater than max_distance")
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.terms: list[str] = []
+        # (sorted hashes, owning term numbers, hash -> term numbers added since)
+        self._parts: tuple[np.ndarray, np.ndarray, dict[int, list[int]]] = (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int32),
+            {},
+        )
+        self._recent_terms = 0
+        self.add(terms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def add(self, terms: Iterable[str]) -> None:
+        """Index more terms; a term added twice is still reported once."""
+        first = len(self.terms)
+        self.terms.extend(terms)
+        if len(self.terms) == first:
+            return
+
+        hashes: list[int] = []
+        counts: list[int] = []
+        for term in self.terms[first:]:
+            deletes = _deletes(term[: self.prefix_length], self.max_distance)
+            hashes.extend(map(_hash, deletes))
+            counts.append(len(deletes))
+        owners = np.repeat(np.arange(first, len(self.terms), dtype=np.int32), counts)
+
+        base_hashes, base_owners, recent = self._parts
+        added = len(self.terms) - first
+        if self._recent_terms + added <= max(RECENT_MIN, len(self.terms) // RECENT_FRACTION):
+            # Copy on write: forks and readers may be iterating `recent`.
+            recent = dict(recent)
+            for h, owner in zip(hashes, owners.tolist(), strict=True):
+                recent[h] = [*recent.get(h, ()), owner]
+            self._parts = (base_hashes, base_owners, recent)
+            self._recent_terms += added
+            return
+
+        recent_hashes = [h for h, group in recent.items() for _ in group]
+        recent_owners = [owner for group in recent.values() for owner in group]
+        all_hashes = np.concatenate(
+            [base_hashes, np.array(recent_hashes + hashes, dtype=np.int64)]
+        )
+        all_owners = np.concatenate(
+            [base_owners, np.array(recent_owners, dtype=np.int32), owners]
+        )
+        order = np.argsort(all_hashes, kind="stable")
+        self._parts = (all_hashes[order], all_owners[order], {})
+        self._recent_terms = 0
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted delete hashes and their term numbers, recent terms included."""
+        hashes, owners, recent = self._parts
+        if not recent:
+            return hashes, owners
+        all_hashes = np.concatenate(
+            [hashes, np.array([h for h, group in recent.items() for _ in group], dtype=np.int64)]
+        )
+        all_owners = np.concatenate(
+            [owners, np.array([o for group in recent.values() for o in group], dtype=np.int32)]
+        )
+        order = np.argsort(all_hashes, kind="stable")
+        return all_hashes[order], all_owners[order]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        terms: Sequence[str],
+        hashes: np.ndarray,
+        owners: np.ndarray,
+        *,
+        max_distance: int = 2,
+        prefix_length: int = 6,
+    ) -> DeletionIndex:
+        """
+        Read-only index over `terms` from arrays written by arrays(),
+        with owners renumbered to positions in `terms`.
+        """
+        index = cls(max_distance=max_distance, prefix_length=prefix_length)
+        index.terms = terms  # type: ignore[assignment]
+        index._parts = (hashes, owners, {})
+        return index
+
+    def lookup(
+        self,
+        word: str,
+        doc_freqs: Mapping[str, int],
+        *,
+        max_distance: int | None = None,
+        limit: int = 8,
+    ) -> list[tuple[str, int, int]]:
+        """
+        Indexed terms within `max_distance` edits of `word` that occur in
+        `doc_freqs`, as (term, distance, df): closest first, then most
+        frequent.
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        max_distance = min(max_distance, self.max_distance)
+
+        hashes, owners, recent = self._parts
+        probes = [_hash(d) for d in _deletes(word[: self.prefix_length], max_distance)]
+        probe_array = np.array(probes, dtype=np.int64)
+        starts = np.searchsorted(hashes, probe_array, side="left").tolist()
+        ends = np.searchsorted(hashes, probe_array, side="right").tolist()
+
+        candidates = set(
+            np.concatenate(
+                [owners[s:e] for s, e in zip(starts, ends, strict=True)]
+            ).tolist()
+        )
+        if recent:
+            for probe in probes:
+                candidates.update(recent.get(probe, ()))
+
+        matches: dict[str, tuple[str, int, int]] = {}
+        for i in candidates:
+            term = self.terms[i]
+            if term in matches:
+                continue
+            distance = edit_distance(word, term, max_distance)
+            if distance is None:
+                continue
+            df = doc_freqs.get(term, 0)
+            if df > 0:
+                matches[term] = (term, distance, df)
+
+        return sorted(matches.values(), key=lambda m: (m[1], -m[2], m[0]))[:limit]
@@ -0,0 +1,249 @@
+# scout/index/impact.py
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from .inverted import InvertedIndex
+
+# Champion list length: how deep into each impact-ordered list the first
+# pass reads before the exactness check.
+DEFAULT_CHAMPIONS = 64
+# Postings an ImpactIndex keeps in built lists before evicting the least
+# recently used ones.
+MAX_CACHED_POSTINGS = 1_000_000
+
+
+class ImpactList:
+    """
+    One term's postings ordered by BM25 impact, highest first.
+
+    The first `champions` entries are the term's champion list. Impacts
+    and term frequencies by doc id are looked up through a position map
+    built on first use.
+    """
+
+    def __init__(self, doc_ids: list[Any], impacts: np.ndarray, tfs: np.ndarray) -> None:
+        self.doc_ids = doc_ids
+        self.impacts = impacts
+        self.tfs = tfs
+        self._table: tuple[dict[Any, int], list[float], list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def impact_of(self, doc_id: Any) -> float | None:
+        positions, impacts, _ = self._lookup()
+        i = positions.get(doc_id)
+        return None if i is None else impacts[i]
+
+    def frequencies(self) -> Mapping[Any, int]:
+        """Term frequency by doc id, read through the same position map."""
+        positions, _, tfs = self._lookup()
+        return _Frequencies(positions, tfs)
+
+    def _lookup(self) -> tuple[dict[Any, int], list[float], list[int]]:
+        table = self._table
+        if table is None:
+            positions = {doc_id: i for i, doc_id in enumerate(self.doc_ids)}
+            table = self._table = (positions, self.impacts.tolist(), self.tfs.tolist())
+        return table
+
+    def bound_after(self, depth: int) -> float:
+        """Largest impact of any posting past the first `depth`."""
+        return float(self.impacts[depth]) if depth < len(self.impacts) else 0.0
+
+
+class _Frequencies(Mapping[Any, int]):
+    def __init__(self, positions: dict[Any, int], tfs: list[int]) -> None:
+        self._positions = positions
+        self._tfs = tfs
+
+    def __getitem__(self, doc_id: Any) -> int:
+        return self._tfs[self._positions[doc_id]]
+
+    def get(self, doc_id: Any, default: Any = None) -> Any:
+        i = self._positions.get(doc_id)
+        return default if i is None else self._tfs[i]
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._positions
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+@dataclass(frozen=True)
+class ImpactHits:
+    """Top-k (doc_id, score) pairs and whether they are provably exact."""
+
+    hits: list[tuple[Any, float]]
+    exact: bool
+    candidates: int
+    depth: int
+
+
+class ImpactIndex:
+    """
+    Impact-ordered postings for BM25 over one index generation.
+
+    A posting's impact is its term's BM25 contribution, which depends
+    only on (tf, doc length, df) and so is fixed for a generation. Lists
+    are built per term on first use and cached.
+
+    top_k() scores the union of every query term's champion list
+    exactly, then checks it: a document outside all of them scores at
+    most the sum of the impacts just past each list's cut-off. If the
+    k-th best candidate beats that bound, or every list that could hold
+    an unseen match has been read in full, the result is exact;
+    otherwise the depth doubles (or, with `exact=False`, the
+    approximate result is returned as is).
+
+    Built lists are kept least recently used first and evicted once they
+    hold more than `max_postings` postings in all.
+    """
+
+    def __init__(
+        self,
+        index: InvertedIndex,
+        *,
+        k1: float = 1.5,
+        b: float = 0.75,
+        max_postings: int = MAX_CACHED_POSTINGS,
+    ) -> None:
+        self.index = index
+        self.k1 = k1
+        self.b = b
+        self.max_postings = max_postings
+        self._lists: OrderedDict[str, ImpactList] = OrderedDict()
+        self._cached_postings = 0
+        self._lock = threading.Lock()
+
+    def postings(self, term: str) -> ImpactList:
+        with self._lock:
+            cached = self._lists.get(term)
+            if cached is not None:
+                self._lists.move_to_end(term)
+                return cached
+
+        postings = self.index.get_postings(term)
+        stats = self.index.stats
+        n = stats.total_docs
+        avg_dl = stats.avg_doc_length
+        df = self.index.doc_freqs.get(term, 0)
+
+        doc_ids = [doc_id for doc_id, _ in postings]
+        tfs = np.fromiter((tf for _, tf in postings), dtype=np.float64, count=len(postings))
+        lengths = np.fromiter(
+            stats.doc_lengths.get_many(doc_ids, avg_dl),
+            dtype=np.float64,
+            count=len(doc_ids),
+        )
+        # Same formula, and so the same floats, as BM25Ranking.
+        idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0) if df else 0.0
+        denom = tfs + self.k1 * (1 - self.b + self.b * (lengths / avg_dl))
+        impacts = idf * (tfs * (self.k1 + 1) / denom)
+
+        order = np.argsort(-impacts, kind="stable")
+        built = ImpactList(
+            [doc_ids[i] for i in order.tolist()],
+            impacts[order],
+            tfs[order].astype(np.int64),
+        )
+        with self._lock:
+            cached = self._lists.get(term)
+            if cached is not None:
+                return cached
+            self._lists[term] = built
+            self._cached_postings += len(built)
+            # The newest list stays even if it alone exceeds the cap.
+            while self._cached_postings > self.max_postings and len(self._lists) > 1:
+                _, evicted = self._lists.popitem(last=False)
+                self._cached_postings -= len(evicted)
+            return built
+
+    def top_k(
+        self,
+        query_tokens: Sequence[str],
+        k: int,
+        *,
+        require_all: bool = True,
+        champions: int = DEFAULT_CHAMPIONS,
+        exact: bool = True,
+    ) -> ImpactHits:
+        """
+        Best `k` documents by summed BM25 impact, ties by doc id.
+
+        With `require_all`, only documents containing every token count
+        (the engine's default AND semantics).
+        """
+        tokens = list(dict.fromkeys(query_tokens))
+        lists = [self.postings(t) for t in tokens]
+        if k <= 0 or not lists or (require_all and not all(lists)):
+            return ImpactHits([], True, 0, 0)
+
+        depth = max(champions, k)
+        # Every document holding all tokens is in the shortest list, so
+        # once that is read in full no match is left unseen.
+        lengths = [len(lst) for lst in lists]
+        complete = min(lengths) if require_all else max(lengths)
+        scores: dict[Any, float | None] = {}  # None: misses a required token
+        while True:
+            for lst in lists:
+                for doc_id in lst.doc_ids[:depth]:
+                    if doc_id not in scores:
+                        scores[doc_id] = self._score(doc_id, lists, require_all)
+
+            ranked = sorted(
+                ((d, s) for d, s in scores.items() if s is not None),
+                key=lambda hit: (-hit[1], hit[0]),
+            )[:k]
+            bound = sum(lst.bound_after(depth) for lst in lists)
+            proven = depth >= complete or (len(ranked) == k and ranked[-1][1] > bound)
+            if proven or not exact:
+                return ImpactHits(ranked, proven, len(scores), depth)
+            depth *= 2
+
+    @staticmethod
+    def _score(doc_id: Any, lists: list[ImpactList], require_all: bool) -> float | None:
+        total = 0.0
+        for lst in lists:
+            impact = lst.impact_of(doc_id)
+            if impact is None:
+                if require_all:
+                    return None
+                continue
+            total += impact
+        return total
+
+
+_cache: WeakKeyDictionary[InvertedIndex, tuple[tuple[Any, ...], ImpactIndex]] = WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+
+def impact_index(index: InvertedIndex, *, k1: float = 1.5, b: float = 0.75) -> ImpactIndex:
+    """
+    The ImpactIndex for `index`'s current generation, shared by callers.
+
+    Rebuilt (lazily, term by term) whenever the index has gained
+    documents since it was made.
+    """
+    key = (index.stats.total_docs, index.stats.total_length, k1, b)
+    with _cache_lock:
+        cached = _cache.get(index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        impacts = ImpactIndex(index, k1=k1, b=b)
+        _cache[index] = (key, impacts)
+        return impacts
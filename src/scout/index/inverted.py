@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterable, MutableMapping, Sequence
 from typing import Any
 
+from .columns import ColumnStore, plain_metadata
+from .fuzzy import DeletionIndex
+from .layered import LayeredDict, SharedList
 from .stats import IndexStats
+from .terms import TermDictionary
 
 Posting = tuple[int, int]  # (doc_id, term_frequency)
+DocumentInput = tuple[int, list[str], dict[str, Any] | None]  # (doc_id, tokens, metadata)
 
 
 class InvertedIndex:
@@ -18,33 +24,179 @@ class InvertedIndex:
     """
 
     def __init__(self) -> None:
-        self.index: dict[str, list[Posting]] = defaultdict(list)
-        self.doc_freqs: dict[str, int] = defaultdict(int)
-        self.documents: dict[int, dict] = {}
+        # Layered maps and shared postings lists make fork() cost
+        # O(changes) rather than O(index size).
+        self.index: LayeredDict[str, SharedList[Posting]] = LayeredDict()
+        self.doc_freqs: LayeredDict[str, int] = LayeredDict(default=int)
+        # A LayeredDict, or StoredDocuments when loaded with a doc store.
+        self.documents: MutableMapping[int, dict[str, Any]] = LayeredDict()
         self.stats = IndexStats()
+        self.columns = ColumnStore()
+        # Built on first prefix lookup, then updated from the terms whose
+        # df changed since (and shared with forks, as it is immutable).
+        self._term_dictionary: TermDictionary | None = None
+        self._changed_terms: set[str] = set()
+        # Built on first fuzzy lookup (or by SearchEngine.prepare_fuzzy),
+        # then kept up to date with new terms, shared with forks (lookups
+        # check terms against doc_freqs) and saved with the index.
+        self._deletions: DeletionIndex | None = None
 
     def add_document(
         self,
         doc_id: int,
         tokens: list[str],
-        metadata: dict | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> None:
-        self.documents[doc_id] = metadata or {}
+        self.documents[doc_id] = plain_metadata(metadata)
+        self.columns.add(doc_id, metadata)
 
         token_counts: dict[str, int] = {}
         for token in tokens:
             token_counts[token] = token_counts.get(token, 0) + 1
+        self.terms_changed(token_counts)
 
+        deletions = self._deletions
+        new_terms = (
+            [t for t in token_counts if not self.doc_freqs.get(t)]
+            if deletions is not None
+            else []
+        )
         for token, freq in token_counts.items():
-            self.index[token].append((doc_id, freq))
+            self._append_postings(token, [(doc_id, freq)])
             self.doc_freqs[token] += 1
+        if deletions is not None and new_terms:
+            deletions.add(new_terms)
 
         self.stats.add_document(doc_id, len(tokens))
 
-    def get_postings(self, token: str) -> list[Posting]:
-        return self.index.get(token, [])
+    def add_documents(self, documents: Iterable[DocumentInput]) -> list[int]:
+        """
+        Add many documents at once.
+
+        Postings are grouped per term and appended with one extend per
+        term; doc_freqs and stats are updated in bulk. Returns the ids
+        added, in order.
+        """
+        new_postings: dict[str, list[Posting]] = defaultdict(list)
+        lengths: list[tuple[int, int]] = []
+        doc_ids: list[int] = []
+
+        for doc_id, tokens, metadata in documents:
+            self.documents[doc_id] = plain_metadata(metadata)
+            self.columns.add(doc_id, metadata)
+            for token, freq in Counter(tokens).items():
+                new_postings[token].append((doc_id, freq))
+            lengths.append((doc_id, len(tokens)))
+            doc_ids.append(doc_id)
+
+        self.terms_changed(new_postings)
+        deletions = self._deletions
+        new_terms = (
+            [t for t in new_postings if not self.doc_freqs.get(t)]
+            if deletions is not None
+            else []
+        )
+        for token, postings in new_postings.items():
+            self._append_postings(token, postings)
+            self.doc_freqs[token] += len(postings)
+        if deletions is not None and new_terms:
+            deletions.add(new_terms)
+
+        self.stats.add_documents(lengths)
+        return doc_ids
+
+    def fork(self) -> InvertedIndex:
+        """
+        Copy-on-write clone for building the next generation of an index.
+
+        Maps are forked as LayeredDicts and postings lists are shared
+        SharedList views, so a fork costs O(log n) and neither copy ever
+        sees the other's later writes.
+        """
+        forked = InvertedIndex()
+        forked.index = self.index.fork()
+        forked.doc_freqs = self.doc_freqs.fork()
+        forked.documents = self.documents.copy()  # type: ignore[attr-defined]
+        forked.stats = self.stats.copy()
+        forked.columns = self.columns.fork()
+        forked._term_dictionary = self._term_dictionary
+        forked._changed_terms = set(self._changed_terms)
+        forked._deletions = self._deletions
+        return forked
+
+    def _append_postings(self, token: str, postings: list[Posting]) -> None:
+        current = self.index.get(token)
+        self.index[token] = (
+            current.extended(postings) if current is not None else SharedList(list(postings))
+        )
 
-    def get_document(self, doc_id: int) -> dict:
+    def get_postings(self, token: str) -> Sequence[Posting]:
+        # A read-only view: the list is shared with forks.
+        postings: SharedList[Posting] | None = self.index.get(token)
+        return postings if postings is not None else []
+
+    def terms_changed(self, terms: Iterable[str] | None = None) -> None:
+        """
+        Note that the df of `terms` (None: of any term) changed, for
+        callers that write doc_freqs directly.
+        """
+        dictionary = self._term_dictionary
+        if dictionary is None:
+            return
+        changed = self._changed_terms
+        if terms is not None:
+            changed.update(terms)
+        if terms is None or len(changed) > dictionary.overlay_limit():
+            # Cheaper to rebuild on the next prefix lookup than to track.
+            self._term_dictionary = None
+            self._changed_terms = set()
+
+    def term_dictionary(self) -> TermDictionary:
+        """Sorted term dictionary for prefix queries and autocomplete."""
+        dictionary = self._term_dictionary
+        if dictionary is not None and not self._changed_terms:
+            return dictionary
+        changed, self._changed_terms = self._changed_terms, set()
+        if dictionary is None:
+            dictionary = TermDictionary(self.doc_freqs)
+        else:
+            dictionary = dictionary.updated(self.doc_freqs, list(changed))
+        self._term_dictionary = dictionary
+        return dictionary
+
+    def deletion_index(self) -> DeletionIndex:
+        """Deletion index over the vocabulary for typo-tolerant lookups."""
+        if self._deletions is None:
+            self._deletions = DeletionIndex(
+                t for t, df in self.doc_freqs.items() if df > 0
+            )
+        return self._deletions
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_term_dictionary"] = None
+        state["_changed_terms"] = set()
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written before layered maps, metadata columns or the
+        # term and deletion indexes.
+        state.pop("_owned_terms", None)
+        if not isinstance(state["index"], LayeredDict):
+            state["index"] = LayeredDict(
+                {term: SharedList(list(p)) for term, p in state["index"].items()}
+            )
+            state["doc_freqs"] = LayeredDict(state["doc_freqs"], default=int)
+        if isinstance(state["documents"], dict):
+            state["documents"] = LayeredDict(state["documents"])
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_term_dictionary", None)
+        self.__dict__.setdefault("_changed_terms", set())
+        self.__dict__.setdefault("_deletions", None)
+        if "columns" not in state:
+            self.columns = ColumnStore.from_documents(self.documents)
+
+    def get_document(self, doc_id: int) -> dict[str, Any]:
         return self.documents.get(doc_id, {})
 
     def document_contains(self, doc_id: int, token: str) -> bool:
@@ -57,30 +209,32 @@ class InvertedIndex:
     # Snapshot / persistence API
     # ----------------------------
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
+    def to_dict(self, *, include_documents: bool = True) -> dict[str, Any]:
+        data: dict[str, Any] = {
             "index": {
-                term: list(postings)
+                term: postings.tolist()
                 for term, postings in sorted(self.index.items())
             },
             "doc_freqs": dict(self.doc_freqs),
-            "documents": self.documents,
             "stats": self.stats.to_dict(),
         }
+        if include_documents:
+            data["documents"] = dict(self.documents)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> InvertedIndex:
         index = cls()
 
-        index.index = defaultdict(
-            list,
+        index.index = LayeredDict(
             {
-                term: [tuple(p) for p in postings]
+                term: SharedList([tuple(p) for p in postings])
                 for term, postings in data["index"].items()
-            },
+            }
         )
-        index.doc_freqs = defaultdict(int, data["doc_freqs"])
-        index.documents = data["documents"]
+        index.doc_freqs = LayeredDict(data["doc_freqs"], default=int)
+        index.documents = LayeredDict(data.get("documents", {}))
+        index.columns = ColumnStore.from_documents(index.documents)
         index.stats = IndexStats.from_dict(data["stats"])
 
         return index
@@ -0,0 +1,313 @@
+# scout/index/layered.py
+
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from itertools import islice
+from typing import Any, Generic, TypeVar, overload
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+_MISSING: Any = object()
+# Marks a key deleted in a layer that shadows older ones.
+_DELETED: Any = object()
+
+
+class LayeredDict(MutableMapping[K, V], Generic[K, V]):
+    """
+    Dict whose fork() costs O(changes), not O(size).
+
+    Entries live in a stack of dicts: a small writable top and frozen
+    layers below it, newest first. fork() copies the top into a new
+    frozen layer of the fork and shares the layers below, without
+    touching the source. Layers are merged as in a log-structured
+    merge tree: a layer is folded into the next older one once it holds
+    at least half as many entries, so there are O(log n) layers and each
+    entry is copied O(log n) times over its life.
+
+    `default` plays the role of a defaultdict factory for `d[key]`, but
+    the value it makes is not stored, so reads never write.
+
+    Like the rest of a forked index, a LayeredDict may be read from any
+    thread but written (and forked) by one writer at a time.
+    """
+
+    __slots__ = ("_top", "_layers", "_maps", "_len", "_deletes", "default")
+
+    def __init__(
+        self,
+        data: Mapping[K, V] | Iterable[tuple[K, V]] | None = None,
+        *,
+        default: Callable[[], V] | None = None,
+    ) -> None:
+        self._top: dict[K, V] = dict(data or {})
+        self._layers: tuple[dict[K, V], ...] = ()
+        # (top, *layers), swapped as one reference so readers never see
+        # a half-updated stack.
+        self._maps: tuple[dict[K, V], ...] = (self._top,)
+        self._len = len(self._top)
+        # Whether any layer holds a deletion marker.
+        self._deletes = False
+        self.default = default
+
+    # ----------------------------
+    # Reads
+    # ----------------------------
+
+    def __getitem__(self, key: K) -> V:
+        for layer in self._maps:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                if value is _DELETED:
+                    break
+                return value  # type: ignore[no-any-return]
+        if self.default is not None:
+            return self.default()
+        raise KeyError(key)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        for layer in self._maps:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return default if value is _DELETED else value
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        maps = self._maps
+        if not self._deletes:
+            # Without deletions any layer holding the key decides; the
+            # oldest is the largest.
+            return any(key in layer for layer in reversed(maps))
+        for layer in maps:
+            value = layer.get(key, _MISSING)  # type: ignore[arg-type]
+            if value is not _MISSING:
+                return value is not _DELETED
+        return False
+
+    def get_many(self, keys: Sequence[K], default: Any = None) -> list[Any]:
+        """`[self.get(k, default) for k in keys]`, resolving whole layers at once."""
+        *newer, oldest = self._maps
+        if newer:
+            wanted = set(keys)
+            found: dict[K, V] = {}
+            for layer in reversed(newer):
+                for key in layer.keys() & wanted:
+                    found[key] = layer[key]
+            if found:
+                get = oldest.get
+                values = [found[k] if k in found else get(k, default) for k in keys]
+                if self._deletes:
+                    values = [default if v is _DELETED else v for v in values]
+                return values
+        get = oldest.get
+        values = [get(k, default) for k in keys]
+        if self._deletes:
+            values = [default if v is _DELETED else v for v in values]
+        return values
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _flat(self) -> dict[K, V]:
+        *newer, oldest = self._maps
+        if not newer and not self._deletes:
+            return oldest
+        flat = dict(oldest)
+        for layer in reversed(newer):
+            flat.update(layer)
+        if self._deletes:
+            flat = {k: v for k, v in flat.items() if v is not _DELETED}
+        return flat
+
+    def __iter__(self) -> Iterator[K]:
+        # Iterate a copy: the top may change while a caller iterates.
+        return iter(list(self._flat()))
+
+    def __reversed__(self) -> Iterator[K]:
+        return reversed(list(self._flat()))
+
+    def items(self) -> Any:
+        return list(self._flat().items())
+
+    def values(self) -> Any:
+        return list(self._flat().values())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LayeredDict):
+            other = other._flat()
+        return self._flat() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._flat()!r})"
+
+    # ----------------------------
+    # Writes
+    # ----------------------------
+
+    def __setitem__(self, key: K, value: V) -> None:
+        top = self._top
+        if key not in top:
+            if not self._in_layers(key):
+                self._len += 1
+        elif top[key] is _DELETED:
+            self._len += 1
+        top[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        top = self._top
+        if key in top and top[key] is not _DELETED:
+            present = True
+        else:
+            present = key not in top and self._in_layers(key)
+        if not present:
+            raise KeyError(key)
+        if self._layers:
+            top[key] = _DELETED
+            self._deletes = True
+        else:
+            del top[key]
+        self._len -= 1
+
+    def _in_layers(self, key: K) -> bool:
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value is not _DELETED
+        return False
+
+    def clear(self) -> None:
+        self._top = {}
+        self._layers = ()
+        self._maps = (self._top,)
+        self._len = 0
+        self._deletes = False
+
+    def update(self, other: Any = (), /, **kwargs: V) -> None:
+        if not self._len and not kwargs and isinstance(other, dict):
+            # Bulk load into an empty dict.
+            self._top = dict(other)
+            self._layers = ()
+            self._maps = (self._top,)
+            self._len = len(self._top)
+            self._deletes = False
+            return
+        super().update(other, **kwargs)
+
+    # ----------------------------
+    # Forking
+    # ----------------------------
+
+    def fork(self) -> LayeredDict[K, V]:
+        """
+        Independent copy sharing every current entry.
+
+        `self` is left untouched, so a published dict can be forked while
+        readers use it: the copy gets a snapshot of the top (the entries
+        written since the last fork) as its newest layer, and `self`
+        keeps writing to its own.
+        """
+        layers = self._layers
+        deletes = self._deletes
+        if self._top:
+            layers = (dict(self._top), *layers)
+            while len(layers) > 1 and 2 * len(layers[0]) >= len(layers[1]):
+                merged = {**layers[1], **layers[0]}
+                if len(layers) == 2 and deletes:
+                    merged = {k: v for k, v in merged.items() if v is not _DELETED}
+                layers = (merged, *layers[2:])
+            if deletes and len(layers) == 1:
+                deletes = False
+
+        forked = LayeredDict.__new__(LayeredDict)
+        forked._top = {}
+        forked._layers = layers
+        forked._maps = (forked._top, *layers)
+        forked._len = self._len
+        forked._deletes = deletes
+        forked.default = self.default
+        return forked
+
+    copy = fork
+
+    def __reduce__(self) -> Any:
+        return (_rebuild_layered, (self._flat().copy(), self.default))
+
+
+def _rebuild_layered(
+    data: dict[Any, Any], default: Callable[[], Any] | None
+) -> LayeredDict[Any, Any]:
+    return LayeredDict(data, default=default)
+
+
+class SharedList(Sequence[T]):
+    """
+    The first `len(self)` items of a list that forks append to in place.
+
+    extended() appends to the shared list only while nobody else has
+    appended past this view's end (the rule Go slices follow, as Column
+    does for its buffers); otherwise it copies first. Earlier views never
+    see the new items, so appending costs O(new items) without copying.
+    """
+
+    __slots__ = ("_items", "_size")
+
+    def __init__(self, items: list[T] | None = None, size: int | None = None) -> None:
+        self._items: list[T] = items if items is not None else []
+        self._size = len(self._items) if size is None else size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SharedList index out of range")
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._items, self._size)
+
+    def tolist(self) -> list[T]:
+        return self._items[: self._size]
+
+    def extended(self, values: Iterable[T]) -> SharedList[T]:
+        items = self._items
+        if len(items) != self._size:
+            items = items[: self._size]
+        items.extend(values)
+        return SharedList(items, len(items))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SharedList):
+            return self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+    def __reduce__(self) -> Any:
+        return (SharedList, (self.tolist(),))
@@ -1,7 +1,10 @@
 # scout/index/stats.py
 
+from collections.abc import Iterable
 from typing import Any
 
+from .layered import LayeredDict
+
 
 class IndexStats:
     """
@@ -9,21 +12,41 @@ class IndexStats:
     """
 
     def __init__(self) -> None:
-        self.doc_lengths: dict[int, int] = {}
+        self.doc_lengths: LayeredDict[int, int] = LayeredDict()
         self.total_docs: int = 0
+        self.total_length: int = 0
 
     def add_document(self, doc_id: int, length: int) -> None:
+        self.total_length += length - self.doc_lengths.get(doc_id, 0)
         self.doc_lengths[doc_id] = length
         self.total_docs += 1
 
+    def add_documents(self, lengths: Iterable[tuple[int, int]]) -> None:
+        doc_lengths = self.doc_lengths
+        for doc_id, length in lengths:
+            self.total_length += length - doc_lengths.get(doc_id, 0)
+            doc_lengths[doc_id] = length
+            self.total_docs += 1
+
     def get_doc_length(self, doc_id: int) -> int:
-        return self.doc_lengths.get(doc_id, 0)
+        return int(self.doc_lengths.get(doc_id, 0))
+
+    def copy(self) -> "IndexStats":
+        stats = IndexStats()
+        stats.doc_lengths = self.doc_lengths.fork()
+        stats.total_docs = self.total_docs
+        stats.total_length = self.total_length
+        return stats
+
+    def df_cutoff(self, max_df_ratio: float) -> int:
+        """Highest document frequency within `max_df_ratio` of the corpus."""
+        return max(1, int(max_df_ratio * self.total_docs))
 
     @property
     def avg_doc_length(self) -> float:
         if not self.doc_lengths:
             return 1.0
-        return sum(self.doc_lengths.values()) / self.total_docs
+        return self.total_length / self.total_docs
 
     # ----------------------------
     # Snapshot/persistence API
@@ -31,13 +54,26 @@ class IndexStats:
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "doc_lengths": self.doc_lengths,
+            "doc_lengths": dict(self.doc_lengths),
             "total_docs": self.total_docs,
+            "total_length": self.total_length,
         }
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Pickles written before total_length was tracked or doc_lengths
+        # became a LayeredDict.
+        if isinstance(state["doc_lengths"], dict):
+            state["doc_lengths"] = LayeredDict(state["doc_lengths"])
+        self.__dict__.update(state)
+        if "total_length" not in state:
+            self.total_length = sum(self.doc_lengths.values())
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "IndexStats":
         stats = cls()
-        stats.doc_lengths = data["doc_lengths"]
+        stats.doc_lengths = LayeredDict(data["doc_lengths"])
         stats.total_docs = data["total_docs"]
+        stats.total_length = data.get(
+            "total_length", sum(stats.doc_lengths.values())
+        )
         return stats
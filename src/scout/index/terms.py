@@ -0,0 +1,178 @@
+# scout/index/terms.py
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+# Prefixes matching more terms than this get their top completions
+# precomputed; smaller ranges are ranked on demand with argpartition.
+# TOP_PER_NODE also caps prefix expansion in queries, so those are served
+# from the precomputed lists.
+SCAN_LIMIT = 1024
+TOP_PER_NODE = 64
+# updated() keeps changed terms in an overlay until it holds more than
+# OVERLAY_MIN terms or 1/OVERLAY_FRACTION of the dictionary, then rebuilds.
+OVERLAY_MIN = 1024
+OVERLAY_FRACTION = 8
+
+
+def _prefix_end(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class TermDictionary:
+    """
+    Sorted term dictionary for prefix expansion and autocomplete.
+
+    Terms are kept in a sorted list next to a NumPy array of document
+    frequencies, so every prefix maps to one contiguous range found by
+    binary search. Prefix nodes whose range holds more than SCAN_LIMIT
+    terms store their TOP_PER_NODE completions by df; any other range is
+    small enough to rank directly. Either way a lookup touches at most
+    SCAN_LIMIT entries.
+
+    A dictionary is never modified. updated() returns one that shares
+    these arrays and lists the terms whose df changed since in a small
+    overlay, so following a growing index does not re-sort it.
+    """
+
+    def __init__(self, doc_freqs: Mapping[str, int]) -> None:
+        self.terms: list[str] = sorted(t for t, df in doc_freqs.items() if df > 0)
+        self.dfs = np.fromiter(
+            (doc_freqs[t] for t in self.terms), dtype=np.int64, count=len(self.terms)
+        )
+        self._top: dict[str, np.ndarray] = {}
+        if len(self.terms) > SCAN_LIMIT:
+            self._top[""] = self._rank(0, len(self.terms), TOP_PER_NODE)
+            self._build_nodes(0, len(self.terms), 1)
+        # Overlay: current df of every changed term, and the changed terms
+        # split into sorted lists of those in `terms` and those added since.
+        self._changed_dfs: dict[str, int] = {}
+        self._changed: list[str] = []
+        self._added: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.terms) + len(self._added)
+
+    def overlay_limit(self) -> int:
+        """Changed terms updated() absorbs before rebuilding instead."""
+        return max(OVERLAY_MIN, len(self.terms) // OVERLAY_FRACTION)
+
+    def updated(self, doc_freqs: Mapping[str, int], changed: Iterable[str]) -> TermDictionary:
+        """Dictionary for `doc_freqs`, which differs from ours only in `changed`."""
+        changed_dfs = dict(self._changed_dfs)
+        for term in changed:
+            changed_dfs[term] = doc_freqs.get(term, 0)
+        if len(changed_dfs) > self.overlay_limit():
+            return TermDictionary(doc_freqs)
+
+        updated = TermDictionary.__new__(TermDictionary)
+        updated.terms = self.terms
+        updated.dfs = self.dfs
+        updated._top = self._top
+        updated._changed_dfs = changed_dfs
+        updated._changed = []
+        updated._added = []
+        for term in sorted(changed_dfs):
+            i = bisect.bisect_left(self.terms, term)
+            if i < len(self.terms) and self.terms[i] == term:
+                updated._changed.append(term)
+            elif changed_dfs[term] > 0:
+                updated._added.append(term)
+        return updated
+
+    def _build_nodes(self, lo: int, hi: int, depth: int) -> None:
+        terms = self.terms
+        start = lo
+        while start < hi:
+            term = terms[start]
+            if len(term) < depth:
+                start += 1
+                continue
+            prefix = term[:depth]
+            end = bisect.bisect_left(terms, _prefix_end(prefix), start, hi)
+            if end - start > SCAN_LIMIT:
+                self._top[prefix] = self._rank(start, end, TOP_PER_NODE)
+                self._build_nodes(start, end, depth + 1)
+            start = end
+
+    def _rank(self, lo: int, hi: int, k: int) -> np.ndarray:
+        """Indices of the top-k terms in [lo, hi) by df, ties by term."""
+        dfs = self.dfs[lo:hi]
+        if k < len(dfs):
+            kth = np.partition(dfs, len(dfs) - k)[len(dfs) - k]
+            above = np.flatnonzero(dfs > kth)
+            # Ties at the k-th df (common at df=1) go by term, which is
+            # index order, so only the first few of them can make it.
+            ties = np.flatnonzero(dfs == kth)[: k - len(above)]
+            candidates = np.concatenate([above, ties])
+        else:
+            candidates = np.arange(len(dfs))
+        order = np.lexsort((candidates, -dfs[candidates]))
+        return lo + candidates[order[:k]]
+
+    def prefix_range(self, prefix: str) -> tuple[int, int]:
+        if not prefix:
+            return 0, len(self.terms)
+        lo = bisect.bisect_left(self.terms, prefix)
+        hi = bisect.bisect_left(self.terms, _prefix_end(prefix), lo)
+        return lo, hi
+
+    def complete(self, prefix: str, k: int = 10) -> list[tuple[str, int]]:
+        """Top-k (term, df) pairs starting with `prefix`, most frequent first."""
+        if k <= 0:
+            return []
+        lo, hi = self.prefix_range(prefix)
+        changed = _in_range(self._changed, prefix)
+        added = _in_range(self._added, prefix)
+        if lo == hi and not added:
+            return []
+
+        # Terms whose df changed can only displace the others, so the
+        # top k by current df lie within the top k + len(changed) by the
+        # df stored in `dfs`, plus the changed and added terms.
+        wanted = k + len(changed)
+        top = self._top.get(prefix)
+        if lo == hi:
+            indices = []
+        elif top is not None and wanted <= len(top):
+            indices = top[:wanted].tolist()
+        else:
+            indices = self._rank(lo, hi, wanted).tolist()
+        completions = [(self.terms[i], int(self.dfs[i])) for i in indices]
+        if not (changed or added):
+            return completions
+
+        changed_dfs = self._changed_dfs
+        completions = [item for item in completions if item[0] not in changed_dfs]
+        completions.extend((t, changed_dfs[t]) for t in changed + added if changed_dfs[t] > 0)
+        completions.sort(key=lambda item: (-item[1], item[0]))
+        return completions[:k]
+
+    def expand(self, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Terms starting with `prefix`: all of them, or the `limit` most
+        frequent.
+        """
+        if limit is not None:
+            return [term for term, _ in self.complete(prefix, limit)]
+        lo, hi = self.prefix_range(prefix)
+        terms = self.terms[lo:hi]
+        if self._changed_dfs:
+            dropped = {t for t in _in_range(self._changed, prefix) if not self._changed_dfs[t]}
+            added = _in_range(self._added, prefix)
+            if dropped or added:
+                terms = sorted([t for t in terms if t not in dropped] + added)
+        return terms
+
+
+def _in_range(terms: list[str], prefix: str) -> list[str]:
+    """The terms of sorted `terms` that start with `prefix`."""
+    if not prefix:
+        return terms
+    lo = bisect.bisect_left(terms, prefix)
+    return terms[lo : bisect.bisect_left(terms, _prefix_end(prefix), lo)]
@@ -0,0 +1,331 @@
+# scout/index/vectors.py
+
+from __future__ import annotations
+
+import math
+import threading
+import zlib
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .tokens import Tokenizer
+
+if TYPE_CHECKING:
+    from .bitmap import DocBitmap
+    from .columns import Column
+
+DEFAULT_DIM = 256
+# Brute force below this many rows; IVF training needs enough samples.
+MIN_TRAIN_ROWS = 1024
+# Retrain once a column has grown this much past its training size.
+RETRAIN_FACTOR = 4
+DEFAULT_N_PROBE = 8
+# Rows assigned since the lists were last rebuilt are scanned directly
+# until they exceed max(TAIL_MIN, rows // TAIL_FRACTION).
+TAIL_MIN = 1024
+TAIL_FRACTION = 8
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 64
+
+
+class HashingEmbedder:
+    """
+    Local, dependency-free text embedder using the hashing trick.
+
+    Each word and each character `ngram` of it (with boundary markers)
+    is hashed to a signed bucket of a `dim`-wide vector; counts are
+    log-scaled and the result L2-normalized. Texts sharing words or word
+    pieces ("index", "indexing") land close together. Stable across
+    processes: hashes are CRC32 of `seed` and the feature.
+    """
+
+    def __init__(
+        self,
+        dim: int = DEFAULT_DIM,
+        *,
+        ngram: int = 3,
+        ngram_weight: float = 0.5,
+        seed: int = 0,
+        tokenizer: Tokenizer | None = None,
+    ) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be > 0")
+        self.dim = dim
+        self.ngram = ngram
+        self.ngram_weight = ngram_weight
+        self.seed = seed
+        self._tokenizer = tokenizer or Tokenizer()
+        self._features: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _word_features(self, word: str) -> tuple[np.ndarray, np.ndarray]:
+        cached = self._features.get(word)
+        if cached is not None:
+            return cached
+
+        marked = f"<{word}>"
+        features = [(word, 1.0)] + [
+            (marked[i : i + self.ngram], self.ngram_weight)
+            for i in range(max(1, len(marked) - self.ngram + 1))
+        ]
+        hashes = np.array(
+            [zlib.crc32(f"{self.seed}:{f}".encode()) for f, _ in features], dtype=np.int64
+        )
+        signs = np.where(hashes & (1 << 31), -1.0, 1.0)
+        built = (hashes % self.dim, signs * np.array([w for _, w in features]))
+        with self._lock:
+            if len(self._features) > 1 << 20:
+                self._features.clear()
+            self._features[word] = built
+        return built
+
+    def embed_tokens(self, tokens: Iterable[str]) -> np.ndarray:
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        vector = np.zeros(self.dim, dtype=np.float64)
+        for word, count in counts.items():
+            buckets, weights = self._word_features(word)
+            np.add.at(vector, buckets, weights * (1.0 + math.log(count)))
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm > 0 else vector).astype(np.float32)
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_tokens(self._tokenizer.tokenize(text))
+
+    def embed_many(self, texts: Iterable[str]) -> np.ndarray:
+        rows = [self.embed(text) for text in texts]
+        return np.vstack(rows) if rows else np.zeros((0, self.dim), dtype=np.float32)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_features"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def add_embeddings(
+    records: Iterable[Mapping[str, Any]],
+    embedder: HashingEmbedder,
+    *,
+    source: str = "text",
+    field: str = "embedding",
+) -> list[dict[str, Any]]:
+    """Copies of `records` with `field` set to the embedding of `source`."""
+    return [
+        {**record, field: embedder.embed(record.get(source) or "")} for record in records
+    ]
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid (by inner product) per row; -1 for missing rows."""
+    assign = np.full(len(vectors), -1, dtype=np.int32)
+    present = ~np.isnan(vectors[:, 0]) if len(vectors) else np.zeros(0, dtype=bool)
+    if present.any():
+        assign[present] = np.argmax(vectors[present] @ centroids.T, axis=1)
+    return assign
+
+
+class IVFIndex:
+    """
+    Inverted-file ANN index over the rows of one vector column.
+
+    Rows are L2-normalized, so inner product is cosine similarity.
+    Training runs spherical k-means on a sample; every row is then
+    assigned to its nearest centroid ("list"). A search scores only the
+    rows in the `n_probe` lists whose centroids are closest to the
+    query.
+
+    The index follows its column incrementally: `sync` assigns rows
+    appended since the last call (and rows marked stale by an
+    overwrite). Arrays are replaced, never written in place, so forks
+    made with `fork()` can share them safely.
+    """
+
+    def __init__(self, centroids: np.ndarray, trained_rows: int) -> None:
+        self.centroids = centroids
+        self.trained_rows = trained_rows
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._stale: frozenset[int] = frozenset()
+        # (rows covered, row order grouped by list, list offsets)
+        self._lists: tuple[int, np.ndarray, np.ndarray] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        n_lists: int | None = None,
+        *,
+        iterations: int = _KMEANS_ITERATIONS,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Spherical k-means over a sample of `vectors` (missing rows skipped)."""
+        present = vectors[~np.isnan(vectors[:, 0])]
+        if not len(present):
+            raise ValueError("Cannot train an IVF index without vectors")
+        if n_lists is None:
+            n_lists = int(math.sqrt(len(present)))
+        n_lists = max(1, min(n_lists, len(present)))
+
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(present), n_lists * _KMEANS_SAMPLES_PER_LIST)
+        sample = present[rng.choice(len(present), sample_size, replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            norms = np.linalg.norm(sums, axis=1)
+            filled = norms > 0
+            # Empty lists keep their centroid.
+            centroids[filled] = sums[filled] / norms[filled, None]
+        index = cls(centroids.astype(np.float32), len(vectors))
+        index.sync(vectors)
+        return index
+
+    def fork(self) -> IVFIndex:
+        forked = IVFIndex.__new__(IVFIndex)
+        forked.__dict__.update(self.__dict__)
+        forked._lock = threading.Lock()
+        return forked
+
+    def with_stale(self, ordinal: int) -> IVFIndex:
+        """A fork that reassigns row `ordinal` on its next sync."""
+        forked = self.fork()
+        forked._stale = self._stale | {ordinal}
+        return forked
+
+    def sync(self, vectors: np.ndarray) -> None:
+        """Assign rows of `vectors` not yet assigned, and stale rows."""
+        with self._lock:
+            assigned = len(self._assign)
+            if len(vectors) > assigned:
+                self._assign = np.concatenate(
+                    [self._assign, _assign(vectors[assigned:], self.centroids)]
+                )
+            if self._stale:
+                stale = np.fromiter(sorted(self._stale), dtype=np.int64)
+                stale = stale[stale < len(vectors)]
+                assign = self._assign.copy()
+                assign[stale] = _assign(vectors[stale], self.centroids)
+                self._assign = assign
+                self._stale = frozenset()
+                self._lists = None
+
+            tail = len(self._assign) - (self._lists[0] if self._lists else 0)
+            if self._lists is None or tail > max(TAIL_MIN, len(self._assign) // TAIL_FRACTION):
+                order = np.argsort(self._assign, kind="stable")
+                counts = np.bincount(self._assign[self._assign >= 0], minlength=self.n_lists)
+                missing = int((self._assign < 0).sum())
+                offsets = np.concatenate([[missing], missing + np.cumsum(counts)])
+                self._lists = (len(self._assign), order, offsets)
+
+    def candidates(self, query: np.ndarray, rows: int, n_probe: int) -> np.ndarray:
+        """Rows (below `rows`) in the `n_probe` lists nearest to `query`."""
+        probe = np.argsort(-(self.centroids @ query), kind="stable")[:n_probe]
+        assert self._lists is not None
+        covered, order, offsets = self._lists
+        parts = [order[offsets[p] : offsets[p + 1]] for p in probe.tolist()]
+        if covered < len(self._assign):
+            tail = np.arange(covered, len(self._assign))
+            parts.append(tail[np.isin(self._assign[covered:], probe)])
+        found = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        return found[found < rows]
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+
+    def arrays(self, *, prefix: str = "") -> dict[str, np.ndarray]:
+        return {
+            f"{prefix}centroids": self.centroids,
+            f"{prefix}assign": self._assign,
+            f"{prefix}trained_rows": np.array(self.trained_rows, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(cls, data: Mapping[str, np.ndarray], *, prefix: str = "") -> IVFIndex:
+        index = cls(data[f"{prefix}centroids"], int(data[f"{prefix}trained_rows"]))
+        index._assign = data[f"{prefix}assign"]
+        return index
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_lists"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+_train_lock = threading.Lock()
+
+
+def ann_index(column: Column, *, n_lists: int | None = None) -> IVFIndex | None:
+    """
+    The column's IVF index, trained on first use and kept in sync.
+
+    None while the column has fewer than MIN_TRAIN_ROWS rows (search
+    brute-forces those). Retrained from scratch once the column has grown
+    RETRAIN_FACTOR times past the rows it was trained on.
+    """
+    vectors = column.values
+    if len(vectors) < MIN_TRAIN_ROWS:
+        return None
+    with _train_lock:
+        ann = column.ann
+        if ann is None or len(vectors) > RETRAIN_FACTOR * ann.trained_rows:
+            ann = column.ann = IVFIndex.train(vectors, n_lists)
+    ann.sync(vectors)
+    return ann
+
+
+def nearest(
+    column: Column,
+    query: np.ndarray,
+    k: int,
+    *,
+    exact: bool = False,
+    n_probe: int = DEFAULT_N_PROBE,
+    allowed: DocBitmap | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The `k` rows of `column` most similar to `query`, best first, as
+    (ordinals, cosine similarities); ties by ordinal.
+
+    `exact` scores every row (the recall baseline for IVF). `allowed`
+    (e.g. from evaluate_filters) restricts the result to its ordinals.
+    """
+    vectors = column.values
+    norm = np.linalg.norm(query)
+    query = (query / norm if norm > 0 else query).astype(np.float32)
+
+    ann = None if exact else ann_index(column)
+    if ann is None:
+        rows = np.arange(len(vectors))
+    else:
+        rows = ann.candidates(query, len(vectors), n_probe)
+    if allowed is not None:
+        rows = rows[allowed.contains_many(rows)]
+
+    scores = vectors[rows] @ query
+    present = ~np.isnan(scores)
+    rows, scores = rows[present], scores[present]
+    if k < len(rows):
+        top = np.argpartition(-scores, k - 1)[:k]
+        rows, scores = rows[top], scores[top]
+    order = np.lexsort((rows, -scores))
+    return rows[order], scores[order]
@@ -1,9 +1,16 @@
 # scout/ranking/base.py
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from scout.index.inverted import InvertedIndex
 
+if TYPE_CHECKING:
+    from .context import QueryContext
+
 
 class RankingResult:
     """
@@ -41,3 +48,20 @@ class RankingStrategy(ABC):
         doc_id: int,
     ) -> RankingResult:
         raise NotImplementedError
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        """
+        Score a batch of documents; results are in `doc_ids` order.
+
+        Strategies that can vectorize (e.g. over metadata columns)
+        override this; the default scores one document at a time.
+        `context` carries term data already fetched for this query by
+        other strategies (see QueryContext).
+        """
+        return [self.score(query_tokens, index, doc_id) for doc_id in doc_ids]
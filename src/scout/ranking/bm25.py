@@ -1,9 +1,13 @@
 # scout/ranking/bm25.py
 
 import math
+from collections.abc import Sequence
+
+import numpy as np
 
 from scout.index.inverted import InvertedIndex
 from scout.ranking.base import RankingResult, RankingStrategy
+from scout.ranking.context import QueryContext
 
 
 class BM25Ranking(RankingStrategy):
@@ -21,45 +25,60 @@ class BM25Ranking(RankingStrategy):
         index: InvertedIndex,
         doc_id: int,
     ) -> RankingResult:
-        total_score = 0.0
-        per_term: dict[str, dict[str, float]] = {}
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        context = QueryContext.ensure(context, query_tokens, index)
+        if not doc_ids:
+            return []
 
         N = index.stats.total_docs
         avg_dl = index.stats.avg_doc_length
-        doc_len = index.stats.doc_lengths.get(doc_id, avg_dl)
+        lengths = context.doc_lengths(doc_ids)
+        norm = self.k1 * (1 - self.b + self.b * (lengths / avg_dl))
 
+        totals = np.zeros(len(doc_ids), dtype=np.float64)
+        terms = []
         for token in query_tokens:
-            postings = index.get_postings(token)
-            tf = 0
-            for d_id, freq in postings:
-                if d_id == doc_id:
-                    tf = freq
-                    break
-
-            df = index.doc_freqs.get(token, 0)
-            if df == 0 or tf == 0:
+            df = context.doc_freq(token)
+            if df == 0:
                 continue
-
+            tfs = context.term_frequencies(token, doc_ids)
             idf = math.log((N - df + 0.5) / (df + 0.5) + 1.0)
-            denom = tf + self.k1 * (1 - self.b + self.b * (doc_len / avg_dl))
-            score = idf * (tf * (self.k1 + 1) / denom)
+            # Absent terms score 0 (even where the denominator is 0).
+            saturation = np.divide(
+                tfs * (self.k1 + 1),
+                tfs + norm,
+                out=np.zeros_like(tfs),
+                where=tfs > 0,
+            )
+            scores = idf * saturation
+            totals += scores
+            terms.append((token, float(df), idf, tfs.tolist(), scores.tolist()))
 
-            total_score += score
-            per_term[token] = {
-                "tf": float(tf),
-                "df": float(df),
-                "idf": float(idf),
-                "score": float(score),
+        results = []
+        for i, total_score in enumerate(totals.tolist()):
+            per_term: dict[str, dict[str, float]] = {
+                token: {"tf": tfs[i], "df": df, "idf": idf, "score": scores[i]}
+                for token, df, idf, tfs, scores in terms
+                if tfs[i]
             }
-
-        components = {
-            "bm25": total_score,
-            "k1": self.k1,
-            "b": self.b,
-        }
-
-        return RankingResult(
-            score=total_score,
-            components=components,
-            per_term=per_term,
-        )
+            components = {
+                "bm25": total_score,
+                "k1": self.k1,
+                "b": self.b,
+            }
+            results.append(
+                RankingResult(
+                    score=total_score,
+                    components=components,
+                    per_term=per_term,
+                )
+            )
+        return results
@@ -1,9 +1,11 @@
 # scout/ranking/composite.py
 
+from collections.abc import Sequence
 
 from scout.index.inverted import InvertedIndex
 
 from .base import RankingResult, RankingStrategy
+from .context import QueryContext
 from .recency import RecencyRanking
 
 
@@ -19,20 +21,44 @@ class CompositeRanking(RankingStrategy):
         self.recency = recency
 
     def score(self, query_tokens: list[str], index: InvertedIndex, doc_id: int) -> RankingResult:
-        total_score = 0.0
-        components = {}
-        per_term = {}
-
-        for strategy, weight in zip(self.strategies, self.weights, strict=True):
-            result = strategy.score(query_tokens, index, doc_id)
-            total_score += result.score * weight
-            components[strategy.__class__.__name__] = result.score * weight
-            for token, breakdown in result.per_term.items():
-                per_term.setdefault(token, {}).update(breakdown)
-
-        if self.recency:
-            rec_result = self.recency.score(query_tokens, index, doc_id)
-            total_score += rec_result.score
-            components["recency"] = rec_result.score
-
-        return RankingResult(score=total_score, components=components, per_term=per_term)
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        # One context for every strategy: postings and tf vectors are
+        # fetched once, not once per strategy.
+        context = QueryContext.ensure(context, query_tokens, index)
+        by_strategy = [
+            strategy.score_many(query_tokens, index, doc_ids, context)
+            for strategy in self.strategies
+        ]
+        recency = (
+            self.recency.score_many(query_tokens, index, doc_ids, context)
+            if self.recency
+            else None
+        )
+
+        combined = []
+        for i in range(len(doc_ids)):
+            total_score = 0.0
+            components = {}
+            per_term = {}
+
+            for strategy, weight, results in zip(self.strategies, self.weights, by_strategy, strict=True):
+                result = results[i]
+                total_score += result.score * weight
+                components[strategy.__class__.__name__] = result.score * weight
+                for token, breakdown in result.per_term.items():
+                    per_term.setdefault(token, {}).update(breakdown)
+
+            if recency is not None:
+                total_score += recency[i].score
+                components["recency"] = recency[i].score
+
+            combined.append(RankingResult(score=total_score, components=components, per_term=per_term))
+        return combined
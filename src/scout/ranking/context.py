@@ -0,0 +1,104 @@
+# scout/ranking/context.py
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from scout.index.inverted import InvertedIndex
+
+
+class QueryContext:
+    """
+    Term data for one query, shared by every strategy that scores it.
+
+    Each token's postings are turned into a doc id -> tf map the first
+    time any strategy (or the engine's boolean checks) asks for them.
+    Per batch of documents, tf vectors and document lengths are built
+    once and handed to every strategy scoring that batch, so a
+    composite costs little more than its most expensive component.
+
+    A context is tied to one index generation; build a new one per
+    query.
+    """
+
+    def __init__(self, query_tokens: Sequence[str], index: InvertedIndex) -> None:
+        self.query_tokens = list(query_tokens)
+        self.index = index
+        self._postings: dict[str, Mapping[Any, int]] = {}
+        self._batch_ids: tuple[Any, ...] | None = None
+        self._batch: dict[str | None, np.ndarray] = {}
+
+    @classmethod
+    def ensure(
+        cls,
+        context: QueryContext | None,
+        query_tokens: Sequence[str],
+        index: InvertedIndex,
+    ) -> QueryContext:
+        """`context` if it covers this query and index, else a new one."""
+        if (
+            context is not None
+            and context.index is index
+            and context.query_tokens == list(query_tokens)
+        ):
+            return context
+        return cls(query_tokens, index)
+
+    def doc_freq(self, token: str) -> int:
+        return int(self.index.doc_freqs.get(token, 0))
+
+    def postings(self, token: str) -> Mapping[Any, int]:
+        """Term frequency by doc id for `token`."""
+        postings = self._postings.get(token)
+        if postings is None:
+            postings = dict(self.index.get_postings(token))
+            self._postings[token] = postings
+        return postings
+
+    def use_postings(self, token: str, postings: Mapping[Any, int]) -> None:
+        """Read `token`'s term frequencies from an existing lookup."""
+        self._postings[token] = postings
+
+    def contains(self, doc_id: Any, token: str) -> bool:
+        return doc_id in self.postings(token)
+
+    def term_frequencies(self, token: str, doc_ids: Sequence[Any]) -> np.ndarray:
+        """tf of `token` in each of `doc_ids` (0.0 where absent)."""
+        batch = self._batch_for(doc_ids)
+        tfs = batch.get(token)
+        if tfs is None:
+            postings = self.postings(token)
+            tfs = np.fromiter(
+                (postings.get(doc_id, 0) for doc_id in doc_ids),
+                dtype=np.float64,
+                count=len(doc_ids),
+            )
+            batch[token] = tfs
+        return tfs
+
+    def doc_lengths(self, doc_ids: Sequence[Any]) -> np.ndarray:
+        """Length of each of `doc_ids` (the average for unknown ids)."""
+        batch = self._batch_for(doc_ids)
+        lengths = batch.get(None)
+        if lengths is None:
+            stats = self.index.stats
+            avg_dl = stats.avg_doc_length
+            lengths = np.fromiter(
+                stats.doc_lengths.get_many(doc_ids, avg_dl),
+                dtype=np.float64,
+                count=len(doc_ids),
+            )
+            batch[None] = lengths
+        return lengths
+
+    def _batch_for(self, doc_ids: Sequence[Any]) -> dict[str | None, np.ndarray]:
+        # Callers may reuse one list for successive batches, so compare
+        # contents rather than identity.
+        key = tuple(doc_ids)
+        if key != self._batch_ids:
+            self._batch_ids = key
+            self._batch = {}
+        return self._batch
@@ -1,8 +1,10 @@
 # scout/ranking/fusion.py
 
+from collections.abc import Sequence
 
 from scout.index.inverted import InvertedIndex
 from scout.ranking.base import RankingResult, RankingStrategy
+from scout.ranking.context import QueryContext
 
 
 class FusionRanking(RankingStrategy):
@@ -16,20 +18,40 @@ class FusionRanking(RankingStrategy):
         self._weights = weights
 
     def score(self, query_tokens, index: InvertedIndex, doc_id: int) -> RankingResult:
-        total = 0.0
-        components = {}
-        per_term = {}
-
-        for strategy, weight in zip(self._strategies, self._weights, strict=True):
-            result = strategy.score(query_tokens, index, doc_id)
-            total += result.score * weight
-            components[strategy.__class__.__name__] = result.score * weight
-
-            for token, breakdown in result.per_term.items():
-                per_term.setdefault(token, {}).update(breakdown)
-
-        return RankingResult(
-            score=total,
-            components=components,
-            per_term=per_term,
-        )
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        context = QueryContext.ensure(context, query_tokens, index)
+        by_strategy = [
+            strategy.score_many(query_tokens, index, doc_ids, context)
+            for strategy in self._strategies
+        ]
+
+        fused = []
+        for i in range(len(doc_ids)):
+            total = 0.0
+            components = {}
+            per_term = {}
+
+            for strategy, weight, results in zip(self._strategies, self._weights, by_strategy, strict=True):
+                result = results[i]
+                total += result.score * weight
+                components[strategy.__class__.__name__] = result.score * weight
+
+                for token, breakdown in result.per_term.items():
+                    per_term.setdefault(token, {}).update(breakdown)
+
+            fused.append(
+                RankingResult(
+                    score=total,
+                    components=components,
+                    per_term=per_term,
+                )
+            )
+        return fused
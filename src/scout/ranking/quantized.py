@@ -0,0 +1,73 @@
+# scout/ranking/quantized.py
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from scout.index.frozen import FrozenIndex
+from scout.ranking.base import RankingResult, RankingStrategy
+from scout.ranking.context import QueryContext
+
+
+class QuantizedBM25Ranking(RankingStrategy):
+    """
+    BM25 from impacts precomputed at freeze time.
+
+    Needs a FrozenIndex built with `impacts="uint8"` or `"uint16"`. A
+    document's score is the integer sum of its quantized impacts times
+    one scale factor, so no BM25 arithmetic happens per query: each
+    token costs one binary search of the batch against its (ordinal
+    sorted) postings and an integer add.
+    """
+
+    def score(
+        self,
+        query_tokens: list[str],
+        index: FrozenIndex,  # type: ignore[override]
+        doc_id: int,
+    ) -> RankingResult:
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: FrozenIndex,  # type: ignore[override]
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        if not isinstance(index, FrozenIndex) or "impacts" not in index.meta:
+            raise ValueError(
+                "QuantizedBM25Ranking needs a FrozenIndex frozen with impacts"
+            )
+
+        ordinals = index.ordinals(doc_ids)
+        totals = np.zeros(len(doc_ids), dtype=np.int64)
+        per_token: list[tuple[str, np.ndarray]] = []
+
+        for token in query_tokens:
+            docs, impacts = index.impact_slice(token)
+            if not len(docs):
+                continue
+            pos = np.minimum(np.searchsorted(docs, ordinals), len(docs) - 1)
+            found = (docs[pos] == ordinals) & (ordinals >= 0)
+            contribution = np.where(found, impacts[pos], 0).astype(np.int64)
+            totals += contribution
+            per_token.append((token, contribution))
+
+        scale = index.impact_scale
+        results = []
+        for i, total in enumerate(totals.tolist()):
+            per_term = {
+                token: {"impact": float(c[i]), "score": float(c[i]) * scale}
+                for token, c in per_token
+                if c[i]
+            }
+            score = total * scale
+            results.append(
+                RankingResult(
+                    score=score,
+                    components={"bm25": score, "scale": scale},
+                    per_term=per_term,
+                )
+            )
+        return results
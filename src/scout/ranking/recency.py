@@ -1,18 +1,28 @@
 # scout/ranking/recency.py
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime
 
+import numpy as np
+
+from scout.index.columns import ColumnStore, parse_datetime
 from scout.index.inverted import InvertedIndex
 
 from .base import RankingResult, RankingStrategy
+from .context import QueryContext
 
 
 class RecencyRanking(RankingStrategy):
     """
     Boosts documents based on recency.
     Requires `documents` to have a 'timestamp' field (datetime or ISO string).
+
+    Reads the index's `timestamp` metadata column when there is one, so
+    timestamps are parsed once at index time rather than per query.
     """
 
+    field = "timestamp"
+
     def __init__(self, decay_days: float = 30.0, max_boost: float = 1.0):
         """
         :param decay_days: number of days for score to decay to ~0.37 (1/e)
@@ -27,16 +37,39 @@ class RecencyRanking(RankingStrategy):
         index: InvertedIndex,
         doc_id: int
     ) -> RankingResult:
-        doc = index.get_document(doc_id)
-        ts = doc.get("timestamp")
-        if ts is None:
-            return RankingResult(score=0.0, components={"recency": 0.0})
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        timestamps = self._timestamps(index, doc_ids)
+        # Timestamps are stored as naive UTC.
+        now = datetime.now(UTC).replace(tzinfo=None)
+        ages: np.ndarray = np.datetime64(now, "us") - timestamps
+        age_days = ages / np.timedelta64(86400, "s")
+        scores = self.max_boost * np.power(2.71828, -age_days / self.decay_days)
+        scores[np.isnat(timestamps)] = 0.0
 
-        # Convert ISO string to datetime if needed
-        if isinstance(ts, str):
-            ts = datetime.fromisoformat(ts)
+        return [
+            RankingResult(score=value, components={"recency": value})
+            for value in scores.tolist()
+        ]
 
-        age_days = (datetime.now() - ts).total_seconds() / 86400
-        recency_score = self.max_boost * pow(2.71828, -age_days / self.decay_days)
+    def _timestamps(self, index: InvertedIndex, doc_ids: Sequence[int]) -> np.ndarray:
+        columns: ColumnStore | None = getattr(index, "columns", None)
+        column = columns.column(self.field) if columns is not None else None
+        if columns is not None and column is not None and column.kind == "datetime":
+            values = columns.values(self.field, columns.ordinals_for(doc_ids))
+            assert values is not None
+            return values
 
-        return RankingResult(score=recency_score, components={"recency": recency_score})
+        # No usable column: parse per document.
+        parsed = (parse_datetime(index.get_document(d).get(self.field)) for d in doc_ids)
+        return np.array(
+            [np.datetime64("NaT", "us") if ts is None else np.datetime64(ts, "us") for ts in parsed],
+            dtype="datetime64[us]",
+        )
@@ -1,9 +1,11 @@
 # scout/ranking/robust.py
 
+from collections.abc import Sequence
 
 from scout.index.inverted import InvertedIndex
 
 from .base import RankingResult, RankingStrategy
+from .context import QueryContext
 from .tf import TermFrequencyRanking
 from .tfidf import TFIDFRanking
 
@@ -25,17 +27,31 @@ class RobustRanking(RankingStrategy):
         index: InvertedIndex,
         doc_id: int
     ) -> RankingResult:
-        tf_result = self.tf.score(query_tokens, index, doc_id)
-        tfidf_result = self.tfidf.score(query_tokens, index, doc_id)
+        return self.score_many(query_tokens, index, [doc_id])[0]
 
-        score = (
-            self.tf_weight * tf_result.score
-            + self.tfidf_weight * tfidf_result.score
-        )
-
-        components = {
-            "tf": tf_result.score,
-            "tfidf": tfidf_result.score
-        }
-
-        return RankingResult(score=score, components=components)
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        # Both halves read the same tf vectors.
+        context = QueryContext.ensure(context, query_tokens, index)
+        tf_results = self.tf.score_many(query_tokens, index, doc_ids, context)
+        tfidf_results = self.tfidf.score_many(query_tokens, index, doc_ids, context)
+
+        results = []
+        for tf_result, tfidf_result in zip(tf_results, tfidf_results, strict=True):
+            score = (
+                self.tf_weight * tf_result.score
+                + self.tfidf_weight * tfidf_result.score
+            )
+
+            components = {
+                "tf": tf_result.score,
+                "tfidf": tfidf_result.score
+            }
+
+            results.append(RankingResult(score=score, components=components))
+        return results
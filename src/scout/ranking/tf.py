@@ -1,10 +1,13 @@
 # scout/ranking/tf.py
 
-from collections import defaultdict
+from collections.abc import Sequence
+
+import numpy as np
 
 from scout.index.inverted import InvertedIndex
 
 from .base import RankingResult, RankingStrategy
+from .context import QueryContext
 
 
 class TermFrequencyRanking(RankingStrategy):
@@ -18,14 +21,26 @@ class TermFrequencyRanking(RankingStrategy):
         index: InvertedIndex,
         doc_id: int
     ) -> RankingResult:
-        score = 0.0
-        components = defaultdict(float)
+        return self.score_many(query_tokens, index, [doc_id])[0]
 
-        for token in query_tokens:
-            postings = index.get_postings(token)
-            for d_id, freq in postings:
-                if d_id == doc_id:
-                    score += freq
-                    components[token] += freq
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        context = QueryContext.ensure(context, query_tokens, index)
+        scores = np.zeros(len(doc_ids), dtype=np.float64)
+        components: list[dict[str, float]] = [{} for _ in doc_ids]
 
-        return RankingResult(score=score, components=dict(components))
+        for token in query_tokens:
+            tfs = context.term_frequencies(token, doc_ids)
+            scores += tfs
+            for i in np.flatnonzero(tfs).tolist():
+                components[i][token] = components[i].get(token, 0.0) + float(tfs[i])
+
+        return [
+            RankingResult(score=score, components=doc_components)
+            for score, doc_components in zip(scores.tolist(), components, strict=True)
+        ]
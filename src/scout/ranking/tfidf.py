@@ -1,11 +1,14 @@
 # scout/ranking/tfidf.py
 
 import math
-from collections import defaultdict
+from collections.abc import Sequence
+
+import numpy as np
 
 from scout.index.inverted import InvertedIndex
 
 from .base import RankingResult, RankingStrategy
+from .context import QueryContext
 
 
 class TFIDFRanking(RankingStrategy):
@@ -19,23 +22,33 @@ class TFIDFRanking(RankingStrategy):
         index: InvertedIndex,
         doc_id: int
     ) -> RankingResult:
-        score = 0.0
-        components = defaultdict(float)
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        context = QueryContext.ensure(context, query_tokens, index)
+        scores = np.zeros(len(doc_ids), dtype=np.float64)
+        components: list[dict[str, float]] = [{} for _ in doc_ids]
 
         N = index.stats.total_docs
 
         for token in query_tokens:
-            df = index.doc_freqs.get(token, 0)
+            df = context.doc_freq(token)
             if df == 0:
                 continue
 
             idf = math.log((N + 1) / (df + 1)) + 1.0
-            postings = index.get_postings(token)
-
-            for d_id, tf in postings:
-                if d_id == doc_id:
-                    tfidf = tf * idf
-                    score += tfidf
-                    components[token] += tfidf
-
-        return RankingResult(score=score, components=dict(components))
+            tfidf = context.term_frequencies(token, doc_ids) * idf
+            scores += tfidf
+            for i in np.flatnonzero(tfidf).tolist():
+                components[i][token] = components[i].get(token, 0.0) + float(tfidf[i])
+
+        return [
+            RankingResult(score=score, components=doc_components)
+            for score, doc_components in zip(scores.tolist(), components, strict=True)
+        ]
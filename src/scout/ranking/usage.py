@@ -0,0 +1,46 @@
+# scout/ranking/usage.py
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from scout.index.inverted import InvertedIndex
+from scout.state.usage import UsageStore
+
+from .base import RankingResult, RankingStrategy
+from .context import QueryContext
+
+
+class UsageWeightedRanking(RankingStrategy):
+    """
+    Boosts documents people actually open.
+
+    Scores are weight * log1p(decayed access count) from a UsageStore, so
+    a handful of clicks matters but heavy traffic saturates. Meant to be
+    combined with a relevance strategy (e.g. via CompositeRanking).
+    """
+
+    def __init__(self, usage: UsageStore, weight: float = 1.0):
+        self.usage = usage
+        self.weight = weight
+
+    def score(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_id: int,
+    ) -> RankingResult:
+        return self.score_many(query_tokens, index, [doc_id])[0]
+
+    def score_many(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex,
+        doc_ids: Sequence[int],
+        context: QueryContext | None = None,
+    ) -> list[RankingResult]:
+        scores = self.weight * np.log1p(self.usage.access_counts(doc_ids))
+        return [
+            RankingResult(score=value, components={"usage": value})
+            for value in scores.tolist()
+        ]
@@ -0,0 +1,231 @@
+# scout/search/aio.py
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from scout.search.budget import SearchBudget, SearchResults
+from scout.search.filters import Filter
+
+if TYPE_CHECKING:
+    from scout.search.engine import SearchEngine
+
+# Extra search() keyword arguments as sorted (name, value) pairs, with
+# sequences turned into tuples so the whole key is hashable.
+SearchOptions = tuple[tuple[str, Any], ...]
+SearchKey = tuple[str, int, SearchBudget | None, SearchOptions]
+
+
+def _search_options(**options: Any) -> SearchOptions:
+    return tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in options.items()
+            if value is not None
+        )
+    )
+
+
+class SearchRejected(RuntimeError):
+    """Raised when too many searches are already waiting for a worker."""
+
+
+# Engine copy owned by a process-pool worker (installed by the initializer).
+_worker_engine: SearchEngine | None = None
+
+
+def _install_worker_engine(engine: SearchEngine) -> None:
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _search_in_worker(
+    query: str,
+    limit: int,
+    budget: SearchBudget | None,
+    options: SearchOptions,
+) -> SearchResults:
+    if _worker_engine is None:
+        raise RuntimeError("Worker process has no engine installed")
+    return _worker_engine.search(query, limit=limit, budget=budget, **dict(options))
+
+
+class AsyncSearchExecutor:
+    """
+    Runs SearchEngine.search off the event loop.
+
+    - CPU work runs on a thread pool (default) or a process pool
+    - At most `max_concurrency` searches execute at once
+    - At most `max_pending` searches may wait for a slot; beyond that
+      SearchRejected is raised instead of queueing without bound
+    - Identical in-flight requests (same query and options) share one
+      execution
+
+    Process pools receive a copy of the engine when they start, so documents
+    added afterwards are only visible to thread-pool execution.
+    """
+
+    def __init__(
+        self,
+        engine: SearchEngine,
+        *,
+        executor: Executor | None = None,
+        processes: int | None = None,
+        max_concurrency: int = 4,
+        max_pending: int | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if executor is not None and processes is not None:
+            raise ValueError("Pass either executor or processes, not both")
+
+        self._engine = engine
+        self._max_pending = max_pending
+        self._owns_executor = executor is None
+        self._use_worker_engine = processes is not None
+
+        if executor is not None:
+            self._executor = executor
+        elif processes is not None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_install_worker_engine,
+                initargs=(engine,),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_concurrency,
+                thread_name_prefix="scout-search",
+            )
+
+        self._max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: dict[SearchKey, asyncio.Future[SearchResults]] = {}
+        self._waiters: Counter[SearchKey] = Counter()
+        # Runs that got a slot; by task, as a cancelled run and its
+        # replacement can share a key.
+        self._started: set[asyncio.Future[SearchResults]] = set()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of searches waiting for a free execution slot."""
+        return self._pending
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        sort_by: str | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults:
+        options = _search_options(
+            filters=list(filters) if filters else None,
+            facets=list(facets) if facets else None,
+            sort_by=sort_by,
+            collapse_on=collapse_on,
+            fuzzy=fuzzy or None,
+        )
+        key = (query, limit, budget, options)
+        try:
+            task = self._inflight.get(key)
+        except TypeError:
+            # Filters with unhashable values (e.g. a list) cannot be
+            # coalesced; run them on their own.
+            self._admit()
+            return await self._run(key)
+
+        if task is None:
+            self._admit()
+            task = asyncio.ensure_future(self._run(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        self._waiters[key] += 1
+        try:
+            # Shield so one cancelled caller does not cancel the shared run.
+            # Each caller gets its own copy of the shared result list.
+            return copy.copy(await asyncio.shield(task))
+        finally:
+            self._waiters[key] -= 1
+            if self._waiters[key] <= 0:
+                del self._waiters[key]
+                if not task.done():
+                    # Identical queries arriving while it winds down must
+                    # start afresh rather than join a cancelled run.
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+                    task.cancel()
+
+    def _admit(self) -> None:
+        if self._max_pending is not None and self._pending >= self._max_pending:
+            raise SearchRejected(f"{self._pending} searches already pending")
+        self._pending += 1
+
+    def _slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # Semaphores are bound to one loop; rebuild if the caller's loop changed.
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, key: SearchKey) -> SearchResults:
+        query, limit, budget, options = key
+        loop = asyncio.get_running_loop()
+        slots = self._slots(loop)
+
+        await slots.acquire()
+        self._pending -= 1
+        task = asyncio.current_task()
+        assert task is not None
+        self._started.add(task)
+
+        try:
+            if self._use_worker_engine:
+                return await loop.run_in_executor(
+                    self._executor, _search_in_worker, query, limit, budget, options
+                )
+            return await loop.run_in_executor(
+                self._executor, self._search_sync, query, limit, budget, options
+            )
+        finally:
+            slots.release()
+
+    def _search_sync(
+        self,
+        query: str,
+        limit: int,
+        budget: SearchBudget | None,
+        options: SearchOptions,
+    ) -> SearchResults:
+        return self._engine.search(query, limit=limit, budget=budget, **dict(options))
+
+    def _forget(self, key: SearchKey, task: asyncio.Future[SearchResults]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task in self._started:
+            self._started.discard(task)
+        else:
+            # Cancelled before it ever got a slot.
+            self._pending -= 1
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncSearchExecutor:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,66 @@
+# scout/search/budget.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+from scout.ranking.base import RankingResult
+
+
+@dataclass(frozen=True)
+class SearchBudget:
+    """
+    Per-query limit on time and/or scoring work.
+
+    When either limit is reached, candidate scoring stops and the best
+    results found so far are returned with `partial=True`.
+    """
+
+    max_time_ms: float | None = None
+    max_scored: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_time_ms is not None and self.max_time_ms < 0:
+            raise ValueError("max_time_ms must be >= 0")
+        if self.max_scored is not None and self.max_scored < 0:
+            raise ValueError("max_scored must be >= 0")
+
+    def exhausted(self, *, scored: int, started: float) -> bool:
+        if self.max_scored is not None and scored >= self.max_scored:
+            return True
+        if self.max_time_ms is not None:
+            return (perf_counter() - started) * 1000.0 >= self.max_time_ms
+        return False
+
+
+class SearchResults(list[tuple[int, RankingResult]]):
+    """
+    Ranked (doc_id, RankingResult) pairs plus execution counters.
+
+    Behaves exactly like the plain list search() used to return.
+    `facets` maps each requested facet to {value: count} over every
+    matching document, not just the returned page. `stages` maps each
+    retrieval stage of a reranked search ("retrieve", "rerank") to its
+    latency in milliseconds.
+    """
+
+    def __init__(
+        self,
+        hits: list[tuple[int, RankingResult]] | None = None,
+        *,
+        partial: bool = False,
+        candidates: int = 0,
+        scored: int = 0,
+        elapsed_ms: float = 0.0,
+        facets: dict[str, dict[Any, int]] | None = None,
+        stages: dict[str, float] | None = None,
+    ) -> None:
+        super().__init__(hits or [])
+        self.partial = partial
+        self.candidates = candidates
+        self.scored = scored
+        self.elapsed_ms = elapsed_ms
+        self.facets = facets or {}
+        self.stages = stages or {}
@@ -0,0 +1,130 @@
+# scout/search/dense.py
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from scout.index.inverted import InvertedIndex
+from scout.index.vectors import DEFAULT_N_PROBE, HashingEmbedder, nearest
+from scout.ranking.base import RankingResult
+from scout.search.budget import SearchBudget, SearchResults
+from scout.search.filters import Filter, evaluate_filters
+from scout.search.query import parse_query
+from scout.search.topk import TopK, column_groups
+
+if TYPE_CHECKING:
+    from scout.search.engine import SearchEngine
+    from scout.state.signals import IndexSnapshot
+
+
+class DenseRetriever:
+    """
+    Nearest-neighbour retrieval over a vector field, for ListFusion.
+
+    The query's terms (required, optional and phrase words; exclusions
+    and operators dropped) are embedded with `embedder`, which must be
+    the one that produced the documents' `field` vectors, and the most
+    similar documents are found through the field's IVF index (or by
+    scoring every vector, with `exact`).
+
+    Documents need not contain any query term, which is the point:
+    fused with a lexical ranking (ListFusion([BM25Ranking(),
+    DenseRetriever(embedder)])) it adds semantic recall. Filters and
+    exclusions are honoured; hits scoring at or below `min_score`
+    cosine similarity are dropped.
+    """
+
+    def __init__(
+        self,
+        embedder: HashingEmbedder,
+        *,
+        field: str = "embedding",
+        n_probe: int = DEFAULT_N_PROBE,
+        exact: bool = False,
+        min_score: float = 0.0,
+    ) -> None:
+        self.embedder = embedder
+        self.field = field
+        self.n_probe = n_probe
+        self.exact = exact
+        self.min_score = min_score
+
+    def embed_query(self, query: str) -> np.ndarray:
+        parsed = parse_query(query)
+        terms = [t.rstrip("*") for t in sorted(parsed.required | parsed.optional)]
+        terms += [t for phrase in parsed.phrases for t in phrase]
+        return self.embedder.embed(" ".join(terms))
+
+    def retrieve(
+        self,
+        engine: SearchEngine,
+        query: str,
+        view: tuple[InvertedIndex, IndexSnapshot | None],
+        *,
+        limit: int,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults:
+        """
+        Top `limit` documents by cosine similarity to the query.
+
+        `budget`, `facets` and `fuzzy` are accepted for ListFusion and
+        ignored: the search is already bounded and matches no terms.
+        """
+        started = perf_counter()
+        index, _ = view
+        column = index.columns.vector(self.field)
+        if column is None or limit <= 0:
+            return SearchResults(elapsed_ms=(perf_counter() - started) * 1000.0)
+
+        allowed, residual = evaluate_filters(filters, index.columns) if filters else (None, [])
+        excluded = {
+            doc_id for token in parse_query(query).exclude for doc_id, _ in index.get_postings(token)
+        }
+        vector = self.embed_query(query)
+        doc_ids = index.columns.doc_ids
+        group_of = (
+            column_groups(index.columns, collapse_on, index.get_document)
+            if collapse_on
+            else None
+        )
+
+        # Post-filters (residual clauses, exclusions, collapsing) can
+        # drop hits; widen the search until `limit` survive.
+        k = limit
+        while True:
+            ordinals, scores = nearest(
+                column, vector, k, exact=self.exact, n_probe=self.n_probe, allowed=allowed
+            )
+            top = TopK(limit, group_of)
+            hits = []
+            for ordinal, score in zip(ordinals.tolist(), scores.tolist(), strict=True):
+                if score <= self.min_score:
+                    break
+                doc_id = doc_ids[ordinal]
+                if residual:
+                    metadata = index.get_document(doc_id)
+                    if not all(clause.matches(metadata) for clause in residual):
+                        continue
+                if doc_id in excluded:
+                    continue
+                hits.append((doc_id, RankingResult(score, {"cosine": score})))
+            top.push_many(hits)
+            results = top.results()
+            if len(results) >= limit or len(ordinals) < k:
+                break
+            k *= 4
+
+        return SearchResults(
+            results,
+            candidates=len(ordinals),
+            scored=len(ordinals),
+            elapsed_ms=(perf_counter() - started) * 1000.0,
+        )
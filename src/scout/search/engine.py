@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from collections.abc import Iterable
+import os
+from collections.abc import Iterable, Iterator, KeysView, Mapping, Sequence
+from time import perf_counter
+from typing import Any
 
+from scout.index.bitmap import DocBitmap
 from scout.index.builder import IndexBuilder
+from scout.index.columns import ColumnStore
+from scout.index.impact import impact_index
 from scout.index.inverted import InvertedIndex
+from scout.index.terms import TOP_PER_NODE
 from scout.index.tokens import Tokenizer
 from scout.ranking.base import RankingResult, RankingStrategy
-from scout.search.query import parse_query
-from scout.state.signals import IndexState
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.context import QueryContext
+from scout.search.aio import AsyncSearchExecutor
+from scout.search.budget import SearchBudget, SearchResults
+from scout.search.facets import count_facets
+from scout.search.filters import Filter, evaluate_filters
+from scout.search.fusion import ListFusion
+from scout.search.hot import HotQueryCache
+from scout.search.query import ParsedQuery, parse_query
+from scout.search.rerank import Reranker
+from scout.search.topk import TopK, column_groups, parse_sort, top_by_column
+from scout.state.signals import IndexSnapshot, IndexState
+from scout.state.usage import UsageStore
+from scout.storage.docstore import DocStore, StoredDocuments
 
 DEFAULT_STOPWORDS = {"the", "a", "an", "and", "or"}
+SCORE_BATCH_SIZE = 256
+# As many as each prefix has precomputed, so expansion never ranks a range.
+MAX_PREFIX_EXPANSIONS = TOP_PER_NODE
+MAX_FUZZY_EXPANSIONS = 8
+# Score multiplier per edit for documents matched through a fuzzy term.
+FUZZY_PENALTY = 0.5
 
 
 class SearchEngine:
@@ -30,13 +56,33 @@ class SearchEngine:
         stopwords: set[str] | None = None,
         state: IndexState | None = None,
         field_weights: dict[str, float] | None = None,
+        max_df_ratio: float | None = None,
     ) -> None:
+        if max_df_ratio is not None and not 0.0 < max_df_ratio <= 1.0:
+            raise ValueError("max_df_ratio must be in (0, 1]")
         self._index = index
         self._ranking = ranking
         self._tokenizer = tokenizer
         self._state = state
         self._field_weights = field_weights or {}
         self.stopwords = stopwords if stopwords is not None else DEFAULT_STOPWORDS
+        # Terms in more than this share of documents are still scored but
+        # never generate candidates; see driving_terms().
+        self.max_df_ratio = max_df_ratio
+
+        # Executor used by asearch(); created lazily with defaults if unset.
+        self.async_executor: AsyncSearchExecutor | None = None
+        # Usage signals; when set, every search counts its query here.
+        self.usage: UsageStore | None = None
+        # Precomputed results for hot queries; see enable_hot_cache().
+        self.hot_cache: HotQueryCache | None = None
+        # Index size the hot cache is known to be current for, when
+        # there is no IndexState to announce changes.
+        self._hot_cache_seen: tuple[int, int] | None = None
+        # Second stage rescoring the ranking's top hits; see Reranker.
+        self.reranker: Reranker | None = None
+        # List-level fusion of several rankings; see ListFusion.
+        self.fusion: ListFusion | None = None
 
         if self._state is not None:
             self._state.on_change.subscribe(self._on_index_change)
@@ -44,7 +90,7 @@ class SearchEngine:
     @classmethod
     def from_records(
         cls,
-        records: list[dict],
+        records: list[dict[str, Any]],
         *,
         ranking: RankingStrategy,
         fields: list[str] | None = None,
@@ -52,6 +98,7 @@ class SearchEngine:
         stopwords: set[str] | None = None,
         state: IndexState | None = None,
         field_weights: dict[str, float] | None = None,
+        max_df_ratio: float | None = None,
     ) -> SearchEngine:
         builder = IndexBuilder(fields=fields, ngram=ngram)
         index = builder.build(records, field_weights=field_weights)
@@ -60,7 +107,8 @@ class SearchEngine:
         # Initialize IndexState with tokens if not provided
         if state is None:
             tokens_by_doc: dict[int, list[str]] = {}
-            for doc_id, record in enumerate(records):
+            for position, record in enumerate(records):
+                doc_id = record.get("id", position)
                 if fields is not None:
                     used_fields = fields
                 elif field_weights is not None:
@@ -82,8 +130,7 @@ class SearchEngine:
 
             state = IndexState(tokens_by_doc)
 
-        else:
-            state.index = index
+        state.index = index
 
         return cls(
             index=index,
@@ -92,16 +139,51 @@ class SearchEngine:
             stopwords=stopwords,
             state=state,
             field_weights=field_weights,
+            max_df_ratio=max_df_ratio,
         )
 
 
     def add_document(
         self,
         doc_id: int,
-        record: dict,
+        record: dict[str, Any],
+        *,
+        fields: list[str] | None = None,
+    ) -> None:
+        tokens = self._tokenize_record(record, fields)
+
+        if self._state is not None:
+            self._state.add_document(doc_id, tokens, metadata=record)
+        else:
+            self._check_hot_cache(self._index)
+            self._index.add_document(doc_id, tokens, metadata=record)
+            self._invalidate_hot_cache(tokens)
+
+    def add_documents(
+        self,
+        documents: Iterable[tuple[int, dict[str, Any]]],
         *,
         fields: list[str] | None = None,
     ) -> None:
+        """
+        Add (doc_id, record) pairs in bulk.
+
+        The whole batch is published as one index generation and emits a
+        single on_change carrying every added id.
+        """
+        prepared = [
+            (doc_id, self._tokenize_record(record, fields), record)
+            for doc_id, record in documents
+        ]
+
+        if self._state is not None:
+            self._state.add_documents(prepared)
+        else:
+            self._check_hot_cache(self._index)
+            self._index.add_documents(prepared)
+            self._invalidate_hot_cache(t for _, tokens, _ in prepared for t in tokens)
+
+    def _tokenize_record(self, record: dict[str, Any], fields: list[str] | None) -> list[str]:
         tokens: list[str] = []
 
         if fields is not None:
@@ -111,7 +193,6 @@ class SearchEngine:
         else:
             used_fields = ["text"]
 
-
         for field in used_fields:
             value = record.get(field)
             if not isinstance(value, str):
@@ -123,93 +204,609 @@ class SearchEngine:
             repeat = max(1, int(weight))
             tokens.extend(field_tokens * repeat)
 
-        tokens = [t for t in tokens if t not in self.stopwords]
+        return [t for t in tokens if t not in self.stopwords]
 
+    @property
+    def index(self) -> InvertedIndex:
+        """The index searches currently read from."""
         if self._state is not None:
-            self._state.add_document(doc_id, tokens, metadata=record)
-        else:
-            self._index.add_document(doc_id, tokens, metadata=record)
+            return self._state.index
+        return self._index
+
+    def _snapshot(self) -> tuple[InvertedIndex, IndexSnapshot | None]:
+        if self._state is None:
+            return self._index, None
+        snapshot = self._state.snapshot()
+        return snapshot.index, snapshot
 
     def search(
         self,
         query: str,
         *,
         limit: int = 10,
-    ) -> list[tuple[int, RankingResult]]:
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        sort_by: str | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults:
+        """
+        Rank documents matching `query`.
+
+        With a `budget`, scoring stops once it is exhausted and the best
+        results found so far are returned with `partial=True`. Candidates
+        are visited rarest-term first so partial results stay meaningful.
+
+        `filters` (Term / Range clauses, ANDed) restrict results by
+        metadata. They are resolved to cached doc bitmaps over the
+        metadata columns and checked before any other per-candidate work.
+
+        `facets` (e.g. ["source", "date:year"]) are counted over all
+        matching documents and returned as `results.facets`.
+
+        `sort_by` orders matches by a metadata column instead of score
+        ("-date" for newest first); only the returned page is scored.
+        `collapse_on` keeps the best match per value of a field.
+
+        With `fuzzy`, query terms missing from the index also match the
+        most frequent indexed terms within one edit (two for terms longer
+        than five characters); each edit multiplies a document's score by
+        FUZZY_PENALTY.
+
+        With `reranker` set, the ranking only picks the top
+        `reranker.depth` matches and the reranker's ranking orders them;
+        `results.stages` then holds each stage's latency. With `fusion`
+        set, each of its rankings retrieves its own top list and the
+        lists are fused (see ListFusion).
+        """
+        if self.usage is not None:
+            self.usage.record_query(query)
+        cache_version = self._cache_version()
+        return self._execute(
+            query,
+            self._snapshot(),
+            cache_version=cache_version,
+            limit=limit,
+            budget=budget,
+            filters=filters,
+            facets=facets,
+            sort_by=sort_by,
+            collapse_on=collapse_on,
+            fuzzy=fuzzy,
+        )
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int = 10,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        sort_by: str | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> list[SearchResults]:
+        """
+        Run a batch of queries against one snapshot.
+
+        Identical queries in the batch are evaluated once.
+        """
+        cache_version = self._cache_version()
+        view = self._snapshot()
+        unique: dict[str, SearchResults] = {}
+        batch: list[SearchResults] = []
+
+        for query in queries:
+            if self.usage is not None:
+                self.usage.record_query(query)
+            if query not in unique:
+                unique[query] = self._execute(
+                    query,
+                    view,
+                    cache_version=cache_version,
+                    limit=limit,
+                    budget=budget,
+                    filters=filters,
+                    facets=facets,
+                    sort_by=sort_by,
+                    collapse_on=collapse_on,
+                    fuzzy=fuzzy,
+                )
+            batch.append(copy.copy(unique[query]))
+
+        return batch
+
+    def _execute(
+        self,
+        query: str,
+        view: tuple[InvertedIndex, IndexSnapshot | None],
+        *,
+        limit: int,
+        budget: SearchBudget | None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        sort_by: str | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+        ranking: RankingStrategy | None = None,
+        prune: bool = False,
+        cache_version: int | None = None,
+    ) -> SearchResults:
+        """
+        Run one search against `view`.
+
+        `cache_version` is the hot cache's version read before `view` was
+        taken (see _cache_version()); without it results are not cached,
+        since a snapshot may predate invalidations the cache has seen.
+
+        `ranking` replaces the engine's ranking (with no reranking or
+        list fusion) and `prune` allows the impact-ordered BM25 path
+        without a reranker; ListFusion uses both for its sub-rankers.
+        """
+        started = perf_counter()
+        # Only plain searches are cached.
+        hot_cache = None
+        if not (budget or filters or facets or sort_by or collapse_on or fuzzy or ranking):
+            hot_cache = self.hot_cache
+        if hot_cache is not None and self._state is None:
+            self._check_hot_cache(view[0])
+            # The view is the live index, so it is never older than this.
+            cache_version = hot_cache.version
+        if hot_cache is not None:
+            cached = hot_cache.get(query, limit)
+            if cached is not None:
+                cached.elapsed_ms = (perf_counter() - started) * 1000.0
+                return cached
+
+        if ranking is None and self.fusion is not None and sort_by is None:
+            results = self.fusion.run(
+                self,
+                query,
+                view,
+                limit=limit,
+                budget=budget,
+                filters=filters,
+                facets=facets,
+                collapse_on=collapse_on,
+                fuzzy=fuzzy,
+            )
+            if hot_cache is not None and cache_version is not None:
+                hot_cache.put(query, limit, results, version=cache_version)
+            return results
+
+        first_stage = ranking if ranking is not None else self._ranking
+        index, snapshot = view
         parsed = parse_query(query)
 
-        raw_tokens = list(parsed.required | parsed.optional)
+        expansions = self._expand_prefixes(parsed, index)
+        fuzzy_terms = self._expand_fuzzy(parsed, index) if fuzzy else {}
+        for token, terms in fuzzy_terms.items():
+            expansions[token] = list(terms)
+        raw_tokens = [
+            term
+            for token in parsed.required | parsed.optional
+            for term in expansions.get(token, [token])
+        ]
 
         if not raw_tokens and parsed.phrases:
             raw_tokens = list({t for phrase in parsed.phrases for t in phrase})
 
-        query_tokens = [t for t in raw_tokens if t not in self.stopwords]
+        query_tokens = self._order_by_rarity(
+            [t for t in raw_tokens if t not in self.stopwords],
+            index,
+        )
 
         if not query_tokens:
-            return []
+            return SearchResults()
+
+        allowed: DocBitmap | None = None
+        residual: list[Filter] = []
+        if filters:
+            allowed, residual = evaluate_filters(filters, index.columns)
+            if allowed is not None and not allowed:
+                return SearchResults(
+                    elapsed_ms=(perf_counter() - started) * 1000.0,
+                    facets={spec: {} for spec in facets or ()},
+                )
+        # Plain searches never touch the columns, which a FrozenIndex
+        # only materializes on first use.
+        ordinals = index.columns.ordinals if allowed is not None else {}
+
+        # With a reranker, the ranking is the first stage and keeps the
+        # best `depth` hits for the reranker to rescore.
+        reranker = self.reranker if sort_by is None and ranking is None else None
+        group_of = (
+            column_groups(index.columns, collapse_on, index.get_document)
+            if collapse_on
+            else None
+        )
+        top = TopK(max(limit, reranker.depth) if reranker else limit, group_of)
+        candidates = 0
+        scored = 0
+        partial = False
+        pending: list[int] = []
+        # Postings fetched once per query, shared by the boolean checks
+        # and every ranking strategy.
+        context = QueryContext(query_tokens, index)
+
+        def contains(doc_id: int, token: str) -> bool:
+            terms = expansions.get(token)
+            if terms is None:
+                return context.contains(doc_id, token)
+            return any(context.contains(doc_id, t) for t in terms)
+
+        fuzzy_docs = {
+            term: context.postings(term).keys()
+            for terms in fuzzy_terms.values()
+            for term in terms
+        }
+
+        def score_many(
+            doc_ids: list[int],
+            strategy: RankingStrategy = first_stage,
+        ) -> list[RankingResult]:
+            # Batches let strategies vectorize (e.g. over metadata columns).
+            batch = strategy.score_many(query_tokens, index, doc_ids, context)
+            if not fuzzy_terms:
+                return batch
+            return [
+                self._penalize_fuzzy(result, doc_id, fuzzy_terms, fuzzy_docs)
+                for doc_id, result in zip(doc_ids, batch, strict=True)
+            ]
+
+        matched: list[int] = []
+        # Sorting by a field only needs the matches; scores come later.
+        keep_matches = bool(facets) or sort_by is not None
+
+        def score_pending() -> None:
+            batch = score_many(pending)
+            top.push_many(
+                [
+                    (doc_id, ranking_result)
+                    for doc_id, ranking_result in zip(pending, batch, strict=True)
+                    if ranking_result.score > 0.0
+                ]
+            )
+            pending.clear()
+
+        driving, common = self.driving_terms(query_tokens, index)
+        pruned = (
+            (prune or (reranker is not None and reranker.prune))
+            and isinstance(first_stage, BM25Ranking)
+            and not (budget or allowed is not None or residual or facets)
+            and not (collapse_on or sort_by)
+            and not (expansions or parsed.exclude or parsed.phrases)
+            and set(query_tokens) == parsed.required | parsed.optional
+            # Impact lists would let common terms generate candidates.
+            and not common
+        )
+        if pruned:
+            assert isinstance(first_stage, BM25Ranking)
+            impacts = impact_index(index, k1=first_stage.k1, b=first_stage.b)
+            found = impacts.top_k(query_tokens, top.limit, require_all=not parsed.has_or)
+            # Rescore the few survivors for full per-term breakdowns,
+            # reading tfs from the impact lists' lookups rather than
+            # building a map over every posting.
+            for token in query_tokens:
+                context.use_postings(token, impacts.postings(token).frequencies())
+            pending.extend(doc_id for doc_id, _ in found.hits)
+            candidates = scored = found.candidates
+
+        for doc_id in () if pruned else self._candidate_documents(driving, index):
+            if budget is not None and budget.exhausted(scored=scored, started=started):
+                partial = True
+                break
+
+            candidates += 1
+
+            if allowed is not None:
+                ordinal = ordinals.get(doc_id)
+                if ordinal is None or ordinal not in allowed:
+                    continue
 
-        results: dict[int, RankingResult] = {}
+            if residual:
+                metadata = index.get_document(doc_id)
+                if not all(clause.matches(metadata) for clause in residual):
+                    continue
 
-        for doc_id in self._candidate_documents(query_tokens):
             if parsed.exclude and any(
-                self._index.document_contains(doc_id, t)
+                contains(doc_id, t)
                 for t in parsed.exclude
             ):
                 continue
 
             if parsed.has_or:
                 if not any(
-                    self._index.document_contains(doc_id, t)
+                    contains(doc_id, t)
                     for t in (parsed.required | parsed.optional)
                 ):
                     continue
             else:
                 if parsed.required and not all(
-                    self._index.document_contains(doc_id, t)
+                    contains(doc_id, t)
                     for t in parsed.required
                 ):
                     continue
 
             if parsed.phrases:
-                if self._state is None:
+                if snapshot is None:
                     raise RuntimeError(
                         "Phrase queries require IndexState with document tokens"
                     )
 
-                tokens = self._state.get_document_tokens(doc_id)
+                tokens = snapshot.get_document_tokens(doc_id)
                 if not self._matches_phrases(tokens, parsed.phrases):
                     continue
 
-            ranking_result = self._ranking.score(
-                query_tokens=query_tokens,
-                index=self._index,
-                doc_id=doc_id,
+            if keep_matches:
+                matched.append(doc_id)
+            scored += 1
+            if sort_by is not None:
+                continue
+            pending.append(doc_id)
+            if len(pending) == SCORE_BATCH_SIZE:
+                score_pending()
+
+        if sort_by is not None:
+            field, descending = parse_sort(sort_by)
+            page = top_by_column(
+                matched,
+                index.columns,
+                field,
+                limit,
+                descending=descending,
+                collapse_on=collapse_on,
+                get_document=index.get_document,
+            )
+            hits = list(zip(page, score_many(page), strict=True))
+            scored = len(page)
+        else:
+            if pending:
+                score_pending()
+            hits = top.results()
+
+        stages: dict[str, float] = {}
+        if reranker is not None:
+            retrieved = perf_counter()
+            first = [doc_id for doc_id, _ in hits]
+            reranked = TopK(limit, group_of)
+            reranked.push_many(
+                [
+                    (doc_id, ranking_result)
+                    for doc_id, ranking_result in zip(
+                        first, score_many(first, reranker.ranking), strict=True
+                    )
+                    if ranking_result.score > 0.0
+                ]
+            )
+            hits = reranked.results()
+            stages = {
+                "retrieve": (retrieved - started) * 1000.0,
+                "rerank": (perf_counter() - retrieved) * 1000.0,
+            }
+
+        facet_counts = None
+        if facets:
+            facet_counts = count_facets(
+                facets,
+                index.columns,
+                index.columns.ordinals_for(matched),
+                lambda: [index.get_document(doc_id) for doc_id in matched],
             )
 
-            if ranking_result.score > 0.0:
-                results[doc_id] = ranking_result
+        results = SearchResults(
+            hits,
+            partial=partial,
+            candidates=candidates,
+            scored=scored,
+            elapsed_ms=(perf_counter() - started) * 1000.0,
+            facets=facet_counts,
+            stages=stages,
+        )
+        if hot_cache is not None and cache_version is not None:
+            hot_cache.put(query, limit, results, version=cache_version)
+        return results
 
-        return sorted(
-            results.items(),
-            key=lambda item: (-item[1].score, item[0]),
-        )[:limit]
+    async def asearch(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        sort_by: str | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults:
+        """
+        Awaitable search that keeps CPU work off the event loop.
+
+        Assign `async_executor` to control the pool, concurrency limit
+        and pending-queue bound.
+        """
+        if self.async_executor is None:
+            self.async_executor = AsyncSearchExecutor(self)
+        return await self.async_executor.search(
+            query,
+            limit=limit,
+            budget=budget,
+            filters=filters,
+            facets=facets,
+            sort_by=sort_by,
+            collapse_on=collapse_on,
+            fuzzy=fuzzy,
+        )
 
-    def _candidate_documents(self, query_tokens: list[str]) -> Iterable[int]:
-        candidates: set[int] = set()
+    def enable_hot_cache(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int = 10,
+        warm: bool = True,
+    ) -> HotQueryCache:
+        """
+        Answer `queries` (e.g. from mine_query_log or mine_usage) from
+        precomputed top-`limit` lists, computed now unless `warm=False`.
+        """
+        self.hot_cache = HotQueryCache(self, queries, limit=limit)
+        self._hot_cache_seen = None
+        if warm:
+            self.hot_cache.warm()
+        return self.hot_cache
+
+    def prepare_fuzzy(self) -> None:
+        """
+        Build the deletion index fuzzy searches use now, e.g. at startup,
+        rather than during the first one. Later generations keep it up
+        to date, and saved or frozen indexes store it.
+        """
+        index, _ = self._snapshot()
+        index.deletion_index()
+
+    def record_click(self, doc_id: int) -> None:
+        """Count a click on (or other access to) `doc_id` in `usage`."""
+        if self.usage is None:
+            raise RuntimeError("No usage store attached; set engine.usage first")
+        self.usage.record_access(doc_id)
+
+    def autocomplete(self, prefix: str, k: int = 10) -> list[tuple[str, int]]:
+        """Up to `k` indexed terms starting with `prefix`, most frequent first."""
+        index, _ = self._snapshot()
+        return index.term_dictionary().complete(prefix.lower(), k)
 
-        for token in query_tokens:
-            for doc_id, _ in self._index.get_postings(token):
-                candidates.add(doc_id)
+    @staticmethod
+    def _expand_prefixes(parsed: ParsedQuery, index: InvertedIndex) -> dict[str, list[str]]:
+        """
+        Map each `prefix*` query token to its most frequent completions.
+        """
+        expansions: dict[str, list[str]] = {}
+        for token in parsed.required | parsed.optional | parsed.exclude:
+            if len(token) > 1 and token.endswith("*"):
+                expansions[token] = index.term_dictionary().expand(
+                    token[:-1], MAX_PREFIX_EXPANSIONS
+                )
+        return expansions
 
-        return candidates
+    @staticmethod
+    def _expand_fuzzy(parsed: ParsedQuery, index: InvertedIndex) -> dict[str, dict[str, int]]:
+        """
+        Map each query token missing from the index to nearby indexed
+        terms and their edit distance, closest and most frequent first.
+        """
+        fuzzy: dict[str, dict[str, int]] = {}
+        for token in parsed.required | parsed.optional:
+            if len(token) < 3 or token.endswith("*") or index.doc_freqs.get(token, 0) > 0:
+                continue
+            matches = index.deletion_index().lookup(
+                token,
+                index.doc_freqs,
+                max_distance=1 if len(token) <= 5 else 2,
+                limit=MAX_FUZZY_EXPANSIONS,
+            )
+            if matches:
+                fuzzy[token] = {term: distance for term, distance, _ in matches}
+        return fuzzy
+
+    @staticmethod
+    def _penalize_fuzzy(
+        result: RankingResult,
+        doc_id: int,
+        fuzzy_terms: dict[str, dict[str, int]],
+        fuzzy_docs: Mapping[str, KeysView[int]],
+    ) -> RankingResult:
+        # Each fuzzy token costs the distance of the closest term the
+        # document actually contains.
+        factor = 1.0
+        for terms in fuzzy_terms.values():
+            distance = min(
+                (d for term, d in terms.items() if doc_id in fuzzy_docs[term]),
+                default=0,
+            )
+            factor *= FUZZY_PENALTY**distance
+        if factor == 1.0:
+            return result
+        return RankingResult(
+            result.score * factor,
+            {**result.components, "fuzzy_penalty": factor},
+            result.per_term,
+        )
+
+    @staticmethod
+    def _order_by_rarity(tokens: list[str], index: InvertedIndex) -> list[str]:
+        # Rarest first; the token itself breaks ties so the order (and hence
+        # floating-point summation order) does not depend on set iteration.
+        doc_freqs = index.doc_freqs
+        return sorted(set(tokens), key=lambda t: (doc_freqs.get(t, 0), t))
+
+    def driving_terms(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Split `query_tokens` into (driving, non-driving) terms.
+
+        With `max_df_ratio` set, a term whose document frequency exceeds
+        index.stats.df_cutoff(max_df_ratio) is non-driving: it is scored
+        on candidates found through the other terms but yields none
+        itself, so "news" in a news corpus cannot pull in most of it.
+        If no other term occurs at all, the rarest common one drives.
+        Conjunctive queries are unaffected when some required term
+        drives; a disjunct on a common term only matches documents
+        reached through the others.
+        """
+        if self.max_df_ratio is None:
+            return list(query_tokens), []
+        index = index if index is not None else self.index
+        cutoff = index.stats.df_cutoff(self.max_df_ratio)
+        doc_freqs = index.doc_freqs
+        common = [t for t in query_tokens if doc_freqs.get(t, 0) > cutoff]
+        driving = [t for t in query_tokens if t not in common]
+        if common and not any(doc_freqs.get(t, 0) for t in driving):
+            rarest = min(common, key=lambda t: (doc_freqs[t], t))
+            common.remove(rarest)
+            driving.append(rarest)
+        return driving, common
+
+    def _candidate_documents(
+        self,
+        query_tokens: list[str],
+        index: InvertedIndex | None = None,
+    ) -> Iterator[int]:
+        """Yield each candidate once, following postings in token order."""
+        index = index if index is not None else self.index
+        seen: set[int] = set()
+
+        for token in query_tokens:
+            for doc_id, _ in index.get_postings(token):
+                if doc_id not in seen:
+                    seen.add(doc_id)
+                    yield doc_id
+
+    def save(self, path: str, *, block_size: int = 32) -> None:
+        """
+        Write the index as JSON to `path`, the stored documents to a
+        compressed doc store (`<path>.docs`) and the metadata columns to
+        `<path>.columns.npz` alongside it.
+        """
+        index = self.index
+        docs_path = f"{path}.docs"
+        DocStore.write(docs_path, index.documents.items(), block_size=block_size).close()
+        columns_path = f"{path}.columns.npz"
+        index.columns.save(columns_path)
 
-    def save(self, path: str) -> None:
         payload = {
-            "index": self._index.to_dict(),
+            "index": index.to_dict(include_documents=False),
+            "docstore": os.path.basename(docs_path),
+            "columns": os.path.basename(columns_path),
             "config": {
                 "stopwords": sorted(self.stopwords),
                 "field_weights": self._field_weights,
                 "ngram": self._tokenizer.ngram,
+                "max_df_ratio": self.max_df_ratio,
             },
         }
 
@@ -217,11 +814,25 @@ class SearchEngine:
             json.dump(payload, f)
 
     @classmethod
-    def load(cls, path: str, *, ranking: RankingStrategy) -> SearchEngine:
+    def load(
+        cls,
+        path: str,
+        *,
+        ranking: RankingStrategy,
+        cache_blocks: int = 64,
+    ) -> SearchEngine:
         with open(path, encoding="utf-8") as f:
             data = json.load(f)
 
         index = InvertedIndex.from_dict(data["index"])
+        if "docstore" in data:
+            docs_path = os.path.join(os.path.dirname(path), data["docstore"])
+            index.documents = StoredDocuments(DocStore(docs_path, cache_blocks=cache_blocks))
+        if "columns" in data:
+            columns_path = os.path.join(os.path.dirname(path), data["columns"])
+            index.columns = ColumnStore.load(columns_path)
+        else:
+            index.columns = ColumnStore.from_documents(index.documents)
         config = data["config"]
 
         tokenizer = Tokenizer(ngram=config["ngram"])
@@ -232,10 +843,42 @@ class SearchEngine:
             tokenizer=tokenizer,
             stopwords=set(config["stopwords"]),
             field_weights=config["field_weights"],
+            max_df_ratio=config.get("max_df_ratio"),
         )
 
-    def _on_index_change(self, doc_id: int) -> None:
-        pass
+    def _on_index_change(self, doc_ids: tuple[int, ...]) -> None:
+        if self.hot_cache is not None and self._state is not None:
+            snapshot = self._state.snapshot()
+            self.hot_cache.invalidate(
+                {t for doc_id in doc_ids for t in snapshot.get_document_tokens(doc_id)}
+            )
+
+    def _cache_version(self) -> int | None:
+        # Read before taking a snapshot: IndexState publishes a new
+        # snapshot before announcing the change, so a version read after
+        # could already include an invalidation the snapshot predates.
+        return self.hot_cache.version if self.hot_cache is not None else None
+
+    def _invalidate_hot_cache(self, tokens: Iterable[str]) -> None:
+        # Without an IndexState the engine's own writes announce changes.
+        if self.hot_cache is not None:
+            self.hot_cache.invalidate(tokens)
+            self._hot_cache_seen = self._index_size(self._index)
+
+    def _check_hot_cache(self, index: InvertedIndex) -> None:
+        # Documents added through the index itself announce nothing;
+        # notice them by size and drop every entry.
+        if self.hot_cache is None:
+            return
+        size = self._index_size(index)
+        if size != self._hot_cache_seen:
+            if self._hot_cache_seen is not None:
+                self.hot_cache.clear()
+            self._hot_cache_seen = size
+
+    @staticmethod
+    def _index_size(index: InvertedIndex) -> tuple[int, int]:
+        return index.stats.total_docs, index.stats.total_length
 
     @staticmethod
     def _matches_phrases(
@@ -0,0 +1,100 @@
+# scout/search/facets.py
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, Literal
+
+import numpy as np
+
+from scout.index.columns import ColumnStore, parse_datetime
+
+_DateUnit = Literal["Y", "M", "D"]
+
+# "field:granularity" for date fields -> (numpy unit, label formatter)
+_DATE_BUCKETS: dict[str, tuple[_DateUnit, Callable[[np.datetime64], Any]]] = {
+    "year": ("Y", lambda v: int(str(v))),
+    "month": ("M", str),
+    "day": ("D", str),
+}
+
+
+def parse_facet(spec: str) -> tuple[str, str | None]:
+    field, _, bucket = spec.partition(":")
+    if bucket and bucket not in _DATE_BUCKETS:
+        raise ValueError(
+            f"Unknown facet granularity {bucket!r} (expected one of {sorted(_DATE_BUCKETS)})"
+        )
+    return field, bucket or None
+
+
+def _ordered(counts: dict[Any, int]) -> dict[Any, int]:
+    # Highest count first; ties by label so output is deterministic.
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], str(item[0]))))
+
+
+def count_facets(
+    specs: Sequence[str],
+    columns: ColumnStore,
+    ordinals: np.ndarray,
+    fetch_documents: Callable[[], Sequence[dict[str, Any]]],
+) -> dict[str, dict[Any, int]]:
+    """
+    Value counts per facet over the documents at `ordinals`.
+
+    Columnar fields are counted with bincount / unique over the column
+    slice. Fields without a column fall back to the stored documents,
+    which `fetch_documents` supplies (in `ordinals` order) only if needed.
+    """
+    facets: dict[str, dict[Any, int]] = {}
+    documents: Sequence[dict[str, Any]] | None = None
+
+    for spec in specs:
+        field, bucket = parse_facet(spec)
+        column = columns.column(field)
+
+        if column is None:
+            if documents is None:
+                documents = fetch_documents()
+            facets[spec] = _ordered(_count_documents(documents, field, bucket))
+            continue
+
+        values = columns.values(field, ordinals)
+        assert values is not None
+        if column.kind == "category":
+            codes = values[values >= 0]
+            counts = np.bincount(codes, minlength=len(column.categories))
+            facets[spec] = _ordered(
+                {column.categories[code]: int(counts[code]) for code in np.flatnonzero(counts)}
+            )
+        elif column.kind == "datetime":
+            unit, label = _DATE_BUCKETS[bucket or "day"]
+            present = values[~np.isnat(values)].astype(f"datetime64[{unit}]")
+            keys, counts = np.unique(present, return_counts=True)
+            facets[spec] = _ordered({label(k): int(n) for k, n in zip(keys, counts, strict=True)})
+        else:
+            present = values[~np.isnan(values)]
+            keys, counts = np.unique(present, return_counts=True)
+            facets[spec] = _ordered({float(k): int(n) for k, n in zip(keys, counts, strict=True)})
+
+    return facets
+
+
+def _count_documents(
+    documents: Sequence[dict[str, Any]], field: str, bucket: str | None
+) -> Counter[Any]:
+    counts: Counter[Any] = Counter()
+    for metadata in documents:
+        value = metadata.get(field)
+        if value is None:
+            continue
+        if bucket is not None:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                continue
+            unit, label = _DATE_BUCKETS[bucket]
+            value = label(np.datetime64(parsed, unit))
+        if isinstance(value, Hashable):
+            counts[value] += 1
+    return counts
@@ -0,0 +1,204 @@
+# scout/search/filters.py
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from scout.index.bitmap import DocBitmap
+from scout.index.columns import Column, ColumnStore, parse_datetime
+
+_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class Term:
+    """Metadata field equals `value`."""
+
+    field: str
+    value: Any
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        return bool(metadata.get(self.field) == self.value)
+
+
+@dataclass(frozen=True)
+class Range:
+    """
+    Metadata field within bounds (any subset of gt/gte/lt/lte).
+
+    Bounds on date fields may be datetimes, dates or ISO strings.
+    """
+
+    field: str
+    gt: Any = None
+    gte: Any = None
+    lt: Any = None
+    lte: Any = None
+
+    def __post_init__(self) -> None:
+        if all(b is None for b in (self.gt, self.gte, self.lt, self.lte)):
+            raise ValueError(f"Range on {self.field!r} needs at least one bound")
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        value = metadata.get(self.field)
+        if value is None:
+            return False
+
+        bounds = (self.gt, self.gte, self.lt, self.lte)
+        if any(isinstance(b, (datetime, date)) for b in bounds) or (
+            isinstance(value, (str, datetime, date)) and parse_datetime(value) is not None
+        ):
+            value = parse_datetime(value)
+            gt, gte, lt, lte = (None if b is None else parse_datetime(b) for b in bounds)
+            if value is None:
+                return False
+        else:
+            gt, gte, lt, lte = bounds
+
+        try:
+            return (
+                (gt is None or value > gt)
+                and (gte is None or value >= gte)
+                and (lt is None or value < lt)
+                and (lte is None or value <= lte)
+            )
+        except TypeError:
+            return False
+
+
+Filter = Term | Range
+
+
+def _encode_bound(column: Column, bound: Any) -> Any:
+    if column.kind == "datetime":
+        parsed = parse_datetime(bound)
+        if parsed is None:
+            raise ValueError(f"Cannot compare {bound!r} with a date field")
+        return np.datetime64(parsed, "us")
+    return float(bound)
+
+
+def _term_bitmap(column: Column, clause: Term) -> DocBitmap:
+    if column.kind == "category":
+        code = column.code(clause.value)
+        if code is None:
+            return DocBitmap()
+        return DocBitmap.from_ordinals(np.flatnonzero(column.values == code))
+
+    try:
+        target = _encode_bound(column, clause.value)
+    except (TypeError, ValueError):
+        return DocBitmap()
+    return DocBitmap.from_ordinals(np.flatnonzero(column.values == target))
+
+
+def _range_bitmap(column: Column, clause: Range) -> DocBitmap:
+    if column.kind == "category":
+        raise ValueError(f"Range filters are not supported on category field {clause.field!r}")
+
+    # Binary search over the column in sorted order; missing values
+    # (NaN/NaT) sort last and fall outside every finite bound.
+    order = column.sorted_order()
+    ordered = column.values[order]
+    valid = len(ordered) - int(
+        np.isnat(ordered).sum() if column.kind == "datetime" else np.isnan(ordered).sum()
+    )
+
+    lo, hi = 0, valid
+    if clause.gte is not None:
+        lo = max(lo, int(np.searchsorted(ordered[:valid], _encode_bound(column, clause.gte), "left")))
+    if clause.gt is not None:
+        lo = max(lo, int(np.searchsorted(ordered[:valid], _encode_bound(column, clause.gt), "right")))
+    if clause.lte is not None:
+        hi = min(hi, int(np.searchsorted(ordered[:valid], _encode_bound(column, clause.lte), "right")))
+    if clause.lt is not None:
+        hi = min(hi, int(np.searchsorted(ordered[:valid], _encode_bound(column, clause.lt), "left")))
+
+    if lo >= hi:
+        return DocBitmap()
+    return DocBitmap.from_ordinals(order[lo:hi])
+
+
+def _clause_bitmap(column: Column, clause: Filter) -> DocBitmap:
+    if isinstance(clause, Term):
+        return _term_bitmap(column, clause)
+    return _range_bitmap(column, clause)
+
+
+class FilterCache:
+    """
+    Per-ColumnStore LRU of clause -> DocBitmap.
+
+    Entries are keyed by the store's version, so a store that changes in
+    place never serves stale bitmaps; forked stores start empty.
+    """
+
+    def __init__(self, size: int = _CACHE_SIZE) -> None:
+        self.size = size
+        self._lock = threading.Lock()
+        self._stores: WeakKeyDictionary[ColumnStore, OrderedDict[Any, DocBitmap]] = WeakKeyDictionary()
+
+    def bitmap(self, columns: ColumnStore, clause: Filter) -> DocBitmap:
+        column = columns.column(clause.field)
+        assert column is not None
+        key = (columns.version, clause)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable values (e.g. a list) match nothing in a column
+            # and cannot be cache keys.
+            return _clause_bitmap(column, clause)
+
+        with self._lock:
+            entries = self._stores.setdefault(columns, OrderedDict())
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                return cached
+
+        bitmap = _clause_bitmap(column, clause)
+
+        with self._lock:
+            entries[key] = bitmap
+            while len(entries) > self.size:
+                entries.popitem(last=False)
+        return bitmap
+
+
+_default_cache = FilterCache()
+
+
+def evaluate_filters(
+    filters: Iterable[Filter],
+    columns: ColumnStore,
+    *,
+    cache: FilterCache | None = None,
+) -> tuple[DocBitmap | None, list[Filter]]:
+    """
+    Intersect the bitmaps of every clause that has a metadata column.
+
+    Returns (allowed ordinals or None if no clause was columnar, clauses
+    without a column, to be checked per document).
+    """
+    cache = cache or _default_cache
+    allowed: DocBitmap | None = None
+    residual: list[Filter] = []
+
+    for clause in filters:
+        if columns.column(clause.field) is None:
+            residual.append(clause)
+            continue
+        bitmap = cache.bitmap(columns, clause)
+        allowed = bitmap if allowed is None else allowed & bitmap
+        if not allowed:
+            break
+
+    return allowed, residual
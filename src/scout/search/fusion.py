@@ -0,0 +1,298 @@
+# scout/search/fusion.py
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from scout.index.inverted import InvertedIndex
+from scout.ranking.base import RankingResult, RankingStrategy
+from scout.search.budget import SearchBudget, SearchResults
+from scout.search.filters import Filter
+from scout.search.topk import TopK, column_groups
+
+if TYPE_CHECKING:
+    from scout.search.engine import SearchEngine
+    from scout.state.signals import IndexSnapshot
+
+Hit = tuple[Any, RankingResult]
+FusionMethod = Literal["rrf", "score"]
+
+# Rank offset in reciprocal rank fusion; 60 is the usual choice and
+# keeps any single list's top hit from dominating.
+RRF_K = 60
+DEFAULT_FUSION_DEPTH = 100
+
+
+class Retriever(Protocol):
+    """A ListFusion member that retrieves its own list (e.g. DenseRetriever)."""
+
+    def retrieve(
+        self,
+        engine: SearchEngine,
+        query: str,
+        view: tuple[InvertedIndex, IndexSnapshot | None],
+        *,
+        limit: int,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults: ...
+
+
+def _names(rankings: Sequence[RankingStrategy | Retriever]) -> list[str]:
+    """Class name per ranking, numbered when a class appears twice."""
+    names = [type(r).__name__ for r in rankings]
+    return [
+        f"{name}#{i}" if names.count(name) > 1 else name
+        for i, name in enumerate(names)
+    ]
+
+
+def _fused(
+    lists: Sequence[Sequence[Hit]],
+    names: Sequence[str],
+    contribution: Sequence[dict[Any, float]],
+) -> list[Hit]:
+    # Per-term breakdowns are merged from every list a document is in.
+    scores: dict[Any, float] = {}
+    components: dict[Any, dict[str, float]] = {}
+    per_term: dict[Any, dict[str, dict[str, float]]] = {}
+    for name, hits, contributions in zip(names, lists, contribution, strict=True):
+        for doc_id, result in hits:
+            value = contributions[doc_id]
+            scores[doc_id] = scores.get(doc_id, 0.0) + value
+            components.setdefault(doc_id, {})[name] = value
+            terms = per_term.setdefault(doc_id, {})
+            for token, breakdown in result.per_term.items():
+                terms.setdefault(token, {}).update(breakdown)
+
+    fused = [
+        (doc_id, RankingResult(score, components[doc_id], per_term[doc_id]))
+        for doc_id, score in scores.items()
+    ]
+    fused.sort(key=lambda hit: (-hit[1].score, hit[0]))
+    return fused
+
+
+def reciprocal_rank_fusion(
+    lists: Sequence[Sequence[Hit]],
+    *,
+    names: Sequence[str] | None = None,
+    weights: Sequence[float] | None = None,
+    k: int = RRF_K,
+) -> list[Hit]:
+    """
+    Fuse ranked lists by summing weight / (k + rank) per document.
+
+    Only ranks matter, so lists on incomparable score scales fuse
+    cleanly. Ties are broken by doc id.
+    """
+    names = names if names is not None else [str(i) for i in range(len(lists))]
+    weights = weights if weights is not None else [1.0] * len(lists)
+    contribution = [
+        {doc_id: weight / (k + rank) for rank, (doc_id, _) in enumerate(hits, start=1)}
+        for hits, weight in zip(lists, weights, strict=True)
+    ]
+    return _fused(lists, names, contribution)
+
+
+def normalized_score_fusion(
+    lists: Sequence[Sequence[Hit]],
+    *,
+    names: Sequence[str] | None = None,
+    weights: Sequence[float] | None = None,
+) -> list[Hit]:
+    """
+    Fuse ranked lists by summing min-max normalized, weighted scores.
+
+    Each list's scores are mapped onto [0, 1] (a list whose scores are
+    all equal maps to 1); a document missing from a list gets nothing
+    from it. Ties are broken by doc id.
+    """
+    names = names if names is not None else [str(i) for i in range(len(lists))]
+    weights = weights if weights is not None else [1.0] * len(lists)
+    contribution = []
+    for hits, weight in zip(lists, weights, strict=True):
+        scores = [result.score for _, result in hits]
+        low, high = (min(scores), max(scores)) if scores else (0.0, 0.0)
+        span = high - low
+        contribution.append(
+            {
+                doc_id: weight * ((result.score - low) / span if span else 1.0)
+                for doc_id, result in hits
+            }
+        )
+    return _fused(lists, names, contribution)
+
+
+class ListFusion:
+    """
+    List-level fusion of several rankings.
+
+    Rather than scoring every candidate with every strategy (as
+    FusionRanking does), each ranking retrieves its own top `depth`
+    independently, taking its fastest path (BM25 reads impact-ordered
+    champion lists where the query allows). The lists are then fused
+    with reciprocal rank fusion ("rrf") or normalized score fusion
+    ("score").
+
+    Besides ranking strategies, members can be retrievers that find
+    their own candidates, such as DenseRetriever for hybrid lexical +
+    vector search.
+
+    With `max_workers` > 1 the rankings run concurrently on a thread
+    pool. That only pays off for rankings that spend their time outside
+    the GIL (large NumPy batches, remote scorers); pure-Python scoring
+    is faster inline, which is the default.
+
+    Assign to `engine.fusion` to use it for every search; per-ranking
+    and fusion latencies are reported in `results.stages`.
+    """
+
+    def __init__(
+        self,
+        rankings: Sequence[RankingStrategy | Retriever],
+        *,
+        method: FusionMethod = "rrf",
+        weights: Sequence[float] | None = None,
+        depth: int = DEFAULT_FUSION_DEPTH,
+        rrf_k: int = RRF_K,
+        max_workers: int = 1,
+    ) -> None:
+        if not rankings:
+            raise ValueError("ListFusion needs at least one ranking")
+        if weights is not None and len(weights) != len(rankings):
+            raise ValueError("weights must match rankings")
+        if method not in ("rrf", "score"):
+            raise ValueError(f"Unknown fusion method: {method}")
+        if depth <= 0:
+            raise ValueError("depth must be > 0")
+
+        self.rankings = list(rankings)
+        self.names = _names(self.rankings)
+        self.method = method
+        self.weights = list(weights) if weights is not None else None
+        self.depth = depth
+        self.rrf_k = rrf_k
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="scout-fusion",
+                )
+            return self._executor
+
+    def fuse(self, lists: Sequence[Sequence[Hit]]) -> list[Hit]:
+        if self.method == "rrf":
+            return reciprocal_rank_fusion(
+                lists, names=self.names, weights=self.weights, k=self.rrf_k
+            )
+        return normalized_score_fusion(lists, names=self.names, weights=self.weights)
+
+    def run(
+        self,
+        engine: SearchEngine,
+        query: str,
+        view: tuple[InvertedIndex, IndexSnapshot | None],
+        *,
+        limit: int,
+        budget: SearchBudget | None = None,
+        filters: Sequence[Filter] | None = None,
+        facets: Sequence[str] | None = None,
+        collapse_on: str | None = None,
+        fuzzy: bool = False,
+    ) -> SearchResults:
+        """Search `view` with every ranking in parallel and fuse the lists."""
+        started = perf_counter()
+
+        def retrieve(
+            ranking: RankingStrategy | Retriever, facets: Sequence[str] | None
+        ) -> SearchResults:
+            if not isinstance(ranking, RankingStrategy):
+                return ranking.retrieve(
+                    engine,
+                    query,
+                    view,
+                    limit=max(limit, self.depth),
+                    budget=budget,
+                    filters=filters,
+                    collapse_on=collapse_on,
+                    fuzzy=fuzzy,
+                )
+            return engine._execute(
+                query,
+                view,
+                limit=max(limit, self.depth),
+                budget=budget,
+                filters=filters,
+                facets=facets,
+                collapse_on=collapse_on,
+                fuzzy=fuzzy,
+                ranking=ranking,
+                prune=True,
+            )
+
+        # Facets count lexical matches, which every ranking shares:
+        # count once, with the first ranking strategy.
+        lexical = next(
+            (i for i, r in enumerate(self.rankings) if isinstance(r, RankingStrategy)), None
+        )
+        facet_specs = [facets if i == lexical else None for i in range(len(self.rankings))]
+        if self.max_workers == 1 or len(self.rankings) == 1:
+            lists = [retrieve(r, f) for r, f in zip(self.rankings, facet_specs, strict=True)]
+        else:
+            lists = list(self._pool().map(retrieve, self.rankings, facet_specs))
+
+        fusing = perf_counter()
+        fused = self.fuse(lists)
+        if collapse_on:
+            # Each list is collapsed, but two lists can keep different
+            # documents from the same group.
+            index = view[0]
+            top = TopK(limit, column_groups(index.columns, collapse_on, index.get_document))
+            top.push_many(fused)
+            hits = top.results()
+        else:
+            hits = fused[:limit]
+
+        stages = {name: results.elapsed_ms for name, results in zip(self.names, lists, strict=True)}
+        stages["fuse"] = (perf_counter() - fusing) * 1000.0
+        return SearchResults(
+            hits,
+            partial=any(results.partial for results in lists),
+            candidates=max(results.candidates for results in lists),
+            scored=sum(results.scored for results in lists),
+            elapsed_ms=(perf_counter() - started) * 1000.0,
+            facets=lists[lexical].facets if lexical is not None else {},
+            stages=stages,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies (e.g. in process-pool workers) start their own pool.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_executor"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
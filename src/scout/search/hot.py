@@ -0,0 +1,165 @@
+# scout/search/hot.py
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from scout.search.budget import SearchResults
+from scout.search.query import normalize_query, parse_query
+from scout.state.usage import UsageStore
+
+if TYPE_CHECKING:
+    from scout.search.engine import SearchEngine
+
+
+def mine_query_log(path: str | Path, k: int) -> list[str]:
+    """
+    The `k` most frequent queries in a JSONL log, most frequent first.
+
+    Each line is a JSON object with a "query" (or "q") field, or a bare
+    JSON string. Lines that are neither are skipped.
+    """
+    counts: Counter[str] = Counter()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                entry = entry.get("query", entry.get("q"))
+            if isinstance(entry, str) and entry.strip():
+                counts[normalize_query(entry)] += 1
+    return [query for query, _ in counts.most_common(k)]
+
+
+def mine_usage(usage: UsageStore, k: int) -> list[str]:
+    """The `k` most frequent queries recorded by a UsageStore."""
+    return [query for query, _ in usage.top_queries(k)]
+
+
+class HotQueryCache:
+    """
+    Precomputed results for the hottest queries.
+
+    Only queries in the hot set are cached, each with its top `limit`
+    hits; searches for them with a smaller or equal limit and no other
+    options are answered from the cache.
+
+    Entries are kept fresh by the engine: when an index change adds
+    documents, every entry whose query shares a term with them is
+    dropped (prefix queries are dropped on any change), and the next
+    search, or `warm()`, recomputes it. Changes made to an engine's
+    index behind its back drop every entry. Other entries are kept even
+    though collection statistics such as IDF drift slightly, since no
+    new document can match them.
+    """
+
+    def __init__(self, engine: SearchEngine, queries: Iterable[str] = (), *, limit: int = 10) -> None:
+        self._engine = engine
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._entries: dict[str, SearchResults] = {}
+        self._by_term: dict[str, set[str]] = {}
+        self._wildcards: set[str] = set()
+        # Bumped by every invalidation, so results computed before one
+        # are not stored after it.
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.set_queries(queries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def queries(self) -> frozenset[str]:
+        return frozenset(self._hot)
+
+    def set_queries(self, queries: Iterable[str]) -> None:
+        """Replace the hot set; entries for queries still hot are kept."""
+        hot = {normalize_query(q) for q in queries}
+        by_term: dict[str, set[str]] = {}
+        wildcards: set[str] = set()
+        for query in hot:
+            parsed = parse_query(query)
+            terms = parsed.required | parsed.optional | parsed.exclude
+            terms |= {t for phrase in parsed.phrases for t in phrase}
+            if any(t.endswith("*") for t in terms):
+                wildcards.add(query)
+            for term in terms:
+                by_term.setdefault(term, set()).add(query)
+
+        with self._lock:
+            self._hot = hot
+            self._by_term = by_term
+            self._wildcards = wildcards
+            self._entries = {q: r for q, r in self._entries.items() if q in hot}
+
+    def warm(self) -> int:
+        """Compute every hot query without an entry; returns how many."""
+        missing = [q for q in self._hot if q not in self._entries]
+        engine = self._engine
+        for query in missing:
+            # Bypass search(): warming is not usage, and counting it would
+            # keep these queries hot in mine_usage().
+            version = self.version
+            engine._execute(
+                query, engine._snapshot(), limit=self.limit, budget=None, cache_version=version
+            )
+        return len(missing)
+
+    def get(self, query: str, limit: int) -> SearchResults | None:
+        if limit > self.limit:
+            return None
+        key = normalize_query(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            if key in self._hot:
+                self.misses += 1
+            return None
+        self.hits += 1
+        return SearchResults(
+            entry[:limit],
+            candidates=entry.candidates,
+            scored=entry.scored,
+        )
+
+    def put(self, query: str, limit: int, results: SearchResults, *, version: int) -> None:
+        """
+        Store `results`, computed with `limit` while the cache was at
+        `version`, if the query is hot, `limit` reaches the cached depth
+        and nothing was invalidated in the meantime.
+        """
+        key = normalize_query(query)
+        if key not in self._hot or limit < self.limit or results.partial:
+            return
+        entry = SearchResults(
+            results[: self.limit],
+            candidates=results.candidates,
+            scored=results.scored,
+        )
+        with self._lock:
+            if key in self._hot and version == self.version:
+                self._entries[key] = entry
+
+    def clear(self) -> None:
+        """Drop every entry, for changes whose terms are unknown."""
+        with self._lock:
+            self.version += 1
+            self._entries = {}
+
+    def invalidate(self, terms: Iterable[str]) -> None:
+        """Drop entries that documents containing `terms` could change."""
+        with self._lock:
+            self.version += 1
+            stale = set(self._wildcards)
+            for term in set(terms):
+                stale |= self._by_term.get(term, set())
+            for query in stale:
+                self._entries.pop(query, None)
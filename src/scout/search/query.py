@@ -12,6 +12,11 @@ class ParsedQuery:
     has_or: bool
 
 
+def normalize_query(query: str) -> str:
+    """Canonical form for counting and caching: lowercased, single-spaced."""
+    return " ".join(query.lower().split())
+
+
 def parse_query(query: str) -> ParsedQuery:
     tokens = query.strip().split()
 
@@ -0,0 +1,36 @@
+# scout/search/rerank.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from scout.ranking.base import RankingStrategy
+
+DEFAULT_RERANK_DEPTH = 100
+
+
+@dataclass(frozen=True)
+class Reranker:
+    """
+    Second retrieval stage: rescore the first stage's best `depth` hits.
+
+    The engine's own ranking becomes the cheap first stage and picks
+    the top `depth` matches; only those are scored with `ranking`
+    (e.g. the CompositeRanking built for "fusion"). Each search then
+    reports its per-stage latency in `results.stages`.
+
+    With `prune`, a BM25Ranking first stage reads impact-ordered
+    champion lists instead of scoring every match, for queries simple
+    enough to allow it (plain terms and OR, no filters, exclusions,
+    phrases, wildcards, fuzzy terms, budget, facets or collapsing).
+    Pruning is exact: it returns the same `depth` documents as the
+    exhaustive scan.
+    """
+
+    ranking: RankingStrategy
+    depth: int = DEFAULT_RERANK_DEPTH
+    prune: bool = True
+
+    def __post_init__(self) -> None:
+        if self.depth <= 0:
+            raise ValueError("depth must be > 0")
@@ -0,0 +1,265 @@
+# scout/search/sharded.py
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import threading
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any
+
+from scout.index.inverted import InvertedIndex
+from scout.ranking.base import RankingResult, RankingStrategy
+from scout.search.budget import SearchBudget, SearchResults
+from scout.search.engine import SearchEngine
+
+
+def shard_for(doc_id: Any, shards: int) -> int:
+    """Stable shard assignment (independent of PYTHONHASHSEED)."""
+    return zlib.crc32(str(doc_id).encode("utf-8")) % shards
+
+
+def _local_stats(index: InvertedIndex) -> dict[str, Any]:
+    return {
+        "doc_freqs": dict(index.doc_freqs),
+        "total_docs": index.stats.total_docs,
+        "total_length": index.stats.total_length,
+    }
+
+
+def _with_global_stats(
+    index: InvertedIndex,
+    doc_freqs: dict[str, int],
+    total_docs: int,
+    total_length: int,
+) -> InvertedIndex:
+    """
+    Fork of a shard whose df/N/total length describe the whole corpus.
+
+    Postings and per-document lengths stay local; every statistic a
+    ranking strategy reads is global, so shard scores equal the scores a
+    single-process engine over all documents would produce.
+    """
+    forked = index.fork()
+    forked.doc_freqs.clear()
+    forked.doc_freqs.update(doc_freqs)
+    forked.terms_changed()
+    forked.stats.total_docs = total_docs
+    forked.stats.total_length = total_length
+    return forked
+
+
+def _apply_stats_delta(
+    index: InvertedIndex,
+    df_delta: dict[str, int],
+    docs: int,
+    length: int,
+) -> InvertedIndex:
+    forked = index.fork()
+    for token, delta in df_delta.items():
+        forked.doc_freqs[token] += delta
+    forked.terms_changed(df_delta)
+    forked.stats.total_docs += docs
+    forked.stats.total_length += length
+    return forked
+
+
+def _shard_worker(conn: Connection, ranking: RankingStrategy, config: dict[str, Any]) -> None:
+    engine: SearchEngine | None = None
+
+    while True:
+        command, *args = conn.recv()
+        try:
+            if command == "close":
+                conn.send(("ok", None))
+                return
+
+            if command == "build":
+                (records,) = args
+                engine = SearchEngine.from_records(records, ranking=ranking, **config)
+                conn.send(("ok", _local_stats(engine.index)))
+                continue
+
+            assert engine is not None and engine._state is not None
+            state = engine._state
+
+            if command == "set_global":
+                state.index = _with_global_stats(state.index, *args)
+                reply: Any = None
+            elif command == "add":
+                doc_id, record = args
+                before = state.index.stats.total_length
+                engine.add_document(doc_id, record)
+                after = state.snapshot()
+                reply = (
+                    sorted(set(after.get_document_tokens(doc_id))),
+                    after.index.stats.total_length - before,
+                )
+            elif command == "stats_delta":
+                state.index = _apply_stats_delta(state.index, *args)
+                reply = None
+            elif command == "search":
+                query, limit, budget = args
+                reply = engine.search(query, limit=limit, budget=budget)
+            else:
+                raise ValueError(f"Unknown shard command: {command}")
+
+            conn.send(("ok", reply))
+        except Exception as exc:  # surfaced to the coordinator
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class ShardedSearchEngine:
+    """
+    Scatter-gather search over documents partitioned across worker processes.
+
+    Each worker owns an InvertedIndex shard. Corpus statistics (df, N and
+    total length for avgdl) are aggregated by the coordinator and pushed to
+    every shard, so merged results match SearchEngine exactly, including
+    (-score, doc_id) tie-breaking.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        *,
+        ranking: RankingStrategy,
+        shards: int = 2,
+        fields: list[str] | None = None,
+        ngram: int | None = None,
+        stopwords: set[str] | None = None,
+        field_weights: dict[str, float] | None = None,
+        max_df_ratio: float | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+
+        config = {
+            "fields": fields,
+            "ngram": ngram,
+            "stopwords": stopwords,
+            "field_weights": field_weights,
+            "max_df_ratio": max_df_ratio,
+        }
+        ctx = multiprocessing.get_context(start_method)
+
+        self._lock = threading.Lock()
+        self._conns: list[Connection] = []
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+
+        for _ in range(shards):
+            parent, child = ctx.Pipe()
+            worker = ctx.Process(  # type: ignore[attr-defined]
+                target=_shard_worker,
+                args=(child, ranking, config),
+                daemon=True,
+            )
+            worker.start()
+            child.close()
+            self._conns.append(parent)
+            self._workers.append(worker)
+
+        partitions: list[list[dict[str, Any]]] = [[] for _ in range(shards)]
+        for record in records:
+            partitions[shard_for(record.get("id"), shards)].append(record)
+
+        local = self._broadcast([("build", p) for p in partitions])
+
+        doc_freqs: Counter[str] = Counter()
+        total_docs = 0
+        total_length = 0
+        for stats in local:
+            doc_freqs.update(stats["doc_freqs"])
+            total_docs += stats["total_docs"]
+            total_length += stats["total_length"]
+
+        self._broadcast(
+            [("set_global", dict(doc_freqs), total_docs, total_length)] * shards
+        )
+
+    @property
+    def shards(self) -> int:
+        return len(self._conns)
+
+    def _broadcast(self, messages: list[tuple[Any, ...]]) -> list[Any]:
+        with self._lock:
+            for conn, message in zip(self._conns, messages, strict=True):
+                conn.send(message)
+            replies = [conn.recv() for conn in self._conns]
+
+        errors = [payload for status, payload in replies if status == "error"]
+        if errors:
+            raise RuntimeError(f"Shard failure: {errors[0]}")
+        return [payload for _, payload in replies]
+
+    def _request(self, shard: int, message: tuple[Any, ...]) -> Any:
+        with self._lock:
+            self._conns[shard].send(message)
+            status, payload = self._conns[shard].recv()
+        if status == "error":
+            raise RuntimeError(f"Shard failure: {payload}")
+        return payload
+
+    def add_document(self, doc_id: int, record: dict[str, Any]) -> None:
+        owner = shard_for(doc_id, self.shards)
+        tokens, length_delta = self._request(owner, ("add", doc_id, record))
+
+        df_delta = dict.fromkeys(tokens, 1)
+        for shard in range(self.shards):
+            if shard != owner:
+                self._request(shard, ("stats_delta", df_delta, 1, length_delta))
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        budget: SearchBudget | None = None,
+    ) -> SearchResults:
+        started = perf_counter()
+        shard_results: list[SearchResults] = self._broadcast(
+            [("search", query, limit, budget)] * self.shards
+        )
+
+        merged: list[tuple[int, RankingResult]] = list(
+            itertools.islice(
+                heapq.merge(
+                    *shard_results,
+                    key=lambda item: (-item[1].score, item[0]),
+                ),
+                limit,
+            )
+        )
+
+        return SearchResults(
+            merged,
+            partial=any(r.partial for r in shard_results),
+            candidates=sum(r.candidates for r in shard_results),
+            scored=sum(r.scored for r in shard_results),
+            elapsed_ms=(perf_counter() - started) * 1000.0,
+        )
+
+    def close(self) -> None:
+        if not self._conns:
+            return
+        try:
+            self._broadcast([("close",)] * self.shards)
+        finally:
+            for conn in self._conns:
+                conn.close()
+            for worker in self._workers:
+                worker.join(timeout=5)
+            self._conns = []
+            self._workers = []
+
+    def __enter__(self) -> ShardedSearchEngine:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,182 @@
+# scout/search/topk.py
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Hashable, Sequence
+from itertools import chain
+from typing import Any
+
+import numpy as np
+
+from scout.index.columns import ColumnStore
+from scout.ranking.base import RankingResult
+
+Hit = tuple[Any, RankingResult]
+
+
+def _rank_key(hit: Hit) -> tuple[float, Any]:
+    return (-hit[1].score, hit[0])
+
+
+def parse_sort(sort_by: str) -> tuple[str, bool]:
+    """"date" sorts ascending, "-date" descending."""
+    if sort_by.startswith("-"):
+        return sort_by[1:], True
+    return sort_by, False
+
+
+class TopK:
+    """
+    Best `limit` hits by score (ties by doc id), kept in bounded memory.
+
+    With a `group_of` function only the best hit per group is kept
+    (field collapsing); hits whose group is None are never collapsed.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        group_of: Callable[[Sequence[Any]], Sequence[Hashable | None]] | None = None,
+    ) -> None:
+        self.limit = limit
+        self._group_of = group_of
+        # Best hits without a group (all hits when not collapsing).
+        self._top: list[Hit] = []
+        self._best: dict[Hashable, Hit] = {}
+
+    def push_many(self, hits: list[Hit]) -> None:
+        if self._group_of is None:
+            self._top = heapq.nsmallest(self.limit, chain(self._top, hits), key=_rank_key)
+            return
+
+        ungrouped: list[Hit] = []
+        groups = self._group_of([doc_id for doc_id, _ in hits])
+        for hit, group in zip(hits, groups, strict=True):
+            if group is None:
+                ungrouped.append(hit)
+                continue
+            best = self._best.get(group)
+            if best is None or _rank_key(hit) < _rank_key(best):
+                self._best[group] = hit
+        if ungrouped:
+            self._top = heapq.nsmallest(
+                self.limit, chain(self._top, ungrouped), key=_rank_key
+            )
+
+    def results(self) -> list[Hit]:
+        if self._group_of is None:
+            return self._top
+        return heapq.nsmallest(
+            self.limit, chain(self._best.values(), self._top), key=_rank_key
+        )
+
+
+def column_groups(
+    columns: ColumnStore,
+    field: str,
+    get_document: Callable[[Any], dict[str, Any]],
+) -> Callable[[Sequence[Any]], list[Hashable | None]]:
+    """Group key per doc id: the column value, or the stored value without a column."""
+    column = columns.column(field)
+
+    def group_of(doc_ids: Sequence[Any]) -> list[Hashable | None]:
+        if column is None:
+            stored = (get_document(doc_id).get(field) for doc_id in doc_ids)
+            return [v if isinstance(v, Hashable) else None for v in stored]
+
+        values = columns.values(field, columns.ordinals_for(doc_ids))
+        assert values is not None
+        missing = _missing_mask(column.kind, values)
+        return [None if m else v for v, m in zip(values.tolist(), missing.tolist(), strict=True)]
+
+    return group_of
+
+
+def _missing_mask(kind: str, values: np.ndarray) -> np.ndarray:
+    mask: np.ndarray
+    if kind == "category":
+        mask = values < 0
+    elif kind == "datetime":
+        mask = np.isnat(values)
+    else:
+        mask = np.isnan(values)
+    return mask
+
+
+def _sort_keys(columns: ColumnStore, field: str, values: np.ndarray, descending: bool) -> np.ndarray:
+    column = columns.column(field)
+    assert column is not None
+    missing = _missing_mask(column.kind, values)
+
+    if column.kind == "category":
+        # Codes are in insertion order; rank them by category value.
+        order = sorted(range(len(column.categories)), key=lambda c: str(column.categories[c]))
+        rank = np.empty(len(order), dtype=np.float64)
+        rank[order] = np.arange(len(order))
+        keys = rank[np.where(missing, 0, values)]
+    elif column.kind == "datetime":
+        keys = values.astype(np.int64).astype(np.float64)
+    else:
+        keys = values.astype(np.float64)
+
+    if descending:
+        keys = -keys
+    keys[missing] = np.inf  # missing values sort last either way
+    return keys
+
+
+def top_by_column(
+    doc_ids: Sequence[Any],
+    columns: ColumnStore,
+    field: str,
+    limit: int,
+    *,
+    descending: bool = False,
+    collapse_on: str | None = None,
+    get_document: Callable[[Any], dict[str, Any]] | None = None,
+) -> list[Any]:
+    """
+    The `limit` doc ids with the smallest (or largest) `field` value.
+
+    Works on column slices: argpartition bounds the work to O(n) plus a
+    sort of the top `limit`. Ties are broken by doc id. With
+    `collapse_on`, only the first doc per group (in sort order) counts.
+    """
+    if columns.column(field) is None:
+        raise ValueError(f"Cannot sort on {field!r}: it has no metadata column")
+    if not doc_ids or limit <= 0:
+        return []
+
+    ordinals = columns.ordinals_for(doc_ids)
+    values = columns.values(field, ordinals)
+    assert values is not None
+    keys = _sort_keys(columns, field, values, descending)
+    ids = np.array(doc_ids, dtype=object)
+
+    if collapse_on is not None:
+        assert get_document is not None
+        groups = column_groups(columns, collapse_on, get_document)(doc_ids)
+        tiebreak = np.argsort(np.argsort(ids, kind="stable"), kind="stable")
+        order = np.lexsort((tiebreak, keys))
+        seen: set[Hashable] = set()
+        winners = []
+        for i in order.tolist():
+            group = groups[i]
+            if group is not None:
+                if group in seen:
+                    continue
+                seen.add(group)
+            winners.append(i)
+            if len(winners) == limit:
+                break
+        return [doc_ids[i] for i in winners]
+
+    if len(keys) > limit:
+        kth = np.partition(keys, limit - 1)[limit - 1]
+        selected = np.flatnonzero(keys <= kth)  # keep ties at the boundary
+    else:
+        selected = np.arange(len(keys))
+
+    best = sorted(selected.tolist(), key=lambda i: (keys[i], ids[i]))[:limit]
+    return [doc_ids[i] for i in best]
@@ -0,0 +1,172 @@
+# scout/server/batching.py
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from time import monotonic
+
+from scout.search.budget import SearchResults
+from scout.search.engine import SearchEngine
+
+
+class Overloaded(RuntimeError):
+    """Request refused or shed because the server is saturated."""
+
+
+@dataclass
+class _Request:
+    query: str
+    limit: int
+    enqueued: float = field(default_factory=monotonic)
+    future: Future[SearchResults] = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """
+    Collects concurrent search requests into engine.search_many() calls.
+
+    - A batch closes after `max_batch` requests or `max_wait_ms`, whichever
+      comes first
+    - Admission control: at most `max_queue` requests may wait; submit()
+      raises Overloaded beyond that
+    - Load shedding: requests that waited longer than `max_queue_delay_ms`
+      by the time their batch runs fail with Overloaded instead of running
+    - close() finishes the running batch and fails requests still queued
+      with Overloaded
+    """
+
+    def __init__(
+        self,
+        engine: SearchEngine,
+        *,
+        max_batch: int = 32,
+        max_wait_ms: float = 2.0,
+        max_queue: int = 1024,
+        max_queue_delay_ms: float | None = 1000.0,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+
+        self._engine = engine
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_delay = (
+            max_queue_delay_ms / 1000.0 if max_queue_delay_ms is not None else None
+        )
+        self._queue: queue.Queue[_Request | None] = queue.Queue(maxsize=max_queue)
+        self._closing = threading.Event()
+
+        self.batches = 0
+        self.shed = 0
+        self.rejected = 0
+
+        self._thread = threading.Thread(
+            target=self._loop, name="scout-batcher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, query: str, *, limit: int = 10) -> Future[SearchResults]:
+        if self._closing.is_set():
+            raise Overloaded("server is shutting down")
+        request = _Request(query=query, limit=limit)
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            self.rejected += 1
+            raise Overloaded(f"{self._queue.maxsize} requests already queued") from None
+        return request.future
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        timeout: float | None = None,
+    ) -> SearchResults:
+        future = self.submit(query, limit=limit)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise Overloaded(f"no result within {timeout}s") from None
+
+    def _collect(self, first: _Request) -> list[_Request]:
+        batch = [first]
+        deadline = monotonic() + self._max_wait
+
+        while len(batch) < self._max_batch:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                break  # close() was called; _loop stops after this batch
+            batch.append(item)
+
+        return batch
+
+    def _loop(self) -> None:
+        while not self._closing.is_set():
+            first = self._queue.get()
+            if first is None:
+                break
+            self._run(self._collect(first))
+        self._fail_queued()
+
+    def _run(self, batch: list[_Request]) -> None:
+        now = monotonic()
+        live: list[_Request] = []
+
+        for request in batch:
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            if self._max_delay is not None and now - request.enqueued > self._max_delay:
+                self.shed += 1
+                request.future.set_exception(Overloaded("queue delay exceeded"))
+                continue
+            live.append(request)
+
+        if not live:
+            return
+
+        # One limit per batch; each caller's list is cut to its own limit.
+        limit = max(r.limit for r in live)
+        try:
+            results = self._engine.search_many([r.query for r in live], limit=limit)
+        except Exception as exc:
+            for request in live:
+                request.future.set_exception(exc)
+            return
+
+        self.batches += 1
+        for request, result in zip(live, results, strict=True):
+            del result[request.limit :]
+            request.future.set_result(result)
+
+    def _fail_queued(self) -> None:
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None and request.future.set_running_or_notify_cancel():
+                request.future.set_exception(Overloaded("server is shutting down"))
+
+    def close(self) -> None:
+        self._closing.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # _loop is busy, not waiting, and sees _closing next
+        self._thread.join(timeout=5)
+        self._fail_queued()
@@ -0,0 +1,241 @@
+# scout/server/http.py
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from scout.explain import explain_query
+from scout.ranking.base import RankingResult
+from scout.search.engine import SearchEngine
+from scout.server.batching import MicroBatcher, Overloaded
+
+MAX_LIMIT = 1000
+
+
+def _hit(doc_id: Any, result: RankingResult, *, explain: bool) -> dict[str, Any]:
+    hit: dict[str, Any] = {"doc_id": doc_id, "score": result.score}
+    if explain:
+        hit["components"] = result.components
+        hit["per_term"] = result.per_term
+    return hit
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET /search?q=...&limit=N   ranked results (micro-batched)
+    GET /explain?q=...&limit=N  results with scoring breakdowns
+    GET /autocomplete?q=...&limit=N  most frequent terms with the prefix
+    GET /healthz                liveness plus queue counters
+    POST /click {"doc_id": ...}  record a click on a known doc (needs engine.usage)
+    """
+
+    server: SearchHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+
+        if url.path == "/healthz":
+            self._send(HTTPStatus.OK, self.server.health())
+            return
+
+        if url.path not in ("/search", "/explain", "/autocomplete"):
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown path {url.path}"})
+            return
+
+        query = params.get("q", [""])[0]
+        try:
+            limit = int(params.get("limit", ["10"])[0])
+        except ValueError:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": "limit must be an integer"})
+            return
+        if not query or not 0 < limit <= MAX_LIMIT:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": "q and 0 < limit <= 1000 required"})
+            return
+
+        payload: dict[str, Any]
+        try:
+            if url.path == "/autocomplete":
+                completions = self.server.engine.autocomplete(query, limit)
+                payload = {"completions": [{"term": t, "df": df} for t, df in completions]}
+            elif url.path == "/explain":
+                hits = explain_query(self.server.engine, query, limit=limit)
+                payload = {"results": [_hit(d, r, explain=True) for d, r in hits]}
+            else:
+                results = self.server.batcher.search(
+                    query, limit=limit, timeout=self.server.request_timeout_s
+                )
+                payload = {
+                    "results": [_hit(d, r, explain=False) for d, r in results],
+                    "partial": results.partial,
+                }
+        except Overloaded as exc:
+            self._send(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)})
+            return
+        except Exception as exc:
+            # A failed request must still answer, or the client hangs on
+            # the keep-alive connection.
+            action = url.path.lstrip("/")
+            self.log_error("%s for %r failed: %r", action, query, exc)
+            self._send(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"{action} failed: {type(exc).__name__}"},
+            )
+            return
+
+        self._send(HTTPStatus.OK, payload)
+
+    def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+
+        if url.path != "/click":
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown path {url.path}"})
+            return
+        if self.server.engine.usage is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "usage tracking is disabled"})
+            return
+
+        try:
+            doc_id = json.loads(body)["doc_id"]
+        except (ValueError, KeyError, TypeError):
+            self._send(HTTPStatus.BAD_REQUEST, {"error": 'body must be {"doc_id": ...}'})
+            return
+
+        try:
+            known = doc_id in self.server.engine.index.documents
+        except TypeError:  # unhashable id
+            known = False
+        if not known:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"unknown doc_id {doc_id!r}"})
+            return
+
+        self.server.engine.record_click(doc_id)
+        self._send(HTTPStatus.OK, {"recorded": True})
+
+    def _send(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SearchHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        engine: SearchEngine,
+        batcher: MicroBatcher,
+        *,
+        request_timeout_s: float = 30.0,
+        verbose: bool = False,
+    ) -> None:
+        self.engine = engine
+        self.batcher = batcher
+        self.request_timeout_s = request_timeout_s
+        self.verbose = verbose
+        super().__init__(address, SearchRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.close()
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "documents": self.engine.index.stats.total_docs,
+            "pending": self.batcher.pending,
+            "batches": self.batcher.batches,
+            "rejected": self.batcher.rejected,
+            "shed": self.batcher.shed,
+        }
+
+
+class UnixSearchHTTPServer(SearchHTTPServer):
+    address_family = socket.AF_UNIX
+
+    def __init__(
+        self,
+        path: str,
+        engine: SearchEngine,
+        batcher: MicroBatcher,
+        *,
+        request_timeout_s: float = 30.0,
+        verbose: bool = False,
+    ) -> None:
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(
+            path,  # type: ignore[arg-type]
+            engine,
+            batcher,
+            request_timeout_s=request_timeout_s,
+            verbose=verbose,
+        )
+
+    def server_bind(self) -> None:
+        # HTTPServer.server_bind expects a (host, port) address.
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def make_server(
+    engine: SearchEngine,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: str | None = None,
+    max_batch: int = 32,
+    max_wait_ms: float = 2.0,
+    max_queue: int = 1024,
+    max_queue_delay_ms: float | None = 1000.0,
+    request_timeout_s: float = 30.0,
+    verbose: bool = False,
+) -> SearchHTTPServer:
+    batcher = MicroBatcher(
+        engine,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+        max_queue=max_queue,
+        max_queue_delay_ms=max_queue_delay_ms,
+    )
+    if unix_socket is not None:
+        return UnixSearchHTTPServer(
+            unix_socket,
+            engine,
+            batcher,
+            request_timeout_s=request_timeout_s,
+            verbose=verbose,
+        )
+    return SearchHTTPServer(
+        (host, port),
+        engine,
+        batcher,
+        request_timeout_s=request_timeout_s,
+        verbose=verbose,
+    )
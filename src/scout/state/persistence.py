@@ -1,20 +1,156 @@
 # scout/state/persistence.py
 
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from scout.index.inverted import InvertedIndex
 from scout.state.signals import IndexState
 from scout.state.store import Store
+from scout.state.wal import FsyncPolicy, WriteAheadLog
+from scout.storage import paths
+
+
+def _checkpoint_seq() -> int:
+    manifest = Store.manifest()
+    return manifest["wal_seq"] if manifest else 0
 
 
 class AutoSaver:
     """
     Automatically persists the index whenever it changes.
 
+    Each change batch is appended to a write-ahead log, so saving costs
+    time proportional to the change, not to the index. A checkpoint (a
+    Store snapshot, usually a delta) is written once the log reaches
+    `checkpoint_bytes` or `checkpoint_interval_s` has passed, after which
+    the log is trimmed.
+    Checkpoints run on a background thread unless `background=False`.
+
     This is intentionally decoupled from SearchEngine.
     """
 
-    def __init__(self, state: IndexState):
+    def __init__(
+        self,
+        state: IndexState,
+        *,
+        wal_path: str | Path | None = None,
+        fsync: FsyncPolicy = "interval",
+        fsync_interval_s: float = 1.0,
+        checkpoint_bytes: int = 64 * 1024 * 1024,
+        checkpoint_interval_s: float = 300.0,
+        background: bool = True,
+    ):
         self._state = state
+        self._wal_path = Path(wal_path) if wal_path is not None else paths.WAL_FILE
+        self._checkpoint_seq = _checkpoint_seq()
+        self._wal = WriteAheadLog(
+            self._wal_path,
+            fsync=fsync,
+            fsync_interval_s=fsync_interval_s,
+            last_seq=self._checkpoint_seq,
+        )
+        self._checkpoint_bytes = checkpoint_bytes
+        self._checkpoint_interval_s = checkpoint_interval_s
+        self._checkpoint_lock = threading.Lock()
+
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="scout-checkpoint", daemon=True
+            )
+            self._thread.start()
+
         self._state.on_change.subscribe(self._on_change)
 
-    def _on_change(self, doc_id: int) -> None:
-        # Persist entire index snapshot (atomic save)
-        Store.save(self._state.index)
+    @property
+    def wal(self) -> WriteAheadLog:
+        return self._wal
+
+    def _on_change(self, doc_ids: tuple[int, ...]) -> None:
+        snapshot = self._state.snapshot()
+        self._wal.append(
+            [
+                (
+                    doc_id,
+                    snapshot.get_document_tokens(doc_id),
+                    snapshot.index.get_document(doc_id),
+                )
+                for doc_id in doc_ids
+            ]
+        )
+
+        if self._wal.size >= self._checkpoint_bytes:
+            if self._thread is None:
+                self.checkpoint()
+            else:
+                self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(timeout=self._checkpoint_interval_s)
+            self._wake.clear()
+            if self._stopping:
+                return
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Write a full snapshot covering everything logged so far."""
+        with self._checkpoint_lock:
+            # Read seq before taking the snapshot: a batch is logged only
+            # after it is published, so the snapshot covers every seq <= it.
+            seq = self._wal.last_seq
+            if seq <= self._checkpoint_seq:
+                return
+
+            snapshot = self._state.snapshot()
+            Store.save(snapshot.index, doc_tokens=snapshot.doc_tokens, wal_seq=seq)
+            self._checkpoint_seq = seq
+            self._wal.truncate_through(seq)
+
+    def close(self, *, checkpoint: bool = True) -> None:
+        self._state.on_change.unsubscribe(self._on_change)
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+        if checkpoint:
+            self.checkpoint()
+        self._wal.close()
+
+    @staticmethod
+    def recover(wal_path: str | Path | None = None) -> IndexState:
+        """
+        Rebuild an IndexState from the last checkpoint plus the log.
+
+        Batches at or below the snapshot's wal_seq are skipped, as are
+        documents the snapshot already contains.
+        """
+        wal_path = Path(wal_path) if wal_path is not None else paths.WAL_FILE
+
+        try:
+            index = Store.load()
+        except FileNotFoundError:
+            index = InvertedIndex()
+
+        state = IndexState()
+        state.index = index
+
+        checkpoint_seq = _checkpoint_seq()
+        wal = WriteAheadLog(wal_path, fsync="never")
+        try:
+            docs = [
+                (doc_id, tokens, metadata)
+                for entry in wal.replay(after_seq=checkpoint_seq)
+                for doc_id, tokens, metadata in entry["docs"]
+                if doc_id not in index.documents
+            ]
+        finally:
+            wal.close()
+
+        if docs:
+            state.add_documents(docs)
+        return state
@@ -1,8 +1,13 @@
-# scout/state/signals.py
+from __future__ import annotations
 
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
 
-from scout.index.inverted import InvertedIndex
+from scout.index.inverted import DocumentInput, InvertedIndex
+from scout.index.layered import LayeredDict
 
 
 class Signal:
@@ -23,16 +28,125 @@ class Signal:
             callback(*args, **kwargs)
 
 
+@dataclass(frozen=True)
+class IndexSnapshot:
+    """
+    Immutable point-in-time view of an IndexState.
+
+    Nothing reachable from a published snapshot is modified afterwards, so
+    readers can use it without locking.
+    """
+
+    generation: int
+    index: InvertedIndex
+    doc_tokens: LayeredDict[int, list[str]]
+
+    def get_document_tokens(self, doc_id: int) -> list[str]:
+        tokens: list[str] = self.doc_tokens.get(doc_id, [])
+        return tokens
+
+
+class IndexBatch:
+    """
+    Pending changes to an IndexState, invisible to readers until published.
+    """
+
+    def __init__(self, snapshot: IndexSnapshot) -> None:
+        self.index = snapshot.index.fork()
+        self.doc_tokens = snapshot.doc_tokens.fork()
+        self.doc_ids: list[int] = []
+
+    def add_document(
+        self,
+        doc_id: int,
+        tokens: list[str],
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        self.index.add_document(doc_id, tokens, metadata or {})
+        self.doc_tokens[doc_id] = tokens
+        self.doc_ids.append(doc_id)
+
+    def add_documents(self, documents: Iterable[DocumentInput]) -> None:
+        documents = list(documents)
+        self.doc_ids.extend(self.index.add_documents(documents))
+        for doc_id, tokens, _ in documents:
+            self.doc_tokens[doc_id] = tokens
+
+
 class IndexState:
     """
     Wraps an index and emits signals when modified.
     Stores raw document tokens for phrase matching and autosave.
+
+    Readers see immutable snapshots; writers apply changes to a
+    copy-on-write fork and publish it with a single reference swap.
+
+    on_change is emitted once per published batch as
+    on_change(doc_ids=(...)) with the ids added, in order.
     """
 
-    def __init__(self):
-        self.index = InvertedIndex()
+    def __init__(self, doc_tokens: dict[int, list[str]] | None = None):
         self.on_change = Signal()
-        self._doc_tokens: dict[int, list[str]] = {}  # NEW: store raw tokens
+        self._write_lock = threading.RLock()
+        self._batch: IndexBatch | None = None
+        self._snapshot = IndexSnapshot(
+            generation=0,
+            index=InvertedIndex(),
+            doc_tokens=LayeredDict(doc_tokens),
+        )
+
+    @property
+    def index(self) -> InvertedIndex:
+        """Index of the most recently published snapshot."""
+        return self._snapshot.index
+
+    @index.setter
+    def index(self, index: InvertedIndex) -> None:
+        with self._write_lock:
+            current = self._snapshot
+            self._snapshot = IndexSnapshot(
+                generation=current.generation + 1,
+                index=index,
+                doc_tokens=current.doc_tokens,
+            )
+
+    @property
+    def generation(self) -> int:
+        return self._snapshot.generation
+
+    def snapshot(self) -> IndexSnapshot:
+        return self._snapshot
+
+    @contextmanager
+    def batch(self) -> Iterator[IndexBatch]:
+        """
+        Group writes into one atomically published generation.
+
+        Nested calls (including add_document inside a batch) join the
+        outer batch. Nothing is published if the block raises.
+        """
+        with self._write_lock:
+            if self._batch is not None:
+                yield self._batch
+                return
+
+            batch = IndexBatch(self._snapshot)
+            self._batch = batch
+            try:
+                yield batch
+            finally:
+                self._batch = None
+
+            if not batch.doc_ids:
+                return
+
+            self._snapshot = IndexSnapshot(
+                generation=self._snapshot.generation + 1,
+                index=batch.index,
+                doc_tokens=batch.doc_tokens,
+            )
+
+        self.on_change.emit(doc_ids=tuple(batch.doc_ids))
 
     def add_document(
         self,
@@ -40,10 +154,35 @@ class IndexState:
         tokens: list[str],
         metadata: dict | None = None,
     ) -> None:
-        self.index.add_document(doc_id, tokens, metadata or {})
-        self._doc_tokens[doc_id] = tokens  # save tokens for phrase matching
-        self.on_change.emit(doc_id=doc_id)
+        with self.batch() as batch:
+            batch.add_document(doc_id, tokens, metadata)
+
+    def add_documents(self, documents: Iterable[DocumentInput]) -> None:
+        """Add many documents as one generation with a single on_change."""
+        with self.batch() as batch:
+            batch.add_documents(documents)
 
     def get_document_tokens(self, doc_id: int) -> list[str]:
         """Retrieve raw tokens for a document (used for phrase matching)."""
-        return self._doc_tokens.get(doc_id, [])
+        return self._snapshot.get_document_tokens(doc_id)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        state["_batch"] = None
+        state["_snapshot"] = IndexSnapshot(
+            generation=self._snapshot.generation,
+            index=self._snapshot.index,
+            doc_tokens=self._snapshot.doc_tokens,
+        )
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        snapshot = state["_snapshot"]
+        state["_snapshot"] = IndexSnapshot(
+            generation=snapshot.generation,
+            index=snapshot.index,
+            doc_tokens=LayeredDict(snapshot.doc_tokens),
+        )
+        self.__dict__.update(state)
+        self._write_lock = threading.RLock()
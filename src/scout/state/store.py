@@ -1,22 +1,194 @@
 # scout/store.py
 
-from scout.index.inverted import InvertedIndex
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Mapping
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from scout.index.inverted import DocumentInput, InvertedIndex
 from scout.index.stats import IndexStats
 from scout.storage import paths, serializer
 
+FORMAT_VERSION = 1
+
+# A new base is written once the chain holds this many deltas, or once the
+# docs held in deltas reach DELTA_RATIO of the base, so loads stay fast.
+MAX_DELTAS = 8
+DELTA_RATIO = 0.5
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+
 
 class Store:
     """
     Persistent storage for index and stats.
+
+    Snapshots live in versioned directories under paths.SNAPSHOT_DIR:
+
+        00000001-base/   index.pkl + manifest.json
+        00000002-delta/  docs.pkl  + manifest.json (docs added since parent)
+        CURRENT          name of the newest snapshot directory
+
+    Each directory is written under a temporary name, fsynced and renamed
+    into place; CURRENT is then swapped with os.replace. A crash at any
+    point leaves the previous snapshot intact.
     """
 
     @staticmethod
-    def save(index: InvertedIndex) -> None:
-        serializer.save(index, str(paths.INDEX_FILE))
-        serializer.save(index.stats, str(paths.STATS_FILE))
+    def save(
+        index: InvertedIndex,
+        *,
+        doc_tokens: Mapping[int, list[str]] | None = None,
+        wal_seq: int | None = None,
+    ) -> None:
+        """
+        Snapshot `index`.
+
+        With `doc_tokens` (raw tokens per doc, as kept by IndexState) only
+        the documents added since the previous snapshot are written, as a
+        delta. Without them, or when the chain is long, a full base is
+        written.
+        """
+        root = paths.SNAPSHOT_DIR
+        root.mkdir(parents=True, exist_ok=True)
+
+        head = Store.manifest()
+        version = head["version"] + 1 if head else 1
+        num_docs = len(index.documents)
+
+        delta_docs = None
+        if doc_tokens is not None and head is not None:
+            delta_docs = Store._delta_documents(index, doc_tokens, head)
+
+        tmp = root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+
+        if delta_docs is not None:
+            assert head is not None
+            name = f"{version:08d}-delta"
+            chain = [*head["chain"], name]
+            serializer.save(delta_docs, str(tmp / "docs.pkl"))
+            _fsync_path(tmp / "docs.pkl")
+            delta_count = head["delta_docs"] + len(delta_docs)
+        else:
+            name = f"{version:08d}-base"
+            chain = [name]
+            serializer.save(index, str(tmp / "index.pkl"))
+            _fsync_path(tmp / "index.pkl")
+            delta_count = 0
+
+        _write_json(
+            tmp / "manifest.json",
+            {
+                "format_version": FORMAT_VERSION,
+                "version": version,
+                "kind": "delta" if delta_docs is not None else "base",
+                "chain": chain,
+                "num_docs": num_docs,
+                "last_doc_id": next(reversed(index.documents), None),
+                "delta_docs": delta_count,
+                "wal_seq": wal_seq if wal_seq is not None else (head or {}).get("wal_seq", 0),
+            },
+        )
+        _fsync_path(tmp)
+        os.rename(tmp, root / name)
+
+        current_tmp = root / "CURRENT.tmp"
+        current_tmp.write_text(name)
+        _fsync_path(current_tmp)
+        os.replace(current_tmp, root / "CURRENT")
+        _fsync_path(root)
+
+        # Anything outside the live chain is superseded or a failed write.
+        for entry in root.iterdir():
+            if entry.is_dir() and entry.name not in chain:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @staticmethod
+    def _delta_documents(
+        index: InvertedIndex,
+        doc_tokens: Mapping[int, list[str]],
+        head: dict[str, Any],
+    ) -> list[DocumentInput] | None:
+        """
+        Documents added since `head`, or None if a base should be written.
+
+        Indexes are append-only, so the snapshot is a prefix of
+        `index.documents` in insertion order; that is checked via the
+        last doc id the snapshot recorded.
+        """
+        base_docs = head["num_docs"]
+        if len(head["chain"]) > MAX_DELTAS or len(index.documents) < base_docs:
+            return None
+        if base_docs:
+            last = next(islice(index.documents, base_docs - 1, None))
+            if last != head["last_doc_id"]:
+                return None
+
+        new_ids = list(islice(index.documents, base_docs, None))
+        if head["delta_docs"] + len(new_ids) > DELTA_RATIO * max(base_docs, 1):
+            return None
+        if any(doc_id not in doc_tokens for doc_id in new_ids):
+            return None
+
+        return [
+            (doc_id, doc_tokens[doc_id], index.documents[doc_id])
+            for doc_id in new_ids
+        ]
+
+    @staticmethod
+    def manifest() -> dict[str, Any] | None:
+        """Manifest of the newest snapshot, or None if there is none."""
+        current = paths.SNAPSHOT_DIR / "CURRENT"
+        if not current.exists():
+            return None
+
+        path = paths.SNAPSHOT_DIR / current.read_text().strip() / "manifest.json"
+        manifest: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        if manifest["format_version"] > FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot format {manifest['format_version']} is newer than "
+                f"supported format {FORMAT_VERSION}"
+            )
+        return manifest
 
     @staticmethod
     def load() -> InvertedIndex:
+        head = Store.manifest()
+        if head is None:
+            return Store._load_legacy()
+
+        root = paths.SNAPSHOT_DIR
+        base, *deltas = head["chain"]
+        index: InvertedIndex = serializer.load(str(root / base / "index.pkl"))
+
+        for name in deltas:
+            docs: list[DocumentInput] = serializer.load(str(root / name / "docs.pkl"))
+            index.add_documents(docs)
+        return index
+
+    @staticmethod
+    def _load_legacy() -> InvertedIndex:
+        # index.pkl / stats.pkl pair written before versioned snapshots.
         index: InvertedIndex = serializer.load(str(paths.INDEX_FILE))
         stats: IndexStats = serializer.load(str(paths.STATS_FILE))
         index.stats = stats
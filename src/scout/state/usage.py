@@ -0,0 +1,306 @@
+# scout/state/usage.py
+
+from __future__ import annotations
+
+import copy
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from scout.search.query import normalize_query
+from scout.storage import paths
+
+# Counters are stored multiplied by exp(rate * (t - epoch)); once that
+# factor exceeds exp(RESCALE_EXPONENT) everything is scaled back down so
+# the values stay far from float64 overflow.
+RESCALE_EXPONENT = 200.0
+# Keys whose decayed count has fallen below PRUNE_BELOW are dropped when
+# the store rescales or saves; a table that grows past MAX_KEYS keeps
+# only its MAX_KEYS // 2 largest counts.
+PRUNE_BELOW = 0.01
+MAX_KEYS = 1_000_000
+_INITIAL_CAPACITY = 1024
+
+
+class DecayedCounters:
+    """
+    Exponentially decayed counts for a growing set of keys.
+
+    Each key gets a slot in one float64 array the first time it is
+    counted. Values are kept in "epoch units" (see UsageStore), so an
+    increment is a single add and decay is applied only when reading.
+    """
+
+    def __init__(self) -> None:
+        self.slots: dict[Hashable, int] = {}
+        self.keys: list[Hashable] = []
+        self.values = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: Hashable, amount: float) -> None:
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = len(self.keys)
+            if slot == len(self.values):
+                grown = np.zeros(2 * len(self.values), dtype=np.float64)
+                grown[:slot] = self.values
+                self.values = grown
+            self.slots[key] = slot
+            self.keys.append(key)
+        self.values[slot] += amount
+
+    def get_many(self, keys: Sequence[Hashable]) -> np.ndarray:
+        """Raw values for `keys`; 0.0 for keys never counted."""
+        slots = np.fromiter(
+            (self.slots.get(k, -1) for k in keys), dtype=np.int64, count=len(keys)
+        )
+        out = np.zeros(len(keys), dtype=np.float64)
+        known = slots >= 0
+        out[known] = self.values[slots[known]]
+        return out
+
+    def top(self, k: int) -> list[tuple[Hashable, float]]:
+        """The `k` largest raw values with their keys, largest first."""
+        values = self.values[: len(self.keys)]
+        if k < len(values):
+            candidates = np.argpartition(-values, k)[:k]
+        else:
+            candidates = np.arange(len(values))
+        order = candidates[np.argsort(-values[candidates], kind="stable")]
+        return [(self.keys[i], float(values[i])) for i in order.tolist()]
+
+    def prune(self, min_value: float, max_keys: int | None = None) -> None:
+        """
+        Drop keys whose raw value is below `min_value`, then all but the
+        `max_keys` largest. Remaining keys keep their relative order.
+        """
+        values = self.values[: len(self.keys)]
+        keep = np.flatnonzero(values >= min_value)
+        if max_keys is not None and len(keep) > max_keys:
+            keep = np.sort(keep[np.argpartition(-values[keep], max_keys)[:max_keys]])
+        if len(keep) < len(self.keys):
+            self.restore([self.keys[i] for i in keep.tolist()], values[keep])
+
+    def restore(self, keys: list[Hashable], values: np.ndarray) -> None:
+        self.keys = list(keys)
+        self.slots = {key: slot for slot, key in enumerate(self.keys)}
+        self.values = np.zeros(max(_INITIAL_CAPACITY, 2 * len(keys)), dtype=np.float64)
+        self.values[: len(keys)] = values
+
+
+class UsageStore:
+    """
+    In-memory usage signals: document accesses and query frequency.
+
+    Counts decay exponentially with `half_life_s`. Rather than decaying
+    every counter on every tick, an event at time t adds
+    weight * exp(rate * (t - epoch)) and reads multiply by
+    exp(-rate * (now - epoch)); recording an event is therefore one dict
+    lookup and one array add under a lock.
+
+    With `autosave_interval_s`, a background thread saves the store to
+    `path` (default data/usage.npz) whenever it has changed; `close()`
+    stops it and saves once more.
+    """
+
+    def __init__(
+        self,
+        *,
+        half_life_s: float = 7 * 86400.0,
+        path: str | Path | None = None,
+        autosave_interval_s: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if half_life_s <= 0:
+            raise ValueError("half_life_s must be positive")
+        self.half_life_s = half_life_s
+        self.path = Path(path) if path is not None else paths.USAGE_FILE
+        self._rate = math.log(2) / half_life_s
+        self._clock = clock
+        self._epoch = clock()
+        self._lock = threading.Lock()
+        self.documents = DecayedCounters()
+        self.queries = DecayedCounters()
+        self._dirty = False
+
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        if autosave_interval_s is not None:
+            self._autosave_interval_s = autosave_interval_s
+            self._thread = threading.Thread(
+                target=self._run, name="scout-usage-save", daemon=True
+            )
+            self._thread.start()
+
+    # ----------------------------
+    # Recording
+    # ----------------------------
+
+    def record_access(self, doc_id: Hashable, weight: float = 1.0, *, at: float | None = None) -> None:
+        """Count a click on, or other access to, `doc_id`."""
+        self._record(self.documents, doc_id, weight, at)
+
+    def record_query(self, query: str, weight: float = 1.0, *, at: float | None = None) -> None:
+        """Count one execution of `query` (normalized like the query parser)."""
+        self._record(self.queries, normalize_query(query), weight, at)
+
+    def _record(
+        self,
+        counters: DecayedCounters,
+        key: Hashable,
+        weight: float,
+        at: float | None,
+    ) -> None:
+        t = self._clock() if at is None else at
+        with self._lock:
+            exponent = self._rate * (t - self._epoch)
+            if exponent > RESCALE_EXPONENT:
+                self._rescale(t)
+                exponent = 0.0
+            counters.add(key, weight * math.exp(exponent))
+            if len(counters) > MAX_KEYS:
+                counters.prune(PRUNE_BELOW * math.exp(exponent), MAX_KEYS // 2)
+            self._dirty = True
+
+    def _rescale(self, t: float) -> None:
+        factor = math.exp(-self._rate * (t - self._epoch))
+        for counters in (self.documents, self.queries):
+            counters.values *= factor
+            counters.prune(PRUNE_BELOW)
+        self._epoch = t
+
+    def _prune(self) -> None:
+        # Raw values are in epoch units, so scale the threshold likewise
+        # (capped: past that every count has decayed to nothing anyway).
+        exponent = self._rate * (self._clock() - self._epoch)
+        threshold = PRUNE_BELOW * math.exp(min(exponent, 700.0))
+        for counters in (self.documents, self.queries):
+            counters.prune(threshold)
+
+    # ----------------------------
+    # Reading
+    # ----------------------------
+
+    def _decay(self) -> float:
+        return math.exp(-self._rate * (self._clock() - self._epoch))
+
+    def access_counts(self, doc_ids: Sequence[Hashable]) -> np.ndarray:
+        """Decayed access counts for `doc_ids` (0.0 if never accessed)."""
+        with self._lock:
+            return self.documents.get_many(doc_ids) * self._decay()
+
+    def query_counts(self, queries: Sequence[str]) -> np.ndarray:
+        with self._lock:
+            normalized = [normalize_query(q) for q in queries]
+            return self.queries.get_many(normalized) * self._decay()
+
+    def top_documents(self, k: int = 10) -> list[tuple[Hashable, float]]:
+        with self._lock:
+            decay = self._decay()
+            return [(key, value * decay) for key, value in self.documents.top(k)]
+
+    def top_queries(self, k: int = 10) -> list[tuple[str, float]]:
+        with self._lock:
+            decay = self._decay()
+            return [(str(key), value * decay) for key, value in self.queries.top(k)]
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Write the counters to an .npz file (atomically replaced), first
+        dropping keys whose count has decayed below PRUNE_BELOW.
+        """
+        path = Path(path) if path is not None else self.path
+        with self._lock:
+            self._prune()
+            arrays: dict[str, Any] = {
+                "epoch": np.float64(self._epoch),
+                "half_life_s": np.float64(self.half_life_s),
+                "document_keys": np.array(json.dumps(self.documents.keys)),
+                "document_values": self.documents.values[: len(self.documents)].copy(),
+                "query_keys": np.array(json.dumps(self.queries.keys)),
+                "query_values": self.queries.values[: len(self.queries)].copy(),
+            }
+            self._dirty = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path | None = None,
+        *,
+        autosave_interval_s: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> UsageStore:
+        path = Path(path) if path is not None else paths.USAGE_FILE
+        with np.load(path) as data:
+            store = cls(
+                half_life_s=float(data["half_life_s"]),
+                path=path,
+                autosave_interval_s=autosave_interval_s,
+                clock=clock,
+            )
+            with store._lock:
+                store._epoch = float(data["epoch"])
+                # Keys round-trip through JSON: doc ids are ints or strings.
+                store.documents.restore(
+                    json.loads(str(data["document_keys"])), data["document_values"]
+                )
+                store.queries.restore(
+                    json.loads(str(data["query_keys"])), data["query_values"]
+                )
+        return store
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies (e.g. in process-pool workers) get the counters but no
+        # autosave thread of their own.
+        with self._lock:
+            state = self.__dict__.copy()
+            state["documents"] = copy.deepcopy(self.documents)
+            state["queries"] = copy.deepcopy(self.queries)
+        del state["_lock"], state["_wake"], state["_thread"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(timeout=self._autosave_interval_s)
+            if self._stopping:
+                return
+            if self._dirty:
+                self.save()
+
+    def close(self, *, save: bool = True) -> None:
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        if save and self._dirty:
+            self.save()
+
@@ -0,0 +1,125 @@
+# scout/state/wal.py
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from time import monotonic
+from typing import Any, Literal
+
+from scout.index.inverted import DocumentInput
+
+FsyncPolicy = Literal["always", "interval", "never"]
+
+
+class WriteAheadLog:
+    """
+    Append-only JSON-lines log of index changes.
+
+    One line per change batch: {"seq": n, "docs": [[doc_id, tokens, metadata], ...]}.
+    A torn final line (crash mid-write) is ignored on replay, so a batch
+    is either fully recovered or not at all.
+
+    Sequence numbers continue after `last_seq` (the seq a checkpoint
+    already covers) or the last logged batch, whichever is higher, so a
+    log truncated by a checkpoint does not restart them after a reopen.
+
+    fsync policy:
+    - "always": fsync after every append (durable, slowest)
+    - "interval": fsync at most every `fsync_interval_s` seconds
+    - "never": leave flushing to the OS
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fsync: FsyncPolicy = "interval",
+        fsync_interval_s: float = 1.0,
+        last_seq: int = 0,
+    ) -> None:
+        if fsync not in ("always", "interval", "never"):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+
+        self.path = Path(path)
+        self.fsync = fsync
+        self.fsync_interval_s = fsync_interval_s
+        self._lock = threading.Lock()
+        logged = max((entry["seq"] for entry in self.replay()), default=0)
+        self._last_seq = max(logged, last_seq)
+        self._file = self.path.open("ab")
+        self._last_fsync = monotonic()
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def size(self) -> int:
+        """Bytes currently in the log."""
+        return self._file.tell()
+
+    def append(self, docs: list[DocumentInput]) -> int:
+        """Log one change batch and return its sequence number."""
+        with self._lock:
+            seq = self._last_seq + 1
+            line = json.dumps(
+                {"seq": seq, "docs": [list(doc) for doc in docs]},
+                default=str,
+            )
+            self._file.write(line.encode("utf-8") + b"\n")
+            self._file.flush()
+            self._last_seq = seq
+
+            if self.fsync == "always" or (
+                self.fsync == "interval"
+                and monotonic() - self._last_fsync >= self.fsync_interval_s
+            ):
+                self._sync()
+
+            return seq
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self.fsync != "never":
+            os.fsync(self._file.fileno())
+        self._last_fsync = monotonic()
+
+    def replay(self, after_seq: int = 0) -> Iterator[dict[str, Any]]:
+        """Yield logged batches with seq > `after_seq`, oldest first."""
+        if not self.path.exists():
+            return
+
+        with self.path.open("rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    return  # torn write at the tail
+                entry = json.loads(raw)
+                if entry["seq"] > after_seq:
+                    yield entry
+
+    def truncate_through(self, seq: int) -> None:
+        """Drop batches with seq <= `seq` (they are covered by a checkpoint)."""
+        with self._lock:
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with tmp.open("wb") as out:
+                for entry in self.replay(after_seq=seq):
+                    out.write(json.dumps(entry, default=str).encode("utf-8") + b"\n")
+                out.flush()
+                if self.fsync != "never":
+                    os.fsync(out.fileno())
+
+            self._file.close()
+            os.replace(tmp, self.path)
+            self._file = self.path.open("ab")
+
+    def close(self) -> None:
+        with self._lock:
+            self._sync()
+            self._file.close()
@@ -0,0 +1,226 @@
+# scout/storage/docstore.py
+
+from __future__ import annotations
+
+import json
+import lzma
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any, Literal
+
+from scout.index.layered import LayeredDict
+
+_MAGIC = b"SCOUTDOC"
+_FORMAT_VERSION = 1
+_FOOTER = struct.Struct("<QQ")  # table offset, table length
+
+Compression = Literal["zlib", "lzma"]
+
+_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda raw: zlib.compress(raw, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+class DocStore(Mapping[Any, dict[str, Any]]):
+    """
+    Read-only, on-disk store of document metadata.
+
+    Documents are packed in insertion order into blocks of `block_size`
+    records, each JSON-encoded and compressed. An offset table at the end
+    of the file maps blocks to byte ranges. Only the id -> ordinal table
+    stays resident; blocks are read on demand and kept in an LRU cache
+    of `cache_blocks` entries.
+
+    Layout: magic | blocks... | table (JSON) | footer (table offset, length)
+    """
+
+    def __init__(self, path: str | Path, *, cache_blocks: int = 64) -> None:
+        self.path = Path(path)
+        self.cache_blocks = cache_blocks
+        self._fd = os.open(self.path, os.O_RDONLY)
+        self._cache: OrderedDict[int, list[dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        size = os.fstat(self._fd).st_size
+        if os.pread(self._fd, len(_MAGIC), 0) != _MAGIC:
+            raise ValueError(f"{self.path} is not a scout doc store")
+        table_offset, table_length = _FOOTER.unpack(
+            os.pread(self._fd, _FOOTER.size, size - _FOOTER.size)
+        )
+        table = json.loads(os.pread(self._fd, table_length, table_offset))
+        if table["format_version"] > _FORMAT_VERSION:
+            raise ValueError(
+                f"Doc store format {table['format_version']} is newer than "
+                f"supported format {_FORMAT_VERSION}"
+            )
+
+        self.block_size: int = table["block_size"]
+        self.compression: Compression = table["compression"]
+        self._decompress = _CODECS[self.compression][1]
+        self._blocks: list[tuple[int, int]] = [tuple(b) for b in table["blocks"]]
+        self._ids: list[Any] = table["doc_ids"]
+        self._ordinals = {doc_id: i for i, doc_id in enumerate(self._ids)}
+
+    @classmethod
+    def write(
+        cls,
+        path: str | Path,
+        documents: Iterable[tuple[Any, dict[str, Any]]],
+        *,
+        block_size: int = 32,
+        compression: Compression = "zlib",
+        cache_blocks: int = 64,
+    ) -> DocStore:
+        """Write `documents` to `path` atomically and open the result."""
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
+        compress = _CODECS[compression][0]
+
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        doc_ids: list[Any] = []
+        blocks: list[list[int]] = []
+
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            pending: list[dict[str, Any]] = []
+
+            def flush() -> None:
+                data = compress(json.dumps(pending).encode("utf-8"))
+                blocks.append([f.tell(), len(data)])
+                f.write(data)
+                pending.clear()
+
+            for doc_id, metadata in documents:
+                doc_ids.append(doc_id)
+                pending.append(metadata)
+                if len(pending) == block_size:
+                    flush()
+            if pending:
+                flush()
+
+            table = json.dumps(
+                {
+                    "format_version": _FORMAT_VERSION,
+                    "block_size": block_size,
+                    "compression": compression,
+                    "blocks": blocks,
+                    "doc_ids": doc_ids,
+                }
+            ).encode("utf-8")
+            table_offset = f.tell()
+            f.write(table)
+            f.write(_FOOTER.pack(table_offset, len(table)))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp, path)
+        return cls(path, cache_blocks=cache_blocks)
+
+    def _block(self, block_no: int) -> list[dict[str, Any]]:
+        with self._lock:
+            block = self._cache.get(block_no)
+            if block is not None:
+                self._cache.move_to_end(block_no)
+                return block
+
+        offset, length = self._blocks[block_no]
+        loaded: list[dict[str, Any]] = json.loads(
+            self._decompress(os.pread(self._fd, length, offset))
+        )
+
+        with self._lock:
+            self._cache[block_no] = loaded
+            if len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return loaded
+
+    def __getitem__(self, doc_id: Any) -> dict[str, Any]:
+        ordinal = self._ordinals[doc_id]
+        block_no, slot = divmod(ordinal, self.block_size)
+        return self._block(block_no)[slot]
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._ordinals
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._ids)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(reversed(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": str(self.path), "cache_blocks": self.cache_blocks}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["path"], cache_blocks=state["cache_blocks"])  # type: ignore[misc]
+
+
+class StoredDocuments(MutableMapping[Any, dict[str, Any]]):
+    """
+    InvertedIndex.documents backed by a DocStore.
+
+    Documents added after the store was written live in a small in-memory
+    overlay (which also shadows replaced records). copy() shares the
+    store and forks the overlay, so forking an index neither reads any
+    blocks nor copies the overlay.
+    """
+
+    def __init__(self, store: DocStore, overlay: Mapping[Any, dict[str, Any]] | None = None) -> None:
+        self.store = store
+        self._overlay: LayeredDict[Any, dict[str, Any]] = LayeredDict(overlay)
+        self._new = sum(1 for doc_id in self._overlay if doc_id not in store)
+
+    def __getitem__(self, doc_id: Any) -> dict[str, Any]:
+        if doc_id in self._overlay:
+            return self._overlay[doc_id]
+        return self.store[doc_id]
+
+    def __setitem__(self, doc_id: Any, metadata: dict[str, Any]) -> None:
+        if doc_id not in self._overlay and doc_id not in self.store:
+            self._new += 1
+        self._overlay[doc_id] = metadata
+
+    def __delitem__(self, doc_id: Any) -> None:
+        raise TypeError("Documents cannot be removed from a stored index")
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._overlay or doc_id in self.store
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self.store
+        for doc_id in self._overlay:
+            if doc_id not in self.store:
+                yield doc_id
+
+    def __reversed__(self) -> Iterator[Any]:
+        for doc_id in reversed(self._overlay):
+            if doc_id not in self.store:
+                yield doc_id
+        yield from reversed(self.store)
+
+    def __len__(self) -> int:
+        return len(self.store) + self._new
+
+    def copy(self) -> StoredDocuments:
+        copied = StoredDocuments(self.store)
+        copied._overlay = self._overlay.fork()
+        copied._new = self._new
+        return copied
@@ -7,3 +7,6 @@ BASE_DIR.mkdir(exist_ok=True)
 
 INDEX_FILE = BASE_DIR / "index.pkl"
 STATS_FILE = BASE_DIR / "stats.pkl"
+WAL_FILE = BASE_DIR / "index.wal"
+SNAPSHOT_DIR = BASE_DIR / "snapshots"
+USAGE_FILE = BASE_DIR / "usage.npz"
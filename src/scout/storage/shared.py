@@ -0,0 +1,194 @@
+# scout/storage/shared.py
+
+from __future__ import annotations
+
+import mmap
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from scout.index.frozen import FrozenIndex
+from scout.index.tokens import Tokenizer
+from scout.ranking.base import RankingStrategy
+from scout.search.engine import SearchEngine
+
+_CONTROL_SIZE = 8  # one int64: currently published version (0 = none)
+_tracker_lock = threading.Lock()
+
+
+def _segment_name(name: str, version: int) -> str:
+    return f"{name}-v{version}"
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Attaching must not register the segment with the resource tracker,
+    # which would unlink it when the worker exits. Only the publisher owns it.
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13 has no track flag
+        pass
+
+    with _tracker_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name, create=False)
+        finally:
+            resource_tracker.register = register
+
+
+def _map_segment(name: str) -> mmap.mmap:
+    segment = _attach(name)
+    # Keep only the mapping. It stays valid until the last array view is
+    # dropped, so a retired version is released by garbage collection rather
+    # than by close(), which fails while in-flight searches hold views.
+    mapped: mmap.mmap = segment._mmap  # type: ignore[attr-defined]
+    segment._buf.release()  # type: ignore[attr-defined]
+    segment._buf = None  # type: ignore[attr-defined]
+    segment._mmap = None  # type: ignore[attr-defined]
+    segment.close()
+    return mapped
+
+
+class SharedIndexPublisher:
+    """
+    Owns the shared-memory copies of an index for one host.
+
+    publish() freezes an engine's index into a new versioned segment and
+    then flips a small control segment to point at it, so readers switch
+    atomically. The previous version is unlinked immediately; workers that
+    still have it mapped keep a valid view until they move on.
+    """
+
+    def __init__(self, name: str = "scout-index") -> None:
+        self.name = name
+        self._control = shared_memory.SharedMemory(
+            name=f"{name}-ctl", create=True, size=_CONTROL_SIZE
+        )
+        self._version_cell = np.ndarray((1,), dtype=np.int64, buffer=self._control.buf)
+        self._version_cell[0] = 0
+        self._current: shared_memory.SharedMemory | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return int(self._version_cell[0])
+
+    def publish(self, engine: SearchEngine) -> int:
+        frozen = FrozenIndex.from_index(
+            engine.index,
+            config={
+                "stopwords": sorted(engine.stopwords),
+                "field_weights": engine._field_weights,
+                "ngram": engine._tokenizer.ngram,
+                "max_df_ratio": engine.max_df_ratio,
+            },
+        )
+
+        with self._lock:
+            version = self.version + 1
+            segment = shared_memory.SharedMemory(
+                name=_segment_name(self.name, version),
+                create=True,
+                size=max(frozen.nbytes, 1),
+            )
+            assert segment.buf is not None
+            frozen.write_into(segment.buf)
+
+            # Aligned 8-byte store: readers see either the old or new version.
+            self._version_cell[0] = version
+
+            previous, self._current = self._current, segment
+            if previous is not None:
+                previous.close()
+                previous.unlink()
+
+        return version
+
+    def close(self) -> None:
+        with self._lock:
+            if self._current is not None:
+                self._current.close()
+                self._current.unlink()
+                self._current = None
+            del self._version_cell
+            self._control.close()
+            self._control.unlink()
+
+    def __enter__(self) -> SharedIndexPublisher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class SharedIndexReader:
+    """
+    Zero-copy view of the index published under `name`, for serving workers.
+
+    Each call to index() or engine() checks the control segment and
+    re-attaches when a newer version has been published.
+    """
+
+    def __init__(self, name: str = "scout-index") -> None:
+        self.name = name
+        self._control = _attach(f"{name}-ctl")
+        self._version_cell = np.ndarray((1,), dtype=np.int64, buffer=self._control.buf)
+        self._version = 0
+        self._frozen: FrozenIndex | None = None
+        self._engines: dict[int, SearchEngine] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def index(self) -> FrozenIndex:
+        with self._lock:
+            self._refresh()
+            if self._frozen is None:
+                raise LookupError(f"No index has been published under {self.name!r}")
+            return self._frozen
+
+    def engine(self, ranking: RankingStrategy) -> SearchEngine:
+        """SearchEngine over the current version (cached per ranking object)."""
+        frozen = self.index()
+        engine = self._engines.get(id(ranking))
+        if engine is None or engine.index is not frozen:  # type: ignore[comparison-overlap]
+            config = frozen.meta["config"]
+            engine = SearchEngine(
+                index=frozen,  # type: ignore[arg-type]
+                ranking=ranking,
+                tokenizer=Tokenizer(ngram=config.get("ngram")),
+                stopwords=set(config.get("stopwords", [])),
+                field_weights=config.get("field_weights"),
+                max_df_ratio=config.get("max_df_ratio"),
+            )
+            self._engines[id(ranking)] = engine
+        return engine
+
+    def _refresh(self) -> None:
+        while True:
+            version = int(self._version_cell[0])
+            if version == 0 or version == self._version:
+                return
+            try:
+                mapped = _map_segment(_segment_name(self.name, version))
+            except FileNotFoundError:
+                if int(self._version_cell[0]) != version:
+                    continue  # superseded while we were attaching; re-read
+                raise LookupError(
+                    f"Index version {version} under {self.name!r} is gone"
+                ) from None
+            break
+
+        self._frozen = FrozenIndex.from_buffer(mapped)
+        self._version = version
+
+    def close(self) -> None:
+        with self._lock:
+            self._engines.clear()
+            self._frozen = None
+            del self._version_cell
+            self._control.close()
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.aio import AsyncSearchExecutor, SearchRejected
+from scout.search.engine import SearchEngine
+from scout.search.filters import Term
+
+
+def _engine():
+    records = [
+        {"id": 1, "text": "quick brown fox"},
+        {"id": 2, "text": "lazy brown dog"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_asearch_matches_search():
+    engine = _engine()
+    results = asyncio.run(engine.asearch("brown", limit=5))
+    assert results == engine.search("brown", limit=5)
+
+
+def test_identical_inflight_queries_are_coalesced(monkeypatch):
+    engine = _engine()
+    calls = []
+    original = engine.search
+
+    def counting_search(query, *, limit=10, budget=None):
+        calls.append(query)
+        return original(query, limit=limit, budget=budget)
+
+    monkeypatch.setattr(engine, "search", counting_search)
+
+    async def run():
+        async with AsyncSearchExecutor(engine) as executor:
+            return await asyncio.gather(
+                *(executor.search("fox", limit=3) for _ in range(5))
+            )
+
+    results = asyncio.run(run())
+    assert calls == ["fox"]
+    assert all(r == results[0] for r in results)
+
+
+def test_pending_limit_rejects_excess_searches(monkeypatch):
+    engine = _engine()
+    release = threading.Event()
+
+    def blocking_search(query, *, limit=10, budget=None):
+        release.wait(timeout=5)
+        return []
+
+    monkeypatch.setattr(engine, "search", blocking_search)
+
+    async def run():
+        executor = AsyncSearchExecutor(engine, max_concurrency=1, max_pending=1)
+        running = asyncio.ensure_future(executor.search("a"))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(executor.search("b"))
+        await asyncio.sleep(0.05)
+        assert executor.pending == 1
+
+        with pytest.raises(SearchRejected):
+            await executor.search("c")
+
+        release.set()
+        await asyncio.gather(running, queued)
+        executor.close()
+
+    asyncio.run(run())
+
+
+def test_cancelled_search_frees_its_slot():
+    engine = _engine()
+
+    async def run():
+        executor = AsyncSearchExecutor(engine, max_concurrency=1, max_pending=1)
+        task = asyncio.ensure_future(executor.search("fox"))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert executor.pending == 0
+        assert await executor.search("dog") == engine.search("dog")
+        executor.close()
+
+    asyncio.run(run())
+
+
+def test_reissued_query_after_sole_waiter_cancels_gets_results(monkeypatch):
+    engine = _engine()
+    release = threading.Event()
+    original = engine.search
+
+    def blocking_search(query, *, limit=10, budget=None):
+        release.wait(timeout=5)
+        return original(query, limit=limit, budget=budget)
+
+    monkeypatch.setattr(engine, "search", blocking_search)
+
+    async def run():
+        executor = AsyncSearchExecutor(engine, max_concurrency=1)
+        waiter = asyncio.ensure_future(executor.search("fox"))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        # Arrives while the shared run is being cancelled; must not join it.
+        reissued = asyncio.ensure_future(executor.search("fox"))
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await reissued
+        assert executor.pending == 0
+        executor.close()
+        return results
+
+    assert asyncio.run(run()) == engine.search("fox")
+
+
+def test_unhashable_filter_values_are_searched_without_coalescing():
+    records = [
+        {"id": 1, "text": "quick brown fox", "tags": ["x"]},
+        {"id": 2, "text": "lazy brown dog", "tags": ["y"]},
+    ]
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+
+    async def run():
+        async with AsyncSearchExecutor(engine) as executor:
+            return await executor.search("brown", filters=[Term("tags", ["x"])])
+
+    assert [d for d, _ in asyncio.run(run())] == [1]
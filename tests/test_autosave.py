@@ -2,11 +2,11 @@ from scout.state.persistence import AutoSaver
 from scout.state.signals import IndexState
 
 
-def test_autosave_triggers_on_index_change(monkeypatch):
+def test_autosave_triggers_on_index_change(monkeypatch, tmp_path):
     state = IndexState()
     saved = []
 
-    def fake_save(index):
+    def fake_save(index, **kwargs):
         saved.append(index)
 
     monkeypatch.setattr(
@@ -14,9 +14,26 @@ def test_autosave_triggers_on_index_change(monkeypatch):
         fake_save,
     )
 
-    AutoSaver(state)
+    saver = AutoSaver(state, wal_path=tmp_path / "index.wal", checkpoint_bytes=0, background=False)
 
     state.add_document(1, ["hello", "world"])
 
     assert len(saved) == 1
     assert saved[0] is state.index
+    assert saver.wal.size == 0
+
+
+def test_autosave_logs_without_checkpointing_below_threshold(monkeypatch, tmp_path):
+    state = IndexState()
+    saved = []
+    monkeypatch.setattr("scout.state.store.Store.save", lambda index, **kw: saved.append(index))
+
+    saver = AutoSaver(state, wal_path=tmp_path / "index.wal", background=False)
+    state.add_document(1, ["hello"])
+    state.add_documents([(2, ["world"], None), (3, ["again"], {"k": "v"})])
+
+    assert saved == []
+    entries = list(saver.wal.replay())
+    assert [e["seq"] for e in entries] == [1, 2]
+    assert entries[1]["docs"] == [[2, ["world"], {}], [3, ["again"], {"k": "v"}]]
+    saver.close(checkpoint=False)
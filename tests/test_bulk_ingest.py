@@ -0,0 +1,32 @@
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.state.persistence import AutoSaver
+from scout.state.signals import IndexState
+
+
+def test_add_documents_matches_one_by_one():
+    docs = [(i, {"text": f"shared word{i % 3}"}) for i in range(10)]
+
+    single = SearchEngine.from_records([], ranking=BM25Ranking())
+    for doc_id, record in docs:
+        single.add_document(doc_id, record)
+
+    bulk = SearchEngine.from_records([], ranking=BM25Ranking())
+    bulk.add_documents(docs)
+
+    assert bulk.index.to_dict() == single.index.to_dict()
+    assert bulk.search("shared word1") == single.search("shared word1")
+
+
+def test_add_documents_emits_one_change(tmp_path):
+    state = IndexState()
+    events = []
+    state.on_change.subscribe(lambda doc_ids: events.append(doc_ids))
+    saver = AutoSaver(state, wal_path=tmp_path / "index.wal", background=False)
+
+    state.add_documents((i, ["token"], {}) for i in range(100))
+
+    assert events == [tuple(range(100))]
+    assert saver.wal.last_seq == 1
+    assert state.index.doc_freqs["token"] == 100
+    assert state.get_document_tokens(99) == ["token"]
@@ -0,0 +1,108 @@
+import time
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from scout.index import columns as columns_mod
+from scout.index.columns import ColumnStore
+from scout.index.inverted import InvertedIndex
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.composite import CompositeRanking
+from scout.ranking.recency import RecencyRanking
+from scout.search.engine import SearchEngine
+from scout.state.signals import IndexState
+
+
+def test_kinds_are_inferred_from_metadata():
+    store = ColumnStore()
+    store.add("a", {"date": "2024-01-02", "source": "abc_news", "score": 3, "tags": ["x"]})
+    store.add("b", {"source": "bbc"})
+
+    assert store.column("date").kind == "datetime"
+    assert store.column("source").kind == "category"
+    assert store.column("score").kind == "float"
+    assert store.column("tags") is None
+
+    ordinals = store.ordinals_for(["b", "a", "missing"])
+    assert store.values("source", ordinals).tolist() == [1, 0, -1]
+    assert np.isnat(store.values("date", ordinals)).tolist() == [True, False, True]
+
+
+def test_high_cardinality_strings_get_no_column(monkeypatch):
+    monkeypatch.setattr(columns_mod, "MAX_CATEGORIES", 3)
+    store = ColumnStore()
+    for i in range(5):
+        store.add(i, {"text": f"free text {i}", "source": "abc"})
+
+    assert store.column("text") is None
+    assert store.column("source") is not None
+
+
+def test_published_snapshots_keep_their_columns():
+    state = IndexState()
+    state.add_document(1, ["a"], {"source": "abc", "rank": 1})
+    before = state.snapshot()
+
+    state.add_document(2, ["a"], {"source": "bbc", "rank": 2})
+    state.add_document(1, ["a"], {"source": "cnn", "rank": 9})  # overwrite ordinal 0
+
+    assert before.index.columns.column("rank").values.tolist() == [1.0]
+    assert before.index.columns.column("source").categories == ["abc"]
+    assert state.index.columns.column("rank").values.tolist() == [9.0, 2.0]
+
+
+def test_recency_uses_columns_and_matches_document_path():
+    now = datetime.now()
+    docs = [
+        (i, ["news"], {"timestamp": (now - timedelta(days=i)).isoformat()} if i % 4 else {})
+        for i in range(12)
+    ]
+    index = InvertedIndex()
+    index.add_documents(docs)
+
+    recency = RecencyRanking(decay_days=7)
+    batch = recency.score_many(["news"], index, list(range(12)))
+
+    fallback = InvertedIndex()
+    fallback.add_documents(docs)
+    fallback.columns = ColumnStore({"timestamp": None})
+    slow = [recency.score(["news"], fallback, d) for d in range(12)]
+
+    assert [r.score for r in batch] == pytest.approx([r.score for r in slow])
+    assert batch[1].score > batch[2].score > 0.0
+    assert batch[4].components == {"recency": 0.0}
+
+
+def test_recency_ages_are_measured_in_utc(monkeypatch):
+    monkeypatch.setenv("TZ", "America/Los_Angeles")
+    time.tzset()
+    try:
+        index = InvertedIndex()
+        index.add_documents(
+            [(1, ["news"], {"timestamp": datetime.now(UTC).isoformat()})]
+        )
+        score = RecencyRanking(decay_days=1).score(["news"], index, 1).score
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert score == pytest.approx(1.0, rel=1e-3)
+
+
+def test_engine_scores_in_batches_with_composite_recency(tmp_path):
+    now = datetime.now()
+    records = [
+        {"id": i, "text": "fox news", "timestamp": (now - timedelta(days=i)).isoformat()}
+        for i in range(5)
+    ]
+    ranking = CompositeRanking([BM25Ranking()], [1.0], recency=RecencyRanking())
+    engine = SearchEngine.from_records(records, ranking=ranking)
+
+    assert [doc_id for doc_id, _ in engine.search("fox")] == [0, 1, 2, 3, 4]
+
+    path = tmp_path / "index.json"
+    engine.save(path)
+    loaded = SearchEngine.load(path, ranking=ranking)
+    assert loaded.index.columns.column("timestamp").kind == "datetime"
+    assert [d for d, _ in loaded.search("fox")] == [0, 1, 2, 3, 4]
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.storage.docstore import DocStore, StoredDocuments
+
+
+def _docs(n):
+    return [(i, {"title": f"doc {i}", "tags": ["x"] * (i % 3)}) for i in range(n)]
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_roundtrip_across_blocks(tmp_path, compression):
+    store = DocStore.write(tmp_path / "d.docs", _docs(50), block_size=8, compression=compression)
+
+    assert len(store) == 50
+    assert list(store) == list(range(50))
+    assert store[17] == {"title": "doc 17", "tags": ["x", "x"]}
+    assert 49 in store and 50 not in store
+    with pytest.raises(KeyError):
+        store[50]
+
+
+def test_block_cache_is_bounded(tmp_path):
+    store = DocStore.write(tmp_path / "d.docs", _docs(100), block_size=10, cache_blocks=2)
+    for doc_id in (0, 15, 25, 35):
+        store[doc_id]
+    assert list(store._cache) == [2, 3]
+
+    store[26]  # hit moves block 2 to the back
+    store[45]
+    assert list(store._cache) == [2, 4]
+
+
+def test_stored_documents_overlay(tmp_path):
+    store = DocStore.write(tmp_path / "d.docs", _docs(3))
+    documents = StoredDocuments(store)
+    documents[3] = {"title": "new"}
+    documents[1] = {"title": "replaced"}
+
+    forked = documents.copy()
+    forked[4] = {}
+
+    assert len(documents) == 4 and len(forked) == 5
+    assert list(forked) == [0, 1, 2, 3, 4]
+    assert next(reversed(forked)) == 4
+    assert documents[1] == {"title": "replaced"}
+    assert pickle.loads(pickle.dumps(documents))[3] == {"title": "new"}
+
+
+def test_engine_save_uses_doc_store(tmp_path):
+    records = [{"id": i, "text": f"fox {i}", "title": f"t{i}"} for i in range(20)]
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+
+    path = tmp_path / "index.json"
+    engine.save(path, block_size=4)
+    assert (tmp_path / "index.json.docs").exists()
+
+    loaded = SearchEngine.load(path, ranking=BM25Ranking())
+    assert isinstance(loaded.index.documents, StoredDocuments)
+    assert loaded.index.get_document(7) == engine.index.get_document(7)
+    assert loaded.search("fox") == engine.search("fox")
+
+    loaded.add_document(20, {"text": "fox"})
+    assert loaded.index.get_document(20) == {"text": "fox"}
+    assert len(loaded.index.documents) == 21
@@ -0,0 +1,91 @@
+import pytest
+
+from scout.explain import explain_query
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.fusion import ListFusion
+from scout.search.rerank import Reranker
+
+
+@pytest.fixture
+def records():
+    # "news" is in 9 of 10 documents, "police" in 4, "fire" in 2.
+    return [
+        {"id": i, "text": " ".join(words)}
+        for i, words in enumerate(
+            [
+                ["news", "police", "fire"],
+                ["news", "police"],
+                ["news", "police", "court"],
+                ["news", "fire"],
+                ["news", "weather"],
+                ["news", "sport"],
+                ["news", "sport"],
+                ["news", "court"],
+                ["news", "police"],
+                ["market"],
+            ]
+        )
+    ]
+
+
+def test_common_terms_do_not_drive_candidates(records):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    index = engine.index
+    assert index.stats.df_cutoff(0.5) == 5
+
+    assert engine.driving_terms(["fire", "police", "news"]) == (["fire", "police"], ["news"])
+    # With nothing rarer that occurs, the rarest common term drives.
+    assert engine.driving_terms(["zzz", "news"]) == (["zzz", "news"], [])
+
+    plain = SearchEngine.from_records(records, ranking=BM25Ranking())
+    for query in ("fire news", "police news", "news"):
+        guarded = engine.search(query, limit=10)
+        expected = plain.search(query, limit=10)
+        assert list(guarded) == list(expected)
+    # The conjunction is exact, but only the rare term's postings were read.
+    assert engine.search("fire news", limit=10).candidates == 2
+    assert plain.search("fire news", limit=10).candidates == 9
+
+    # A common disjunct only scores documents reached through the others.
+    hits = engine.search("fire OR news", limit=10)
+    assert {d for d, _ in hits} == {0, 3}
+    assert set(hits[0][1].per_term) == {"fire", "news"}
+
+
+def test_pruned_paths_respect_max_df_ratio(records):
+    plain = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    reranked = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    reranked.reranker = Reranker(BM25Ranking(), depth=20)
+    fused = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    fused.fusion = ListFusion([BM25Ranking(), BM25Ranking(k1=1.2)], depth=20)
+
+    for query in ("fire OR news", "police OR news", "fire news", "police fire"):
+        expected = {d for d, _ in plain.search(query, limit=20)}
+        assert {d for d, _ in reranked.search(query, limit=20)} == expected
+        assert {d for d, _ in fused.search(query, limit=20)} == expected
+
+
+def test_max_df_ratio_is_validated_and_persisted(records, tmp_path):
+    with pytest.raises(ValueError):
+        SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.0)
+
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    path = str(tmp_path / "index.json")
+    engine.save(path)
+    assert SearchEngine.load(path, ranking=BM25Ranking()).max_df_ratio == 0.5
+
+
+def test_explain_reports_thresholds(records):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking(), max_df_ratio=0.5)
+    (_, result), *_ = explain_query(engine, "fire news", limit=1)
+
+    assert result.per_term["news"]["df"] == 9.0
+    assert result.per_term["news"]["df_cutoff"] == 5.0
+    assert result.per_term["news"]["driving"] == 0.0
+    assert result.per_term["fire"]["driving"] == 1.0
+    assert result.per_term["fire"]["score"] > 0
+
+    plain = SearchEngine.from_records(records, ranking=BM25Ranking())
+    (_, result), *_ = explain_query(plain, "fire news", limit=1)
+    assert "driving" not in result.per_term["news"]
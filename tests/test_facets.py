@@ -0,0 +1,38 @@
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.filters import Term
+
+
+def _engine():
+    records = [
+        {"id": i, "text": "storm" if i < 8 else "calm", "source": ["abc", "bbc", "abc"][i % 3],
+         "date": f"{2019 + i % 2}-0{1 + i % 3}-15", "tags": ["x"] if i % 2 else []}
+        for i in range(10)
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_facets_count_every_match_not_just_the_page():
+    results = _engine().search("storm", limit=2, facets=["source", "date:year", "date:month"])
+
+    assert len(results) == 2
+    assert results.facets["source"] == {"abc": 5, "bbc": 3}
+    assert results.facets["date:year"] == {2019: 4, 2020: 4}
+    assert sum(results.facets["date:month"].values()) == 8
+
+
+def test_facets_respect_filters():
+    results = _engine().search("storm", filters=[Term("source", "bbc")], facets=["date:year"])
+    assert results.facets == {"date:year": {2020: 2, 2019: 1}}
+
+
+def test_non_columnar_facet_uses_documents():
+    facets = _engine().search("storm", facets=["tags"]).facets
+    assert facets == {"tags": {}}  # lists are not countable values
+
+
+def test_unknown_granularity_is_rejected():
+    with pytest.raises(ValueError):
+        _engine().search("storm", facets=["date:week"])
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from scout.index.bitmap import ARRAY_MAX, DocBitmap
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.filters import FilterCache, Range, Term, evaluate_filters
+
+
+def _engine():
+    records = [
+        {"id": i, "text": "storm warning", "source": "abc_news" if i % 2 else "bbc",
+         "date": f"2020-01-{i + 1:02d}", "words": i, "tags": ["x"]}
+        for i in range(10)
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+@pytest.mark.parametrize("size", [10, ARRAY_MAX + 10])
+def test_bitmap_set_operations(size):
+    rng = np.random.default_rng(0)
+    a = rng.choice(200_000, size=size, replace=False)
+    b = np.concatenate([a[: size // 2], rng.choice(200_000, size=size, replace=False)])
+
+    ba, bb = DocBitmap.from_ordinals(a), DocBitmap.from_ordinals(b)
+
+    assert len(ba) == size
+    assert (ba & bb).to_ordinals().tolist() == sorted(set(a) & set(b))
+    assert (ba | bb).to_ordinals().tolist() == sorted(set(a) | set(b))
+    assert int(a[0]) in ba and -5 not in set(ba.to_ordinals())
+    assert ba.contains_many(b).tolist() == [x in set(a) for x in b]
+
+
+def test_term_and_range_filters():
+    engine = _engine()
+
+    hits = engine.search("storm", filters=[Term("source", "abc_news")])
+    assert sorted(d for d, _ in hits) == [1, 3, 5, 7, 9]
+
+    hits = engine.search(
+        "storm",
+        limit=20,
+        filters=[Term("source", "abc_news"), Range("date", gte="2020-01-04", lt="2020-01-08")],
+    )
+    assert sorted(d for d, _ in hits) == [3, 5]
+
+    hits = engine.search("storm", filters=[Range("words", gt=7)])
+    assert sorted(d for d, _ in hits) == [8, 9]
+
+
+def test_unknown_value_short_circuits():
+    results = _engine().search("storm", filters=[Term("source", "cnn")])
+    assert results == [] and results.candidates == 0
+
+
+def test_non_columnar_field_falls_back_to_documents():
+    engine = _engine()
+    hits = engine.search("storm", filters=[Term("tags", ["x"]), Term("source", "bbc")])
+    assert sorted(d for d, _ in hits) == [0, 2, 4, 6, 8]
+
+
+def test_unhashable_value_on_a_column_matches_nothing():
+    cache = FilterCache()
+    allowed, residual = evaluate_filters(
+        [Term("source", ["bbc"])], _engine().index.columns, cache=cache
+    )
+    assert allowed is not None and len(allowed) == 0 and residual == []
+
+
+def test_bitmaps_are_cached_per_column_store_version():
+    engine = _engine()
+    cache = FilterCache()
+    columns = engine.index.columns
+    clause = Term("source", "bbc")
+
+    first, _ = evaluate_filters([clause], columns, cache=cache)
+    again, _ = evaluate_filters([clause], columns, cache=cache)
+    assert again is first
+
+    engine.add_document(10, {"text": "storm", "source": "bbc"})
+    fresh, _ = evaluate_filters([clause], engine.index.columns, cache=cache)
+    assert len(fresh) == len(first) + 1
+
+
+def test_range_on_category_is_rejected():
+    with pytest.raises(ValueError):
+        _engine().search("storm", filters=[Range("source", gte="a")])
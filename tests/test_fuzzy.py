@@ -0,0 +1,157 @@
+import os
+import pickle
+import random
+import subprocess
+import sys
+
+import pytest
+
+from scout.index import fuzzy as fuzzy_mod
+from scout.index.frozen import FrozenIndex
+from scout.index.fuzzy import DeletionIndex, edit_distance
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import FUZZY_PENALTY, SearchEngine
+
+
+def _osa(a, b):
+    d = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+
+def test_edit_distance_matches_dynamic_programming():
+    rng = random.Random(3)
+    for _ in range(2000):
+        a = "".join(rng.choices("abc", k=rng.randint(0, 7)))
+        b = "".join(rng.choices("abc", k=rng.randint(0, 7)))
+        k = rng.randint(0, 3)
+        expected = _osa(a, b)
+        assert edit_distance(a, b, k) == (expected if expected <= k else None)
+
+
+@pytest.mark.parametrize("recent_min", [0, 1024])
+def test_lookup_matches_brute_force(monkeypatch, recent_min):
+    monkeypatch.setattr(fuzzy_mod, "RECENT_MIN", recent_min)
+    rng = random.Random(11)
+    doc_freqs = {
+        "".join(rng.choices("abcd", k=rng.randint(2, 9))): rng.randint(1, 50)
+        for _ in range(400)
+    }
+    terms = list(doc_freqs)
+    deletions = DeletionIndex(terms[:100], prefix_length=4)
+    for start in range(100, len(terms), 30):
+        deletions.add(terms[start : start + 30])
+
+    for word in ["abcd", "dcba", "aabbccdd", "bad", "cccccccc"]:
+        for max_distance in (1, 2):
+            expected = sorted(
+                (
+                    (t, d, df)
+                    for t, df in doc_freqs.items()
+                    if (d := _osa(word, t)) <= max_distance
+                ),
+                key=lambda m: (m[1], -m[2], m[0]),
+            )[:8]
+            assert deletions.lookup(word, doc_freqs, max_distance=max_distance) == expected
+
+
+def test_lookup_skips_terms_missing_from_doc_freqs():
+    deletions = DeletionIndex(["python", "pythons"])
+    assert deletions.lookup("pyton", {"pythons": 2}) == [("pythons", 2, 2)]
+
+
+@pytest.fixture
+def engine():
+    records = [
+        {"id": 1, "text": "python packaging"},
+        {"id": 2, "text": "pythons are snakes"},
+        {"id": 3, "text": "rust typing"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_misspelled_query_needs_fuzzy(engine):
+    assert list(engine.search("pyhton")) == []
+    assert [d for d, _ in engine.search("pyhton", fuzzy=True)] == [1, 2]
+
+
+def test_fuzzy_matches_are_penalized_per_edit(engine):
+    exact = dict(engine.search("python"))
+    hits = dict(engine.search("pyhton", fuzzy=True))
+
+    assert hits[1].score == pytest.approx(exact[1].score * FUZZY_PENALTY)
+    assert hits[1].components["fuzzy_penalty"] == FUZZY_PENALTY
+    assert hits[2].components["fuzzy_penalty"] == FUZZY_PENALTY**2
+
+
+def test_known_and_short_terms_are_not_expanded(engine):
+    assert [d for d, _ in engine.search("rust", fuzzy=True)] == [3]
+    assert list(engine.search("rs", fuzzy=True)) == []
+
+
+def test_terms_added_later_are_found(engine):
+    engine.search("pyhton", fuzzy=True)
+    deletions = engine.index.deletion_index()
+    engine.add_document(4, {"text": "typhoon season"})
+
+    assert [d for d, _ in engine.search("tyhpoon", fuzzy=True)] == [4]
+    assert engine.index.deletion_index() is deletions
+
+
+def test_adding_terms_leaves_earlier_recent_maps_alone():
+    deletions = DeletionIndex(["python"])
+    deletions.add(["pythons"])
+    _, _, recent = deletions._parts
+    before = {h: list(group) for h, group in recent.items()}
+
+    deletions.add(["pyramid", "pythonic"])
+    assert recent == before
+    assert deletions._parts[2] is not recent
+    assert [t for t, _, _ in deletions.lookup("pyramdi", {"pyramid": 1})] == ["pyramid"]
+
+
+def test_freezing_builds_no_deletion_index_unless_asked(engine):
+    frozen = FrozenIndex.from_index(engine.index)
+    assert engine.index._deletions is None
+    assert "deletions" not in frozen.meta and "deletion_hashes" not in frozen.arrays
+    assert [t for t, _, _ in frozen.deletion_index().lookup("pyhton", frozen.doc_freqs)] == [
+        "python",
+        "pythons",
+    ]
+
+    frozen = FrozenIndex.from_index(engine.index, fuzzy=True)
+    assert engine.index._deletions is not None and "deletions" in frozen.meta
+
+
+def test_deletion_index_is_saved_with_the_index(engine, tmp_path):
+    engine.prepare_fuzzy()
+    deletions = engine.index.deletion_index()
+    assert pickle.loads(pickle.dumps(engine.index))._deletions is not None
+
+    path = tmp_path / "index.frz"
+    FrozenIndex.from_index(engine.index).save(path)
+    frozen = FrozenIndex.open(path)
+    assert frozen.deletion_index().lookup("pyhton", frozen.doc_freqs) == deletions.lookup(
+        "pyhton", engine.index.doc_freqs
+    )
+
+    # Delete hashes do not depend on the process's hash seed.
+    script = (
+        "import sys; from scout.index.frozen import FrozenIndex; "
+        "frozen = FrozenIndex.open(sys.argv[1]); "
+        "print(frozen.deletion_index().lookup('pyhton', frozen.doc_freqs))"
+    )
+    for seed in ("1", "2"):
+        out = subprocess.run(
+            [sys.executable, "-c", script, str(path)],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert out.strip() == "[('python', 1, 1), ('pythons', 2, 1)]"
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.hot import mine_query_log, mine_usage
+from scout.state.usage import UsageStore
+
+
+@pytest.fixture
+def engine():
+    records = [
+        {"id": 1, "text": "python packaging"},
+        {"id": 2, "text": "python typing"},
+        {"id": 3, "text": "rust typing"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_mine_query_log_counts_normalized_queries(tmp_path):
+    log = tmp_path / "queries.jsonl"
+    lines = [
+        {"query": "Python"},
+        {"q": "python "},
+        {"query": "rust"},
+        "rust",
+        "typing",
+        "not json",
+        {"other": 1},
+    ]
+    log.write_text(
+        "\n".join(line if line == "not json" else json.dumps(line) for line in lines),
+        encoding="utf-8",
+    )
+
+    assert mine_query_log(log, 2) == ["python", "rust"]
+
+
+def test_mine_usage():
+    usage = UsageStore()
+    for query in ["a", "b", "b"]:
+        usage.record_query(query)
+    assert mine_usage(usage, 1) == ["b"]
+
+
+def test_hot_queries_are_served_from_the_cache(engine):
+    expected = engine.search("python", limit=2)
+    cache = engine.enable_hot_cache(["Python"], limit=2)
+    assert len(cache) == 1
+
+    hits = engine.search("python", limit=1)
+    assert hits == expected[:1]
+    assert cache.hits == 1
+
+    # Deeper pages and searches with options bypass the cache.
+    assert engine.search("python", limit=5) == expected
+    engine.search("python", limit=1, sort_by="id")
+    assert cache.hits == 1
+
+
+def test_changes_refresh_affected_queries_only(engine):
+    cache = engine.enable_hot_cache(["python", "rust", "typ*"])
+    assert len(cache) == 3
+
+    engine.add_document(4, {"text": "python python python"})
+    assert len(cache) == 1  # "rust" is untouched; "typ*" drops on any change
+
+    misses = cache.misses
+    assert [d for d, _ in engine.search("python")][0] == 4
+    assert cache.misses == misses + 1
+    assert cache.warm() == 1
+    assert len(cache) == 3
+
+
+def test_results_from_before_an_invalidation_are_not_stored(engine):
+    cache = engine.enable_hot_cache(["python"], warm=False)
+    version = cache.version
+    stale = engine.search("python")
+    cache.invalidate(["python"])
+
+    cache.put("python", 10, stale, version=version)
+    assert len(cache) == 0
+
+
+def test_searches_on_an_older_snapshot_are_not_stored():
+    engine = SearchEngine.from_records([{"id": 1, "text": "storm warning"}], ranking=BM25Ranking())
+    cache = engine.enable_hot_cache(["storm"], warm=False)
+
+    # A search that took its snapshot just before a write lands.
+    version = engine._cache_version()
+    view = engine._snapshot()
+    engine.add_document(2, {"text": "storm surge"})
+    stale = engine._execute("storm", view, limit=10, budget=None, cache_version=version)
+
+    assert [d for d, _ in stale] == [1]
+    assert len(cache) == 0
+    assert sorted(d for d, _ in engine.search("storm")) == [1, 2]
+
+
+def test_warming_does_not_count_as_usage(engine):
+    engine.usage = UsageStore()
+    engine.search("rust")
+    cache = engine.enable_hot_cache(["python", "typing"])
+    assert len(cache) == 2
+    assert mine_usage(engine.usage, 5) == ["rust"]
+
+
+def test_engines_without_state_keep_the_cache_fresh(engine, tmp_path):
+    path = str(tmp_path / "index.json")
+    engine.save(path)
+    loaded = SearchEngine.load(path, ranking=BM25Ranking())
+    cache = loaded.enable_hot_cache(["python", "rust"])
+
+    loaded.add_document(4, {"text": "python python python"})
+    assert len(cache) == 1
+    assert [d for d, _ in loaded.search("python")][0] == 4
+
+    # Writes straight to the index drop every entry on the next search.
+    loaded.index.add_document(5, ["rust", "rust", "rust"], {})
+    assert [d for d, _ in loaded.search("rust")][0] == 5
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from scout.benchmarks.champions import champion_tradeoff
+from scout.index.impact import ImpactIndex, impact_index
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.tf import TermFrequencyRanking
+from scout.search.engine import SearchEngine
+
+
+@pytest.fixture(scope="module")
+def engine():
+    rng = random.Random(5)
+    vocab = [f"w{i}" for i in range(40)]
+    weights = [1 / (i + 1) for i in range(40)]
+    records = [
+        {"id": i, "text": " ".join(rng.choices(vocab, weights, k=rng.randint(3, 25)))}
+        for i in range(400)
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+QUERIES = ["w0", "w1 w2", "w0 w5", "w3 or w30", "w12 w0 w1"]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_exact_mode_matches_exhaustive_bm25(engine, query):
+    expected = engine.search(query, limit=10)
+    tokens = [t for t in query.split() if t != "or"]
+
+    result = ImpactIndex(engine.index).top_k(
+        tokens, 10, require_all="or" not in query, champions=4
+    )
+
+    assert result.exact
+    assert [d for d, _ in result.hits] == [d for d, _ in expected]
+    assert [s for _, s in result.hits] == pytest.approx([r.score for _, r in expected])
+
+
+def test_impacts_are_ordered_and_champions_come_first(engine):
+    postings = ImpactIndex(engine.index).postings("w0")
+    assert len(postings) == engine.index.doc_freqs["w0"]
+    assert all(a >= b for a, b in zip(postings.impacts, postings.impacts[1:], strict=False))
+    assert postings.bound_after(len(postings)) == 0.0
+
+
+def test_approximate_mode_stops_after_the_champions(engine):
+    result = ImpactIndex(engine.index).top_k(["w0", "w1"], 10, champions=10, exact=False)
+    assert result.depth == 10
+    assert result.candidates <= 20
+
+
+def test_conjunctions_stop_once_the_shortest_list_is_read(engine):
+    rare = min(engine.index.doc_freqs, key=engine.index.doc_freqs.__getitem__)
+    # Fewer than k matches, so only exhausting the rare list proves it.
+    k = engine.index.doc_freqs[rare] + 5
+    result = ImpactIndex(engine.index).top_k([rare, "w0"], k, champions=1)
+
+    assert result.exact
+    assert result.depth == k < engine.index.doc_freqs["w0"]
+
+
+def test_impact_index_is_rebuilt_when_documents_are_added():
+    engine = SearchEngine.from_records(
+        [{"id": 1, "text": "alpha beta"}], ranking=BM25Ranking()
+    )
+    first = impact_index(engine.index)
+    assert impact_index(engine.index) is first
+
+    engine.add_document(2, {"text": "alpha"})
+    assert impact_index(engine.index) is not first
+    assert [d for d, _ in impact_index(engine.index).top_k(["alpha"], 5).hits] == [2, 1]
+
+
+def test_built_lists_are_bounded(engine):
+    index = engine.index
+    sizes = {t: index.doc_freqs[t] for t in ("w0", "w1", "w2")}
+    impacts = ImpactIndex(index, max_postings=sizes["w0"] + sizes["w1"])
+
+    first = impacts.postings("w0")
+    impacts.postings("w1")
+    assert impacts.postings("w0") is first
+    impacts.postings("w2")  # evicts w1, the least recently used
+    assert set(impacts._lists) == {"w0", "w2"}
+    assert impacts._cached_postings <= impacts.max_postings
+
+    # Eviction never changes results.
+    expected = ImpactIndex(index).top_k(["w0", "w1", "w2"], 10, require_all=False)
+    assert impacts.top_k(["w0", "w1", "w2"], 10, require_all=False) == expected
+
+
+def test_champion_tradeoff_reports_recall_and_latency(engine):
+    points = champion_tradeoff(engine, QUERIES, k=5, depths=(2, 50), repeats=1)
+    modes = {p.mode: p for p in points}
+
+    assert set(modes) == {
+        "exhaustive", "champions@2", "champions@2+exact", "champions@50", "champions@50+exact"
+    }
+    assert modes["champions@2+exact"].recall == 1.0
+    assert modes["champions@2+exact"].exact_rate == 1.0
+    assert set(modes["champions@50"].latency_ms) == {50, 95, 99}
+
+
+def test_champion_tradeoff_needs_bm25():
+    engine = SearchEngine.from_records([{"id": 1, "text": "a b"}], ranking=TermFrequencyRanking())
+    with pytest.raises(ValueError):
+        champion_tradeoff(engine, ["a"])
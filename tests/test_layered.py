@@ -0,0 +1,62 @@
+import pickle
+
+from scout.index.layered import LayeredDict, SharedList
+
+
+def test_forks_are_independent():
+    base = LayeredDict({"a": 1, "b": 2})
+    fork = base.fork()
+    fork["a"] = 10
+    del fork["b"]
+    base["c"] = 3
+
+    assert base == {"a": 1, "b": 2, "c": 3}
+    assert fork == {"a": 10}
+    assert len(base) == 3 and len(fork) == 1
+    assert "b" not in fork and fork.get("b") is None
+    assert fork.get_many(["a", "b", "c"], 0) == [10, 0, 0]
+    assert list(base) == ["a", "b", "c"]
+
+
+def test_fork_leaves_the_source_untouched():
+    base = LayeredDict({"a": 1})
+    first = base.fork()
+    del first["a"]
+    first["b"] = 2
+    maps = first._maps
+
+    second = first.fork()
+    assert first._maps is maps and first._deletes
+    assert first == second == {"b": 2}
+    assert "a" not in first and "a" not in second
+
+
+def test_layers_stay_logarithmic():
+    data = LayeredDict()
+    for i in range(4096):
+        data[i] = i
+        data = data.fork()
+        assert len(data._layers) <= 13
+    assert data == {i: i for i in range(4096)}
+
+
+def test_default_does_not_store():
+    counts = LayeredDict(default=int)
+    assert counts["missing"] == 0
+    assert "missing" not in counts
+    counts["seen"] += 1
+    assert counts == {"seen": 1}
+    assert pickle.loads(pickle.dumps(counts))["other"] == 0
+
+
+def test_shared_list_views_do_not_see_later_items():
+    first = SharedList([1, 2])
+    second = first.extended([3])
+    branch = first.extended([4])
+
+    assert first == [1, 2]
+    assert second == [1, 2, 3]
+    assert branch == [1, 2, 4]
+    assert second._items is first._items
+    assert list(second.extended([5])) == [1, 2, 3, 5]
+    assert pickle.loads(pickle.dumps(second)) == [1, 2, 3]
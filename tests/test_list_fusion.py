@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from scout.ranking.base import RankingResult
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.robust import RobustRanking
+from scout.ranking.tf import TermFrequencyRanking
+from scout.search.engine import SearchEngine
+from scout.search.fusion import (
+    ListFusion,
+    normalized_score_fusion,
+    reciprocal_rank_fusion,
+)
+
+
+def hits(*pairs):
+    return [(doc_id, RankingResult(score, {})) for doc_id, score in pairs]
+
+
+def test_rrf_sums_reciprocal_ranks():
+    fused = reciprocal_rank_fusion(
+        [hits(("a", 9.0), ("b", 5.0)), hits(("b", 0.3), ("c", 0.2))],
+        names=["x", "y"],
+        k=60,
+    )
+    assert [d for d, _ in fused] == ["b", "a", "c"]
+    assert fused[0][1].score == pytest.approx(1 / 62 + 1 / 61)
+    assert fused[0][1].components == pytest.approx({"x": 1 / 62, "y": 1 / 61})
+
+
+def test_score_fusion_normalizes_each_list():
+    fused = normalized_score_fusion(
+        [hits(("a", 10.0), ("b", 0.0)), hits(("b", 0.5), ("c", 0.25))],
+        weights=[1.0, 2.0],
+    )
+    scores = {d: r.score for d, r in fused}
+    assert scores == pytest.approx({"a": 1.0, "b": 2.0, "c": 0.0})
+
+
+@pytest.fixture(scope="module")
+def records():
+    rng = random.Random(7)
+    vocab = [f"w{i}" for i in range(30)]
+    weights = [1 / (i + 1) for i in range(30)]
+    return [
+        {"id": i, "text": " ".join(rng.choices(vocab, weights, k=rng.randint(3, 20))),
+         "source": f"s{i % 4}"}
+        for i in range(300)
+    ]
+
+
+@pytest.mark.parametrize("method", ["rrf", "score"])
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_engine_search_fuses_the_independent_top_lists(records, method, max_workers):
+    rankings = [BM25Ranking(), RobustRanking()]
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    engine.fusion = ListFusion(rankings, method=method, depth=30, max_workers=max_workers)
+
+    results = engine.search("w1 w4", limit=10)
+
+    singles = [
+        SearchEngine.from_records(records, ranking=r).search("w1 w4", limit=30)
+        for r in rankings
+    ]
+    expected = engine.fusion.fuse(singles)[:10]
+    assert [d for d, _ in results] == [d for d, _ in expected]
+    assert set(results.stages) == {"BM25Ranking", "RobustRanking", "fuse"}
+    assert set(results[0][1].components) <= {"BM25Ranking", "RobustRanking"}
+    engine.fusion.close()
+
+
+def test_fusion_keeps_filters_facets_and_collapsing(records):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    engine.fusion = ListFusion([BM25Ranking(), TermFrequencyRanking()], depth=50)
+
+    results = engine.search("w2", limit=10, facets=["source"], collapse_on="source")
+
+    sources = [engine.index.get_document(d)["source"] for d, _ in results]
+    assert len(sources) == len(set(sources)) == 4
+    assert sum(results.facets["source"].values()) == engine.index.doc_freqs["w2"]
+    engine.fusion.close()
+
+
+def test_duplicate_ranking_classes_get_distinct_names():
+    fusion = ListFusion([BM25Ranking(), BM25Ranking(k1=1.2)])
+    assert fusion.names == ["BM25Ranking#0", "BM25Ranking#1"]
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        ListFusion([])
+    with pytest.raises(ValueError):
+        ListFusion([BM25Ranking()], weights=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        ListFusion([BM25Ranking()], method="max")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        ListFusion([BM25Ranking()], max_workers=0)
@@ -21,4 +21,25 @@ def test_query_latency_under_budget():
     assert duration < 0.05
 
 
-# TODO
\ No newline at end of file
+def _publish_cost(size):
+    records = [{"id": i, "text": f"shared term{i % 500} doc{i}"} for i in range(size)]
+    engine = SearchEngine.from_records(records, ranking=RobustRanking())
+    timings = []
+    for doc_id in range(size, size + 200):
+        start = time.perf_counter()
+        engine.add_document(doc_id, {"text": f"shared term{doc_id % 500} doc{doc_id}"})
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+@pytest.mark.performance
+def test_publish_cost_does_not_grow_with_index_size():
+    # Each add_document forks and publishes a generation; that must cost
+    # O(changes), not a copy of the whole index.
+    small = _publish_cost(1000)
+    large = _publish_cost(16000)
+    assert large < 3 * small
+
+
+# TODO
@@ -0,0 +1,117 @@
+import random
+import string
+
+import pytest
+
+from scout.index import terms as terms_mod
+from scout.index.terms import TermDictionary
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+
+
+def _brute_force(doc_freqs, prefix, k):
+    matches = [(t, df) for t, df in doc_freqs.items() if t.startswith(prefix)]
+    return sorted(matches, key=lambda item: (-item[1], item[0]))[:k]
+
+
+@pytest.mark.parametrize("scan_limit", [4, 1024])
+def test_complete_matches_brute_force(monkeypatch, scan_limit):
+    monkeypatch.setattr(terms_mod, "SCAN_LIMIT", scan_limit)
+    monkeypatch.setattr(terms_mod, "TOP_PER_NODE", 3)
+    rng = random.Random(7)
+    doc_freqs = {
+        "".join(rng.choices("abc", k=rng.randint(1, 5))): rng.randint(1, 20)
+        for _ in range(300)
+    }
+    terms = TermDictionary(doc_freqs)
+
+    for prefix in ["", "a", "ab", "abc", "cab", "ccccc", "z"]:
+        for k in (1, 3, 10):
+            assert terms.complete(prefix, k) == _brute_force(doc_freqs, prefix, k)
+
+    assert terms.expand("ab") == sorted(t for t in doc_freqs if t.startswith("ab"))
+
+
+def test_large_vocabulary_precomputes_busy_prefixes():
+    rng = random.Random(1)
+    doc_freqs = {
+        "".join(rng.choices(string.ascii_lowercase, k=8)): rng.randint(1, 1000)
+        for _ in range(20_000)
+    }
+    terms = TermDictionary(doc_freqs)
+
+    assert "" in terms._top and "a" not in terms._top
+    assert terms.complete("q", 5) == _brute_force(doc_freqs, "q", 5)
+
+
+def test_ties_at_the_cutoff_go_by_term():
+    doc_freqs = {f"t{i:05d}": 1 for i in range(5000)} | {"t04999x": 2}
+    terms = TermDictionary(doc_freqs)
+
+    assert terms.complete("t", 3) == _brute_force(doc_freqs, "t", 3)
+    assert terms._rank(0, len(terms.terms), 3).tolist() == [5000, 0, 1]
+
+
+@pytest.fixture
+def engine():
+    records = [
+        {"id": 1, "text": "python packaging"},
+        {"id": 2, "text": "python typing pythonic"},
+        {"id": 3, "text": "pyramid framework"},
+        {"id": 4, "text": "rust typing"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_prefix_query_matches_any_completion(engine):
+    assert sorted(d for d, _ in engine.search("pyth*")) == [1, 2]
+    assert sorted(d for d, _ in engine.search("py* typing")) == [2]
+    assert sorted(d for d, _ in engine.search("typing -pyth*")) == [4]
+    assert engine.search("zzz*") == []
+
+
+def test_autocomplete_tracks_new_documents(engine):
+    assert engine.autocomplete("py", 2) == [("python", 2), ("pyramid", 1)]
+
+    engine.add_document(5, {"text": "pyramid pyramid"})
+    engine.add_document(6, {"text": "pyramid"})
+    assert engine.autocomplete("Py", 1) == [("pyramid", 3)]
+
+
+@pytest.mark.parametrize("scan_limit", [4, 1024])
+def test_updated_dictionary_matches_a_rebuild(monkeypatch, scan_limit):
+    monkeypatch.setattr(terms_mod, "SCAN_LIMIT", scan_limit)
+    monkeypatch.setattr(terms_mod, "TOP_PER_NODE", 3)
+    rng = random.Random(11)
+
+    def word():
+        return "".join(rng.choices("abc", k=rng.randint(1, 5)))
+
+    doc_freqs = {word(): rng.randint(1, 20) for _ in range(300)}
+    terms = TermDictionary(doc_freqs)
+    for _ in range(5):
+        changed = [word() for _ in range(20)] + rng.sample(sorted(doc_freqs), 20)
+        for term in changed:
+            doc_freqs[term] = doc_freqs.get(term, 0) + rng.randint(1, 30)
+        terms = terms.updated(doc_freqs, changed)
+
+        for prefix in ["", "a", "ab", "abc", "cab", "z"]:
+            for k in (1, 3, 10):
+                assert terms.complete(prefix, k) == _brute_force(doc_freqs, prefix, k)
+            assert terms.expand(prefix) == sorted(t for t in doc_freqs if t.startswith(prefix))
+        assert len(terms) == len(doc_freqs)
+
+
+def test_term_dictionary_follows_writes_and_forks(engine):
+    index = engine.index
+    base = index.term_dictionary()
+
+    fork = index.fork()
+    fork.add_document(5, ["pyramidal", "python"], {})
+    updated = fork.term_dictionary()
+    assert updated.terms is base.terms
+    assert updated.complete("py", 3) == [("python", 3), ("pyramid", 1), ("pyramidal", 1)]
+    assert updated.expand("pyramid") == ["pyramid", "pyramidal"]
+    # The original index still sees its own generation.
+    assert index.term_dictionary() is base
+    assert base.complete("py", 3) == [("python", 2), ("pyramid", 1), ("pythonic", 1)]
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from scout.benchmarks.quantization import quantization_regression
+from scout.benchmarks.run import BenchmarkQuery
+from scout.index.frozen import FrozenIndex
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.quantized import QuantizedBM25Ranking
+from scout.search.engine import SearchEngine
+
+
+@pytest.fixture(scope="module")
+def engine():
+    rng = random.Random(9)
+    vocab = [f"w{i}" for i in range(30)]
+    weights = [1 / (i + 1) for i in range(30)]
+    records = [
+        {"id": i, "text": " ".join(rng.choices(vocab, weights, k=rng.randint(3, 30)))}
+        for i in range(300)
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def _view(index, ranking, engine):
+    return SearchEngine(index=index, ranking=ranking, tokenizer=engine._tokenizer)
+
+
+@pytest.mark.parametrize("dtype", ["uint8", "uint16"])
+def test_quantized_scores_track_exact_bm25(engine, dtype):
+    frozen = FrozenIndex.from_index(engine.index, impacts=dtype)
+    quantized = _view(frozen, QuantizedBM25Ranking(), engine)
+    # Rounding error is at most half a step per term.
+    tolerance = frozen.impact_scale
+
+    for query in ["w0", "w1 w4", "w2 OR w20"]:
+        expected = dict(engine.search(query, limit=1000))
+        got = dict(quantized.search(query, limit=1000))
+        assert set(got) == set(expected)
+        for doc_id, result in got.items():
+            assert result.score == pytest.approx(expected[doc_id].score, abs=tolerance)
+
+
+def test_terms_in_every_document_still_match():
+    records = [
+        {"id": i, "text": f"news topic{i % 50} " + "filler " * (i % 7)} for i in range(2000)
+    ]
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    frozen = FrozenIndex.from_index(engine.index, impacts="uint8")
+
+    results = _view(frozen, QuantizedBM25Ranking(), engine).search("news", limit=5000)
+    assert len(results) == 2000
+    assert all(r.score > 0.0 for _, r in results)
+
+
+def test_uint16_is_finer_than_uint8(engine):
+    coarse = FrozenIndex.from_index(engine.index, impacts="uint8")
+    fine = FrozenIndex.from_index(engine.index, impacts="uint16")
+    assert fine.impact_scale < coarse.impact_scale / 200
+    assert fine.arrays["postings_impact"].dtype.name == "uint16"
+
+
+def test_impacts_survive_save_and_open(engine, tmp_path):
+    frozen = FrozenIndex.from_index(engine.index, impacts="uint8")
+    frozen.save(tmp_path / "index.frz")
+    mapped = FrozenIndex.open(tmp_path / "index.frz")
+
+    ranking = QuantizedBM25Ranking()
+    assert [r.score for r in ranking.score_many(["w3"], mapped, [0, 1, 2, 999])] == [
+        r.score for r in ranking.score_many(["w3"], frozen, [0, 1, 2, 999])
+    ]
+    assert mapped.impact_scale == frozen.impact_scale
+
+
+def test_string_ids_and_unknown_docs():
+    engine = SearchEngine.from_records(
+        [{"id": "a", "text": "fox"}, {"id": "b", "text": "fox fox dog"}],
+        ranking=BM25Ranking(),
+    )
+    frozen = FrozenIndex.from_index(engine.index, impacts="uint16")
+    results = QuantizedBM25Ranking().score_many(["fox"], frozen, ["b", "a", "zzz"])
+
+    exact = BM25Ranking().score_many(["fox"], engine.index, ["b", "a"])
+    assert [r.score for r in results[:2]] == pytest.approx(
+        [r.score for r in exact], abs=frozen.impact_scale
+    )
+    assert results[2].score == 0.0
+    assert results[0].per_term["fox"]["impact"] > 0
+
+
+def test_needs_frozen_impacts(engine):
+    with pytest.raises(ValueError):
+        QuantizedBM25Ranking().score(["w0"], FrozenIndex.from_index(engine.index), 0)
+    with pytest.raises(ValueError):
+        QuantizedBM25Ranking().score(["w0"], engine.index, 0)
+
+
+def test_quantization_regression_passes_the_regression_check(engine):
+    queries = [
+        BenchmarkQuery(query=q, relevant_doc_ids=frozenset(rel))
+        for q, rel in [("w0 w1", {"1", "2", "3"}), ("w5", {"7"}), ("w2 w3", {"4", "40"})]
+    ]
+    report = quantization_regression(engine, queries, k=5, dtype="uint16")
+
+    assert not report.regression.failed, report.regression.reasons
+    assert set(report.regression.deltas) >= {"recall@k_mean", "mrr_mean"}
+    assert report.agreement == 1.0
@@ -0,0 +1,66 @@
+import pytest
+
+from scout.index.inverted import InvertedIndex
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.composite import CompositeRanking
+from scout.ranking.context import QueryContext
+from scout.ranking.robust import RobustRanking
+from scout.ranking.tf import TermFrequencyRanking
+from scout.ranking.tfidf import TFIDFRanking
+from scout.search.engine import SearchEngine
+
+RECORDS = [
+    {"id": 1, "text": "apple banana apple"},
+    {"id": 2, "text": "banana cherry"},
+    {"id": 3, "text": "apple cherry cherry date"},
+    {"id": 4, "text": "date"},
+]
+
+
+class CountingIndex(InvertedIndex):
+    def __init__(self, source: InvertedIndex) -> None:
+        self.__dict__.update(source.__dict__)
+        self.fetches: list[str] = []
+
+    def get_postings(self, token):
+        self.fetches.append(token)
+        return super().get_postings(token)
+
+
+@pytest.fixture()
+def index():
+    return CountingIndex(SearchEngine.from_records(RECORDS, ranking=BM25Ranking()).index)
+
+
+def test_composite_fetches_each_tokens_postings_once(index):
+    ranking = CompositeRanking([BM25Ranking(), RobustRanking()], [0.5, 0.5])
+    ranking.score_many(["apple", "cherry"], index, [1, 2, 3, 4])
+    assert sorted(index.fetches) == ["apple", "cherry"]
+
+
+def test_context_is_reused_across_batches_of_one_query(index):
+    context = QueryContext(["apple"], index)
+    batch = [1, 2]
+    first = BM25Ranking().score_many(["apple"], index, batch, context)
+    batch[:] = [3, 4]
+    second = BM25Ranking().score_many(["apple"], index, batch, context)
+
+    assert index.fetches == ["apple"]
+    assert [r.score > 0 for r in first + second] == [True, False, True, False]
+
+
+def test_context_for_another_query_is_not_used(index):
+    stale = QueryContext(["banana"], index)
+    results = TermFrequencyRanking().score_many(["apple"], index, [1, 3], stale)
+    assert [r.score for r in results] == [2.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "ranking",
+    [BM25Ranking(), TermFrequencyRanking(), TFIDFRanking(), RobustRanking()],
+)
+def test_batch_scores_equal_single_document_scores(index, ranking):
+    tokens = ["apple", "cherry", "missing"]
+    batch = ranking.score_many(tokens, index, [1, 2, 3, 4, 99])
+    assert batch == [ranking.score(tokens, index, d) for d in [1, 2, 3, 4, 99]]
+    assert batch[4].score == 0.0
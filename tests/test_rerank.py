@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from scout.index.frozen import FrozenIndex
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.composite import CompositeRanking
+from scout.ranking.recency import RecencyRanking
+from scout.ranking.robust import RobustRanking
+from scout.search.engine import SearchEngine
+from scout.search.rerank import Reranker
+
+
+def fusion():
+    return CompositeRanking(
+        strategies=[BM25Ranking(), RobustRanking()],
+        weights=[0.5, 0.5],
+        recency=RecencyRanking(),
+    )
+
+
+@pytest.fixture()
+def records():
+    rng = random.Random(11)
+    vocab = [f"w{i}" for i in range(30)]
+    weights = [1 / (i + 1) for i in range(30)]
+    return [
+        {
+            "id": i,
+            "text": " ".join(rng.choices(vocab, weights, k=rng.randint(3, 20))),
+            "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        }
+        for i in range(300)
+    ]
+
+
+def two_stage(records, depth, **kwargs):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    engine.reranker = Reranker(fusion(), depth=depth, **kwargs)
+    return engine
+
+
+@pytest.mark.parametrize("query", ["w0", "w1 w2", "w3 or w20", "w0 -w1", "w1*"])
+def test_reranking_every_match_equals_the_reranker_alone(records, query):
+    single = SearchEngine.from_records(records, ranking=fusion())
+    engine = two_stage(records, depth=len(records))
+
+    expected = single.search(query, limit=10)
+    results = engine.search(query, limit=10)
+
+    assert [d for d, _ in results] == [d for d, _ in expected]
+    assert [r.score for _, r in results] == pytest.approx([r.score for _, r in expected])
+
+
+def test_only_the_first_stage_top_n_is_reranked(records):
+    bm25 = SearchEngine.from_records(records, ranking=BM25Ranking())
+    engine = two_stage(records, depth=20)
+
+    first_stage = {d for d, _ in bm25.search("w0 w1", limit=20)}
+    results = engine.search("w0 w1", limit=10)
+
+    assert {d for d, _ in results} <= first_stage
+    assert set(results[0][1].components) == {"BM25Ranking", "RobustRanking", "recency"}
+
+
+def test_pruned_first_stage_matches_the_exhaustive_one(records):
+    pruned = two_stage(records, depth=15)
+    exhaustive = two_stage(records, depth=15, prune=False)
+
+    for query in ["w0", "w2 w5", "w1 or w25"]:
+        assert [d for d, _ in pruned.search(query)] == [d for d, _ in exhaustive.search(query)]
+    assert pruned.search("w0").scored < exhaustive.search("w0").scored
+
+
+def test_frozen_indexes_use_the_pruned_first_stage(records):
+    engine = two_stage(records, depth=15)
+    frozen = SearchEngine(
+        index=FrozenIndex.from_index(engine.index),
+        ranking=BM25Ranking(),
+        tokenizer=engine._tokenizer,
+    )
+    frozen.reranker = engine.reranker
+
+    for query in ["w0", "w2 w5", "w1 or w25"]:
+        expected = engine.search(query)
+        results = frozen.search(query)
+        assert [d for d, _ in results] == [d for d, _ in expected]
+        assert [r.score for _, r in results] == pytest.approx([r.score for _, r in expected])
+        assert results.scored == expected.scored
+
+
+def test_stage_latencies_are_reported(records):
+    engine = two_stage(records, depth=50)
+    results = engine.search("w0 w1", limit=5)
+    assert set(results.stages) == {"retrieve", "rerank"}
+    assert all(ms >= 0.0 for ms in results.stages.values())
+
+    engine.reranker = None
+    assert engine.search("w0 w1", limit=5).stages == {}
+
+
+def test_depth_must_be_positive():
+    with pytest.raises(ValueError):
+        Reranker(BM25Ranking(), depth=0)
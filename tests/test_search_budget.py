@@ -0,0 +1,38 @@
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.budget import SearchBudget
+from scout.search.engine import SearchEngine
+
+
+@pytest.fixture
+def engine():
+    records = [{"id": i, "text": "common filler"} for i in range(50)]
+    records.append({"id": 100, "text": "common rare"})
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_unbudgeted_search_is_complete(engine):
+    results = engine.search("common OR rare", limit=5)
+    assert not results.partial
+    assert results.candidates == 51
+    assert results.scored == 51
+
+
+def test_work_budget_returns_partial_results(engine):
+    results = engine.search("common OR rare", limit=5, budget=SearchBudget(max_scored=1))
+    assert results.partial
+    assert results.scored == 1
+    # The rarest term's postings are visited first, so the best doc is found.
+    assert results[0][0] == 100
+
+
+def test_time_budget_of_zero_scores_nothing(engine):
+    results = engine.search("common", budget=SearchBudget(max_time_ms=0))
+    assert results.partial
+    assert results == []
+
+
+def test_budget_rejects_negative_limits():
+    with pytest.raises(ValueError):
+        SearchBudget(max_scored=-1)
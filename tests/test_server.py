@@ -0,0 +1,169 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from scout.benchmarks.loadgen import run_load
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.server.batching import MicroBatcher, Overloaded
+from scout.server.http import make_server
+from scout.state.usage import UsageStore
+
+
+@pytest.fixture
+def engine():
+    records = [
+        {"id": 1, "text": "quick brown fox"},
+        {"id": 2, "text": "lazy brown dog"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_search_many_matches_individual_searches(engine):
+    batch = engine.search_many(["fox", "brown", "fox"], limit=5)
+    assert batch == [engine.search(q, limit=5) for q in ["fox", "brown", "fox"]]
+    assert batch[0] is not batch[2]
+
+
+def test_batcher_rejects_when_queue_is_full(engine, monkeypatch):
+    release = threading.Event()
+    original = engine.search_many
+
+    def slow_search_many(queries, *, limit=10):
+        release.wait(timeout=5)
+        return original(queries, limit=limit)
+
+    monkeypatch.setattr(engine, "search_many", slow_search_many)
+    batcher = MicroBatcher(engine, max_batch=1, max_wait_ms=0, max_queue=1)
+
+    first = batcher.submit("fox")
+    while batcher.pending:  # wait for the worker to pick it up
+        pass
+    queued = batcher.submit("dog")
+    with pytest.raises(Overloaded):
+        batcher.submit("brown")
+
+    release.set()
+    assert first.result(timeout=5)[0][0] == 1
+    assert queued.result(timeout=5)[0][0] == 2
+    assert batcher.rejected == 1
+    batcher.close()
+
+
+def test_close_fails_queued_requests(engine, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    original = engine.search_many
+
+    def slow_search_many(queries, *, limit=10):
+        started.set()
+        release.wait(timeout=5)
+        return original(queries, limit=limit)
+
+    monkeypatch.setattr(engine, "search_many", slow_search_many)
+    batcher = MicroBatcher(engine, max_batch=1, max_wait_ms=0, max_queue=2)
+
+    running = batcher.submit("fox")
+    assert started.wait(timeout=5)
+    queued = batcher.submit("dog")
+    with pytest.raises(Overloaded, match="no result within"):
+        batcher.search("brown", timeout=0.01)
+
+    closer = threading.Thread(target=batcher.close)
+    closer.start()
+    release.set()
+    closer.join(timeout=10)
+
+    assert running.result(timeout=5)[0][0] == 1
+    with pytest.raises(Overloaded):
+        queued.result(timeout=5)
+    with pytest.raises(Overloaded):
+        batcher.submit("fox")
+
+
+def test_http_server_answers_search_explain_and_health(engine):
+    engine.usage = UsageStore()
+    server = make_server(engine, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        with urllib.request.urlopen(f"{base}/search?q=fox&limit=1") as r:
+            body = json.load(r)
+        assert [hit["doc_id"] for hit in body["results"]] == [1]
+
+        with urllib.request.urlopen(f"{base}/explain?q=brown") as r:
+            body = json.load(r)
+        assert "per_term" in body["results"][0]
+
+        with urllib.request.urlopen(f"{base}/autocomplete?q=br&limit=3") as r:
+            body = json.load(r)
+        assert body["completions"] == [{"term": "brown", "df": 2}]
+
+        click = urllib.request.Request(
+            f"{base}/click", data=json.dumps({"doc_id": 2}).encode(), method="POST"
+        )
+        with urllib.request.urlopen(click) as r:
+            assert json.load(r) == {"recorded": True}
+        assert engine.usage.access_counts([2])[0] == pytest.approx(1.0, rel=1e-3)
+
+        for unknown in (99, [2]):
+            click = urllib.request.Request(
+                f"{base}/click", data=json.dumps({"doc_id": unknown}).encode(), method="POST"
+            )
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(click)
+            assert excinfo.value.code == 404
+        assert engine.usage.access_counts([99])[0] == 0.0
+
+        report = run_load(target=base, queries=["fox", "brown"], requests=40, concurrency=4)
+        assert report.ok == 40
+
+        with urllib.request.urlopen(f"{base}/healthz") as r:
+            health = json.load(r)
+        assert health["status"] == "ok"
+        assert health["batches"] >= 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_server_reports_search_failures(engine, monkeypatch):
+    def broken_search_many(queries, *, limit=10):
+        raise RuntimeError("index is gone")
+
+    monkeypatch.setattr(engine, "search_many", broken_search_many)
+    server = make_server(engine, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/search?q=fox")
+        assert excinfo.value.code == 500
+        assert json.load(excinfo.value) == {"error": "search failed: RuntimeError"}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_server_reports_autocomplete_failures(engine, monkeypatch):
+    def broken_autocomplete(prefix, limit=10):
+        raise RuntimeError("dictionary is gone")
+
+    monkeypatch.setattr(engine, "autocomplete", broken_autocomplete)
+    server = make_server(engine, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/autocomplete?q=fo")
+        assert excinfo.value.code == 500
+        assert json.load(excinfo.value) == {"error": "autocomplete failed: RuntimeError"}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,40 @@
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.robust import RobustRanking
+from scout.search.engine import SearchEngine
+from scout.search.sharded import ShardedSearchEngine
+
+RECORDS = [
+    {"id": i, "text": f"shared token{i % 7} word{i % 3} extra{i % 11}"}
+    for i in range(60)
+]
+
+
+@pytest.mark.parametrize("ranking_cls", [BM25Ranking, RobustRanking])
+def test_sharded_scores_match_single_engine(ranking_cls):
+    single = SearchEngine.from_records(RECORDS, ranking=ranking_cls())
+
+    with ShardedSearchEngine(RECORDS, ranking=ranking_cls(), shards=3) as sharded:
+        for query in ["shared", "token3 OR word1", "word2 extra5", "missing"]:
+            expected = single.search(query, limit=15)
+            actual = sharded.search(query, limit=15)
+            assert [(d, r.score) for d, r in actual] == [
+                (d, r.score) for d, r in expected
+            ]
+
+
+def test_sharded_add_document_updates_global_stats():
+    single = SearchEngine.from_records(RECORDS, ranking=BM25Ranking())
+
+    with ShardedSearchEngine(RECORDS, ranking=BM25Ranking(), shards=2) as sharded:
+        for doc_id in (100, 101):
+            record = {"text": "token1 novel"}
+            single.add_document(doc_id, record)
+            sharded.add_document(doc_id, record)
+
+        expected = single.search("token1 OR novel", limit=20)
+        actual = sharded.search("token1 OR novel", limit=20)
+        assert [(d, r.score) for d, r in actual] == [
+            (d, r.score) for d, r in expected
+        ]
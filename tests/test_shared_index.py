@@ -0,0 +1,125 @@
+import multiprocessing
+import uuid
+
+import pytest
+
+from scout.index.frozen import FrozenIndex
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.filters import Range, Term
+from scout.storage.shared import SharedIndexPublisher, SharedIndexReader
+
+RECORDS = [
+    {"id": "a", "text": "quick brown fox"},
+    {"id": "b", "text": "lazy brown dog"},
+    {"id": "c", "text": "fox and hound"},
+]
+
+
+def _scores(results):
+    return [(doc_id, r.score) for doc_id, r in results]
+
+
+@pytest.mark.parametrize("records", [RECORDS, [dict(r, id=i) for i, r in enumerate(RECORDS)]])
+def test_frozen_index_scores_match_inverted_index(records, tmp_path):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    frozen = FrozenIndex.from_index(engine.index)
+
+    path = tmp_path / "index.frz"
+    frozen.save(path)
+    mapped = FrozenIndex.open(path)
+
+    for index in (frozen, mapped):
+        view = SearchEngine(index=index, ranking=BM25Ranking(), tokenizer=engine._tokenizer)
+        for query in ["fox", "brown OR hound", "brown fox"]:
+            assert _scores(view.search(query)) == _scores(engine.search(query))
+        assert index.get_document(records[0]["id"]) == records[0]
+        assert index.thaw().to_dict() == engine.index.to_dict()
+
+
+def test_frozen_columns_are_stored_with_the_index(tmp_path):
+    records = [
+        {
+            "id": i,
+            "text": "fox" if i % 2 else "brown fox",
+            "source": "wire" if i % 3 else "desk",
+            "date": f"2020-01-{i + 1:02d}",
+            "score": i / 2,
+            "embedding": [float(i % 3), 1.0],
+        }
+        for i in range(20)
+    ]
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    path = tmp_path / "index.frz"
+    FrozenIndex.from_index(engine.index).save(path)
+    mapped = FrozenIndex.open(path)
+    view = SearchEngine(index=mapped, ranking=BM25Ranking(), tokenizer=engine._tokenizer)
+
+    # Plain searches leave the columns unbuilt.
+    assert _scores(view.search("brown fox")) == _scores(engine.search("brown fox"))
+    assert "columns" not in mapped.__dict__
+
+    queries = [
+        {"filters": [Term("source", "desk"), Range("date", gte="2020-01-05")]},
+        {"facets": ["source", "date:month"]},
+        {"sort_by": "-score", "collapse_on": "source"},
+    ]
+    for options in queries:
+        expected = engine.search("fox", limit=5, **options)
+        results = view.search("fox", limit=5, **options)
+        assert _scores(results) == _scores(expected)
+        assert results.facets == expected.facets
+
+    columns = mapped.columns
+    assert columns.ordinals_for([3, 99]).tolist() == [3, -1]
+    assert columns.vector("embedding").values.tolist() == (
+        engine.index.columns.vector("embedding").values.tolist()
+    )
+
+
+def _worker_search(name, queue):
+    reader = SharedIndexReader(name)
+    results = reader.engine(BM25Ranking()).search("fox")
+    queue.put((reader.version, [doc_id for doc_id, _ in results]))
+    reader.close()
+
+
+def test_workers_attach_to_latest_published_version():
+    name = f"scout-test-{uuid.uuid4().hex[:8]}"
+    engine = SearchEngine.from_records(RECORDS, ranking=BM25Ranking())
+
+    with SharedIndexPublisher(name) as publisher:
+        assert publisher.publish(engine) == 1
+        reader = SharedIndexReader(name)
+        assert reader.engine(BM25Ranking()).search("fox")
+
+        engine.add_document("d", {"text": "fox fox fox"})
+        assert publisher.publish(engine) == 2
+
+        queue = multiprocessing.get_context("spawn").Queue()
+        worker = multiprocessing.get_context("spawn").Process(
+            target=_worker_search, args=(name, queue)
+        )
+        worker.start()
+        version, doc_ids = queue.get(timeout=30)
+        worker.join()
+
+        assert version == 2
+        assert doc_ids[0] == "d"
+        # The in-process reader switches over on its next lookup.
+        assert reader.engine(BM25Ranking()).search("fox")[0][0] == "d"
+        reader.close()
+
+
+def test_reader_raises_once_the_published_segment_is_gone():
+    name = f"scout-test-{uuid.uuid4().hex[:8]}"
+    engine = SearchEngine.from_records(RECORDS, ranking=BM25Ranking())
+
+    publisher = SharedIndexPublisher(name)
+    publisher.publish(engine)
+    reader = SharedIndexReader(name)
+    publisher.close()
+
+    with pytest.raises(LookupError):
+        reader.index()
+    reader.close()
@@ -0,0 +1,90 @@
+import threading
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.state.signals import IndexState
+
+
+def test_batch_is_invisible_until_published():
+    state = IndexState()
+    state.add_document(1, ["fox"])
+    before = state.snapshot()
+
+    with state.batch() as batch:
+        batch.add_document(2, ["fox"])
+        state.add_document(3, ["dog"])  # joins the open batch
+        assert state.snapshot() is before
+
+    after = state.snapshot()
+    assert after.generation == before.generation + 1
+    assert before.index.get_postings("fox") == [(1, 1)]
+    assert before.index.stats.total_docs == 1
+    assert after.index.get_postings("fox") == [(1, 1), (2, 1)]
+    assert after.get_document_tokens(3) == ["dog"]
+
+
+def test_failed_batch_publishes_nothing():
+    state = IndexState()
+    try:
+        with state.batch() as batch:
+            batch.add_document(1, ["fox"])
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert state.generation == 0
+    assert state.index.get_postings("fox") == []
+
+
+def test_searches_see_consistent_snapshots_during_ingest():
+    state = IndexState()
+    engine = SearchEngine.from_records([], ranking=BM25Ranking(), state=state)
+    errors: list[str] = []
+    done = threading.Event()
+
+    def writer():
+        for start in range(0, 400, 20):
+            with state.batch():
+                for doc_id in range(start, start + 20):
+                    engine.add_document(doc_id, {"text": "shared term"})
+        done.set()
+
+    def reader():
+        while not done.is_set():
+            snapshot = state.snapshot()
+            postings = snapshot.index.get_postings("shared")
+            if len(postings) != snapshot.index.stats.total_docs:
+                errors.append("postings and stats disagree")
+            results = engine.search("shared", limit=1000)
+            if len(results) % 20:
+                errors.append("search saw a half-applied batch")
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=reader) for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert len(engine.search("shared", limit=1000)) == 400
+
+
+def test_every_published_generation_stays_intact():
+    state = IndexState()
+    snapshots = []
+    for doc_id in range(200):
+        state.add_document(doc_id, ["shared", f"own{doc_id}"], {"year": 2000 + doc_id})
+        snapshots.append(state.snapshot())
+
+    for count, snapshot in enumerate(snapshots, start=1):
+        index = snapshot.index
+        assert [d for d, _ in index.get_postings("shared")] == list(range(count))
+        assert index.doc_freqs["shared"] == count
+        assert len(index.documents) == len(index.stats.doc_lengths) == count
+        assert len(index.columns) == count
+        assert len(snapshot.doc_tokens) == count
+        assert count not in index.documents
+        assert snapshot.get_document_tokens(count) == []
+        assert index.get_postings(f"own{count}") == []
@@ -0,0 +1,70 @@
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.engine import SearchEngine
+from scout.search.topk import TopK
+
+
+def _engine():
+    records = [
+        {"id": i, "text": "storm " * (1 + i % 4), "source": ["abc", "bbc", "cnn"][i % 3],
+         "date": f"2020-01-{i + 1:02d}"}
+        for i in range(12)
+    ]
+    records.append({"id": 99, "text": "storm"})  # no date, no source
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_sort_by_date_descending_scores_only_the_page():
+    results = _engine().search("storm", limit=3, sort_by="-date")
+
+    assert [d for d, _ in results] == [11, 10, 9]
+    assert results.scored == 3
+    assert all(r.score > 0 for _, r in results)
+
+
+def test_sort_ascending_puts_missing_values_last():
+    results = _engine().search("storm", limit=20, sort_by="date")
+    assert [d for d, _ in results][:2] == [0, 1]
+    assert results[-1][0] == 99
+
+
+def test_collapse_keeps_best_hit_per_source():
+    engine = _engine()
+    ranked = engine.search("storm", limit=20)
+    collapsed = engine.search("storm", limit=20, collapse_on="source")
+
+    best_per_source = {}
+    for doc_id, result in ranked:
+        source = engine.index.get_document(doc_id).get("source", doc_id)
+        best_per_source.setdefault(source, (doc_id, result))
+
+    assert sorted(d for d, _ in collapsed) == sorted(d for d, _ in best_per_source.values())
+
+
+def test_sort_and_collapse_gives_newest_per_source():
+    results = _engine().search("storm", limit=10, sort_by="-date", collapse_on="source")
+    assert [d for d, _ in results] == [11, 10, 9, 99]
+
+
+def test_sort_requires_a_column():
+    with pytest.raises(ValueError):
+        _engine().search("storm", sort_by="missing_field")
+
+
+def test_topk_is_bounded():
+    from scout.ranking.base import RankingResult
+
+    top = TopK(2)
+    top.push_many([(i, RankingResult(score=float(i % 5), components={})) for i in range(100)])
+    assert [d for d, _ in top.results()] == [4, 9]
+    assert len(top._top) == 2
+
+
+def test_topk_bounds_ungrouped_hits_when_collapsing():
+    from scout.ranking.base import RankingResult
+
+    top = TopK(2, group_of=lambda ids: [i % 3 if i < 6 else None for i in ids])
+    top.push_many([(i, RankingResult(score=float(i), components={})) for i in range(100)])
+    assert [d for d, _ in top.results()] == [99, 98]
+    assert len(top._top) == 2 and len(top._best) == 3
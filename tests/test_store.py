@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from scout.index.inverted import InvertedIndex
+from scout.state import store
+from scout.state.signals import IndexState
+from scout.state.store import Store
+from scout.storage import paths
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    return tmp_path / "snapshots"
+
+
+def _state(n: int) -> IndexState:
+    state = IndexState()
+    state.add_documents((i, ["shared", f"t{i}"], {"n": i}) for i in range(n))
+    return state
+
+
+def test_base_then_delta_roundtrip(snapshot_dir):
+    state = _state(10)
+    Store.save(state.index, doc_tokens=state.snapshot().doc_tokens, wal_seq=1)
+
+    state.add_documents([(10, ["shared", "new"], {"n": 10})])
+    snap = state.snapshot()
+    Store.save(snap.index, doc_tokens=snap.doc_tokens, wal_seq=2)
+
+    manifest = Store.manifest()
+    assert manifest["kind"] == "delta"
+    assert manifest["chain"] == ["00000001-base", "00000002-delta"]
+    assert manifest["wal_seq"] == 2
+
+    loaded = Store.load()
+    assert loaded.to_dict() == state.index.to_dict()
+
+
+def test_full_save_without_tokens_starts_new_chain(snapshot_dir):
+    state = _state(4)
+    Store.save(state.index)
+    Store.save(state.index)
+
+    assert Store.manifest()["chain"] == ["00000002-base"]
+    assert sorted(p.name for p in snapshot_dir.iterdir()) == ["00000002-base", "CURRENT"]
+
+
+def test_long_chain_is_compacted(snapshot_dir, monkeypatch):
+    monkeypatch.setattr(store, "MAX_DELTAS", 2)
+    state = _state(10)
+    Store.save(state.index)
+    for i in range(10, 13):
+        state.add_document(i, ["shared"])
+        snap = state.snapshot()
+        Store.save(snap.index, doc_tokens=snap.doc_tokens)
+
+    assert Store.manifest()["chain"] == ["00000004-base"]
+    assert Store.load().to_dict() == state.index.to_dict()
+
+
+def test_unfinished_write_leaves_previous_snapshot(snapshot_dir):
+    state = _state(3)
+    Store.save(state.index)
+    (snapshot_dir / ".tmp-crashed").mkdir()
+
+    assert set(Store.load().documents) == {0, 1, 2}
+
+
+def test_newer_format_is_rejected(snapshot_dir):
+    Store.save(InvertedIndex())
+    manifest_path = snapshot_dir / "00000001-base" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["format_version"] = store.FORMAT_VERSION + 1
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError):
+        Store.load()
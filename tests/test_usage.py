@@ -0,0 +1,137 @@
+import pickle
+
+import pytest
+
+from scout.ranking.bm25 import BM25Ranking
+from scout.ranking.composite import CompositeRanking
+from scout.ranking.usage import UsageWeightedRanking
+from scout.search.engine import SearchEngine
+from scout.state import usage as usage_mod
+from scout.state.usage import UsageStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_counts_halve_every_half_life(clock):
+    usage = UsageStore(half_life_s=100.0, clock=clock)
+    usage.record_access(1)
+    usage.record_access(1)
+    usage.record_access(2, weight=3.0)
+
+    assert usage.access_counts([1, 2, 99]).tolist() == pytest.approx([2.0, 3.0, 0.0])
+
+    clock.now += 100.0
+    usage.record_access(1)
+    assert usage.access_counts([1, 2]).tolist() == pytest.approx([2.0, 1.5])
+    assert [doc for doc, _ in usage.top_documents(2)] == [1, 2]
+
+
+def test_rescaling_keeps_counts(monkeypatch, clock):
+    monkeypatch.setattr(usage_mod, "RESCALE_EXPONENT", 1.0)
+    usage = UsageStore(half_life_s=10.0, clock=clock)
+    for _ in range(50):
+        usage.record_access("a")
+        clock.now += 1.0
+
+    expected = sum(0.5 ** ((50 - i) / 10.0) for i in range(50))
+    assert usage.access_counts(["a"])[0] == pytest.approx(expected)
+    assert usage._epoch > 1_000_000.0
+
+
+def test_queries_are_normalized(clock):
+    usage = UsageStore(clock=clock)
+    usage.record_query("Python  Typing")
+    usage.record_query("python typing")
+    usage.record_query("rust")
+
+    assert usage.top_queries(1) == [("python typing", pytest.approx(2.0))]
+    assert usage.query_counts(["PYTHON typing"]).tolist() == pytest.approx([2.0])
+
+
+def test_save_and_load_round_trip(tmp_path, clock):
+    usage = UsageStore(half_life_s=50.0, clock=clock)
+    for i in range(2000):
+        usage.record_access(i % 1500)
+    usage.record_access("doc-x")
+    usage.record_query("fox")
+    usage.save(tmp_path / "usage.npz")
+
+    loaded = UsageStore.load(tmp_path / "usage.npz", clock=clock)
+    ids = [0, 1499, "doc-x", 1500]
+    assert loaded.access_counts(ids).tolist() == pytest.approx(usage.access_counts(ids).tolist())
+    assert loaded.top_queries() == usage.top_queries()
+    assert loaded.half_life_s == 50.0
+
+
+def test_background_autosave(tmp_path, clock):
+    path = tmp_path / "usage.npz"
+    usage = UsageStore(path=path, autosave_interval_s=0.01, clock=clock)
+    usage.record_access(7)
+    usage.close()
+
+    assert UsageStore.load(path, clock=clock).access_counts([7])[0] == pytest.approx(1.0)
+
+
+def test_copies_drop_the_autosave_thread(tmp_path, clock):
+    usage = UsageStore(path=tmp_path / "u.npz", autosave_interval_s=60.0)
+    usage.record_access(3)
+    copy = pickle.loads(pickle.dumps(usage))
+    usage.close(save=False)
+
+    assert copy.access_counts([3])[0] == pytest.approx(1.0, rel=1e-3)
+    assert copy._thread is None
+
+
+@pytest.fixture
+def engine():
+    records = [
+        {"id": 1, "text": "python packaging"},
+        {"id": 2, "text": "python packaging"},
+    ]
+    return SearchEngine.from_records(records, ranking=BM25Ranking())
+
+
+def test_clicks_reorder_tied_results(engine, clock):
+    usage = UsageStore(clock=clock)
+    engine.usage = usage
+    engine._ranking = CompositeRanking(
+        strategies=[BM25Ranking(), UsageWeightedRanking(usage)], weights=[1.0, 1.0]
+    )
+    assert [d for d, _ in engine.search("python")] == [1, 2]
+
+    engine.record_click(2)
+    hits = engine.search("python")
+    assert [d for d, _ in hits] == [2, 1]
+    assert hits[0][1].components["UsageWeightedRanking"] > 0
+    assert usage.top_queries() == [("python", pytest.approx(2.0))]
+
+
+def test_record_click_needs_a_usage_store(engine):
+    with pytest.raises(RuntimeError):
+        engine.record_click(1)
+
+
+def test_stale_and_excess_keys_are_pruned(monkeypatch, tmp_path, clock):
+    monkeypatch.setattr(usage_mod, "MAX_KEYS", 10)
+    usage = UsageStore(half_life_s=10.0, clock=clock)
+    for i in range(25):
+        usage.record_query(f"query {i}", weight=1.0 + i)
+    assert len(usage.queries) <= 10
+    assert usage.top_queries(1)[0][0] == "query 24"
+
+    clock.now += 1000.0
+    usage.record_query("fresh")
+    usage.save(tmp_path / "usage.npz")
+    assert [q for q, _ in usage.top_queries()] == ["fresh"]
+    assert [q for q, _ in UsageStore.load(tmp_path / "usage.npz", clock=clock).top_queries()] == ["fresh"]
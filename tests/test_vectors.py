@@ -0,0 +1,167 @@
+import random
+
+import numpy as np
+import pytest
+
+from scout.benchmarks.ann import ann_tradeoff
+from scout.index.columns import ColumnStore
+from scout.index.vectors import (
+    MIN_TRAIN_ROWS,
+    HashingEmbedder,
+    add_embeddings,
+    ann_index,
+    nearest,
+)
+from scout.ranking.bm25 import BM25Ranking
+from scout.search.dense import DenseRetriever
+from scout.search.engine import SearchEngine
+from scout.search.filters import Term
+from scout.search.fusion import ListFusion
+
+
+def test_embedder_places_related_texts_close():
+    embedder = HashingEmbedder(128)
+    a, b, c = embedder.embed_many(
+        ["indexing search engines", "search engine index", "chocolate cake recipe"]
+    )
+    assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-5)
+    assert a @ b > a @ c
+    assert np.array_equal(embedder.embed("same text"), HashingEmbedder(128).embed("same text"))
+
+
+def test_float_lists_become_normalized_vector_columns():
+    columns = ColumnStore()
+    columns.add(1, {"embedding": [3.0, 4.0], "year": 2020})
+    columns.add(2, {"embedding": np.array([0.0, 2.0], dtype=np.float32)})
+    columns.add(3, {"embedding": [1.0, 2.0, 3.0]})
+
+    assert columns.column("embedding") is None
+    vectors = columns.vector("embedding").values
+    assert vectors[0] == pytest.approx([0.6, 0.8])
+    assert vectors[1] == pytest.approx([0.0, 1.0])
+    assert np.isnan(vectors[2]).all()
+
+
+def random_column(rows, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = ColumnStore()
+    for i, row in enumerate(rng.normal(size=(rows, dim))):
+        columns.add(i, {"v": row})
+    return columns, rng
+
+
+def test_ivf_recall_against_exact_search():
+    columns, rng = random_column(2 * MIN_TRAIN_ROWS)
+    column = columns.vector("v")
+    recalls = []
+    for query in rng.normal(size=(20, 16)):
+        exact, scores = nearest(column, query, 10, exact=True)
+        assert list(scores) == sorted(scores, reverse=True)
+        approx, _ = nearest(column, query, 10, n_probe=16)
+        recalls.append(len(set(exact.tolist()) & set(approx.tolist())) / 10)
+        everything, _ = nearest(column, query, 10, n_probe=column.ann.n_lists)
+        assert list(everything) == list(exact)
+    assert np.mean(recalls) > 0.8
+
+
+def test_ann_follows_appends_and_overwrites():
+    columns, rng = random_column(MIN_TRAIN_ROWS)
+    column = columns.vector("v")
+    ann = ann_index(column)
+    assert ann is not None
+
+    query = rng.normal(size=16)
+    columns.add(MIN_TRAIN_ROWS, {"v": query})
+    ordinals, scores = nearest(column, query, 1, n_probe=1)
+    assert ordinals.tolist() == [MIN_TRAIN_ROWS]
+    assert scores[0] == pytest.approx(1.0, abs=1e-5)
+
+    columns.add(MIN_TRAIN_ROWS, {"v": -query})
+    assert column.ann is not ann
+    ordinals, _ = nearest(column, -query, 1, n_probe=1)
+    assert ordinals.tolist() == [MIN_TRAIN_ROWS]
+
+
+def test_forks_do_not_see_later_vectors():
+    columns, rng = random_column(MIN_TRAIN_ROWS)
+    ann_index(columns.vector("v"))
+    fork = columns.fork()
+    query = rng.normal(size=16)
+    columns.add(MIN_TRAIN_ROWS, {"v": query})
+
+    ordinals, _ = nearest(fork.vector("v"), query, 5, n_probe=64)
+    assert MIN_TRAIN_ROWS not in ordinals.tolist()
+
+
+TOPICS = {
+    "search": "index query ranking retrieval postings lexical",
+    "cooking": "recipe oven flour sugar butter baking",
+    "sailing": "boat wind harbor mast anchor tide",
+}
+
+
+@pytest.fixture(scope="module")
+def embedder():
+    return HashingEmbedder(64)
+
+
+@pytest.fixture(scope="module")
+def records(embedder):
+    rng = random.Random(3)
+    rows = []
+    for i in range(1500):
+        topic = list(TOPICS)[i % 3]
+        words = TOPICS[topic].split()
+        rows.append(
+            {"id": i, "text": " ".join(rng.choices(words, k=6)), "topic": topic, "year": 2000 + i % 20}
+        )
+    return add_embeddings(rows, embedder)
+
+
+def test_dense_retriever_finds_documents_without_query_terms(records, embedder):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    view = (engine.index, None)
+    dense = DenseRetriever(embedder)
+
+    # "baked" shares n-grams with "baking" but is not an indexed term.
+    assert not engine.search("baked", limit=5)
+    results = dense.retrieve(engine, "baked", view, limit=5)
+    assert len(results) == 5
+    assert {engine.index.get_document(d)["topic"] for d, _ in results} == {"cooking"}
+    assert all(r.components == {"cosine": r.score} for _, r in results)
+
+    filtered = dense.retrieve(
+        engine, "baked -flour", view, limit=5, filters=[Term("year", 2001)]
+    )
+    for doc_id, _ in filtered:
+        document = engine.index.get_document(doc_id)
+        assert document["year"] == 2001
+        assert "flour" not in document["text"].split()
+
+    exact = DenseRetriever(embedder, exact=True).retrieve(engine, "anchor tide", view, limit=10)
+    approx = DenseRetriever(embedder, n_probe=64).retrieve(engine, "anchor tide", view, limit=10)
+    assert [r.score for _, r in approx] == pytest.approx([r.score for _, r in exact])
+
+
+def test_hybrid_fusion_and_persistence(records, embedder, tmp_path):
+    engine = SearchEngine.from_records(records, ranking=BM25Ranking())
+    engine.fusion = ListFusion([BM25Ranking(), DenseRetriever(embedder)], depth=20)
+
+    results = engine.search("harbor OR sailed", limit=10, facets=["topic"])
+    assert set(results.stages) == {"BM25Ranking", "DenseRetriever", "fuse"}
+    assert all(engine.index.get_document(d)["topic"] == "sailing" for d, _ in results)
+    assert set(results.facets["topic"]) == {"sailing"}
+
+    path = str(tmp_path / "index.json")
+    engine.save(path)
+    loaded = SearchEngine.load(path, ranking=BM25Ranking())
+    column = loaded.index.columns.vector("embedding")
+    assert column is not None and column.ann is not None
+    assert np.array_equal(column.values, engine.index.columns.vector("embedding").values)
+    loaded.fusion = engine.fusion
+    assert [d for d, _ in loaded.search("harbor OR sailed", limit=10)] == [d for d, _ in results]
+
+    points = ann_tradeoff(loaded, ["harbor", "oven sugar"], DenseRetriever(embedder), n_probes=(64,))
+    assert [p.mode for p in points] == ["exact", "ivf@64"]
+    # Many documents share a text; near-tied scores may swap at the cut.
+    assert points[1].recall >= 0.9
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from scout.state.persistence import AutoSaver
+from scout.state.signals import IndexState
+from scout.state.wal import WriteAheadLog
+from scout.storage import paths
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    return tmp_path
+
+
+def test_append_and_replay(tmp_path):
+    wal = WriteAheadLog(tmp_path / "x.wal", fsync="always")
+    assert wal.append([(1, ["a"], {})]) == 1
+    assert wal.append([(2, ["b"], None)]) == 2
+    wal.close()
+
+    reopened = WriteAheadLog(tmp_path / "x.wal")
+    assert reopened.last_seq == 2
+    assert [e["seq"] for e in reopened.replay(after_seq=1)] == [2]
+    reopened.close()
+
+
+def test_replay_ignores_torn_tail(tmp_path):
+    path = tmp_path / "x.wal"
+    wal = WriteAheadLog(path)
+    wal.append([(1, ["a"], {})])
+    wal.close()
+    with path.open("ab") as f:
+        f.write(b'{"seq": 2, "docs": [[2, ["b"')
+
+    assert [e["seq"] for e in WriteAheadLog(path).replay()] == [1]
+
+
+def test_truncate_through_keeps_newer_batches(tmp_path):
+    wal = WriteAheadLog(tmp_path / "x.wal")
+    for doc_id in range(1, 4):
+        wal.append([(doc_id, ["t"], {})])
+    wal.truncate_through(2)
+    wal.append([(4, ["t"], {})])
+
+    assert [e["seq"] for e in wal.replay()] == [3, 4]
+    wal.close()
+
+
+def test_recover_replays_log_onto_checkpoint(data_dir):
+    wal_path = data_dir / "index.wal"
+    state = IndexState()
+    saver = AutoSaver(state, wal_path=wal_path, background=False)
+
+    state.add_document(1, ["hello", "world"], {"title": "one"})
+    saver.checkpoint()
+    state.add_documents([(2, ["hello"], None), (3, ["world"], {"title": "three"})])
+    saver.close(checkpoint=False)  # simulate a crash before the next checkpoint
+
+    recovered = AutoSaver.recover(wal_path)
+
+    assert set(recovered.index.documents) == {1, 2, 3}
+    assert recovered.index.get_document(3) == {"title": "three"}
+    assert recovered.index.doc_freqs["hello"] == 2
+    assert recovered.get_document_tokens(2) == ["hello"]
+
+
+def test_recover_after_restarting_from_a_checkpoint(data_dir):
+    wal_path = data_dir / "index.wal"
+    state = IndexState()
+    saver = AutoSaver(state, wal_path=wal_path, background=False)
+    state.add_document(1, ["hello"])
+    saver.close()  # checkpoint and truncate the log
+
+    state = AutoSaver.recover(wal_path)
+    saver = AutoSaver(state, wal_path=wal_path, background=False)
+    state.add_document(2, ["world"])
+    assert saver.wal.last_seq == 2
+    saver.close(checkpoint=False)  # crash before the next checkpoint
+
+    assert set(AutoSaver.recover(wal_path).index.documents) == {1, 2}
+
+
+def test_background_checkpoint_on_size_threshold(data_dir):
+    wal_path = data_dir / "index.wal"
+    state = IndexState()
+    saver = AutoSaver(state, wal_path=wal_path, checkpoint_bytes=1, checkpoint_interval_s=60)
+
+    state.add_document(1, ["hello"])
+    deadline = time.monotonic() + 5
+    while saver.wal.size and time.monotonic() < deadline:
+        time.sleep(0.01)
+    saver.close(checkpoint=False)
+
+    assert (paths.SNAPSHOT_DIR / "CURRENT").exists()
+    assert list(WriteAheadLog(wal_path).replay()) == []
+    assert set(AutoSaver.recover(wal_path).index.documents) == {1}